@@ -6,9 +6,14 @@ from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 import logging
+import time
 from typing import Dict, Any
 
 from utils.config import get_config
+from utils.cache import get_forecast_refresher
+from utils.forecast_store import get_forecast_store
+from models.registry import get_model_registry
+from utils.http_client import init_http_session, close_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -35,13 +40,14 @@ def create_app() -> FastAPI:
     )
     
     # Include routers
-    from api.routes import weather, soil, crops, predictions, dashboard
+    from api.routes import weather, soil, crops, predictions, dashboard, models
     
     app.include_router(weather.router, prefix="/api/v1/weather", tags=["Weather"])
     app.include_router(soil.router, prefix="/api/v1/soil", tags=["Soil Analysis"])
     app.include_router(crops.router, prefix="/api/v1/crops", tags=["Crop Recommendations"])
     app.include_router(predictions.router, prefix="/api/v1/predictions", tags=["Predictions"])
     app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["Dashboard"])
+    app.include_router(models.router, prefix="/api/v1/models", tags=["Models"])
     
     @app.get("/", response_class=HTMLResponse)
     async def root():
@@ -114,8 +120,22 @@ def create_app() -> FastAPI:
         """Application startup event"""
         logger.info("WeatherCrop AI Platform starting up...")
         
-        # Initialize any required services here
-        # For example: database connections, model loading, etc.
+        # Shared, pooled HTTP client for upstream weather sources
+        await init_http_session()
+        
+        # Open the shared forecast store and drop forecasts too old to serve
+        store = get_forecast_store()
+        if store is not None:
+            purged = store.purge_expired(grace=config.get_app_config().cache_stale_ttl)
+            logger.info(f"Forecast store at {store.path} ready ({purged} expired forecasts purged)")
+        
+        # Warm-load served models so no request pays the load cost
+        start = time.perf_counter()
+        loaded = await get_model_registry().load_all()
+        logger.info(
+            f"Model registry warm-loaded {sum(1 for m in loaded.values() if m)}/{len(loaded)} "
+            f"models in {time.perf_counter() - start:.2f}s"
+        )
         
         logger.info("WeatherCrop AI Platform startup complete")
     
@@ -124,7 +144,9 @@ def create_app() -> FastAPI:
         """Application shutdown event"""
         logger.info("WeatherCrop AI Platform shutting down...")
         
-        # Cleanup any resources here
+        # Stop background forecast refreshes, then close pooled upstream connections
+        await get_forecast_refresher().cancel_all()
+        await close_http_session()
         
         logger.info("WeatherCrop AI Platform shutdown complete")
     
@@ -8,6 +8,11 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
 
+from utils.cache import get_forecast_cache, get_forecast_flight, get_forecast_refresher
+from utils.circuit_breaker import circuit_breakers
+from utils.forecast_store import get_forecast_store
+from models.registry import get_model_registry
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -42,6 +47,14 @@ async def get_system_status():
                     "query_performance": "Good",
                     "last_backup": "2024-01-15T02:00:00Z"
                 },
+                "forecast_cache": get_forecast_cache().stats(),
+                "forecast_store": get_forecast_store().stats() if get_forecast_store() else None,
+                "forecast_fetch_coalescing": get_forecast_flight().stats(),
+                "forecast_background_refresh": get_forecast_refresher().stats(),
+                "upstream_circuit_breakers": {
+                    name: breaker.stats() for name, breaker in circuit_breakers.items()
+                },
+                "model_registry": get_model_registry().list_models(),
                 "ml_models": {
                     "rainfall_prediction": {
                         "status": "Active",
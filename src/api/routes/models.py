@@ -0,0 +1,59 @@
+"""
+Model registry API routes for listing and hot-swapping served models
+"""
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+import logging
+
+from models.registry import MODEL_LOADERS, get_model_registry
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+class ModelReloadRequest(BaseModel):
+    """Request model for reloading a served model"""
+    version: Optional[str] = None  # None: configured version ("latest" by default)
+
+@router.get("/")
+async def list_models():
+    """
+    List served models with their loaded and available versions
+
+    Returns:
+        Registry contents per model
+    """
+    return {"models": get_model_registry().list_models()}
+
+@router.post("/{model_name}/reload")
+async def reload_model(model_name: str, request: ModelReloadRequest = ModelReloadRequest()):
+    """
+    Load a model version and swap it in without a restart
+
+    Requests already running keep the version they started with; new requests
+    use the new version once it is fully loaded.
+
+    Args:
+        model_name: Registered model name
+        request: Optional version to load
+
+    Returns:
+        The newly served version
+    """
+    if model_name not in MODEL_LOADERS:
+        raise HTTPException(status_code=404, detail=f"Unknown model '{model_name}'")
+
+    try:
+        loaded = await get_model_registry().load(model_name, request.version)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error reloading model {model_name}: {e}")
+        raise HTTPException(status_code=500, detail=f"Model reload failed: {str(e)}")
+
+    if loaded is None:
+        raise HTTPException(status_code=404, detail=f"No saved versions of '{model_name}'")
+
+    return {"status": "reloaded", "model": loaded.info()}
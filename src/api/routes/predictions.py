@@ -69,11 +69,12 @@ async def assess_flood_risk(request: FloodRiskRequest):
         logger.info(f"Enhanced flood risk assessment requested for {request.location.latitude}, {request.location.longitude}")
 
         # Get enhanced rainfall predictions for the assessment period
-        from .weather import get_enhanced_weather_data
+        from .weather import get_enhanced_weather_data, precipitation_projection
 
         weather_data = await get_enhanced_weather_data(
             request.location.latitude,
-            request.location.longitude
+            request.location.longitude,
+            precipitation_projection(request.assessment_period_days)
         )
 
         # Extract rainfall predictions
@@ -4,76 +4,490 @@ Weather API routes for rainfall prediction and weather data
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet, Callable, Awaitable
 from datetime import datetime, date, timedelta
 import logging
 import aiohttp
 import asyncio
+import functools
 import random
+import numpy as np
+
+from data_processing.forecast_fusion import fuse_daily_forecasts
+from data_processing.historical_store import get_historical_store
+from models.registry import LoadedModel, get_model_registry
+from data_processing.rainfall_postprocessing import (
+    BASIC_INTENSITY_EDGES, BASIC_INTENSITY_LABELS, classify_intensity, ensemble_rainfall,
+    months_of, rain_probability
+)
+from utils.cache import get_forecast_cache, get_forecast_flight, get_forecast_refresher
+from utils.circuit_breaker import CircuitOpenError, get_circuit_breaker, hedged_call
+from utils.forecast_store import get_forecast_store
+from utils.config import get_config
+from utils.http_client import get_http_session
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Open-Meteo variables available to consumers
+HOURLY_VARIABLES = frozenset({
+    'temperature_2m', 'relative_humidity_2m', 'precipitation', 'wind_speed_10m',
+    'wind_direction_10m', 'pressure_msl', 'cloud_cover', 'visibility', 'uv_index'
+})
+DAILY_VARIABLES = frozenset({
+    'precipitation_sum', 'temperature_2m_max', 'temperature_2m_min',
+    'precipitation_probability_max', 'wind_speed_10m_max', 'wind_direction_10m_dominant'
+})
+MAX_FORECAST_DAYS = 16
+
+# /historical-data parameter names and their stored columns
+HISTORICAL_PARAMETERS = {
+    'rainfall': 'rainfall_mm',
+    'temperature': 'temperature_celsius',
+    'humidity': 'humidity_percent',
+    'wind_speed': 'wind_speed_kmh',
+    'pressure': 'pressure_hpa'
+}
+
+@dataclass(frozen=True)
+class ForecastProjection:
+    """Open-Meteo variables and horizon a consumer needs from a forecast"""
+    hourly: FrozenSet[str] = frozenset()
+    daily: FrozenSet[str] = frozenset()
+    forecast_days: int = MAX_FORECAST_DAYS
+    forecast_hours: Optional[int] = None  # None: hourly data for all forecast_days
+    current_weather: bool = False
+
+    def covers(self, other: "ForecastProjection") -> bool:
+        """Whether data fetched for this projection also satisfies other"""
+        if other.hourly and self.forecast_hours is not None:
+            if other.forecast_hours is None or other.forecast_hours > self.forecast_hours:
+                return False
+        return (
+            self.hourly >= other.hourly
+            and self.daily >= other.daily
+            and self.forecast_days >= other.forecast_days
+            and (self.current_weather or not other.current_weather)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (for the persistent forecast store)"""
+        return {
+            'hourly': sorted(self.hourly),
+            'daily': sorted(self.daily),
+            'forecast_days': self.forecast_days,
+            'forecast_hours': self.forecast_hours,
+            'current_weather': self.current_weather
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ForecastProjection":
+        """Inverse of to_dict"""
+        return cls(
+            hourly=frozenset(data.get('hourly', [])),
+            daily=frozenset(data.get('daily', [])),
+            forecast_days=data.get('forecast_days', MAX_FORECAST_DAYS),
+            forecast_hours=data.get('forecast_hours'),
+            current_weather=data.get('current_weather', False)
+        )
+
+    def merge(self, other: "ForecastProjection") -> "ForecastProjection":
+        """Smallest projection covering both self and other"""
+        hour_limits = [p.forecast_hours for p in (self, other) if p.hourly]
+        return ForecastProjection(
+            hourly=self.hourly | other.hourly,
+            daily=self.daily | other.daily,
+            forecast_days=max(self.forecast_days, other.forecast_days),
+            forecast_hours=None if not hour_limits or None in hour_limits else max(hour_limits),
+            current_weather=self.current_weather or other.current_weather
+        )
+
+# Everything the platform requests from Open-Meteo
+FULL_PROJECTION = ForecastProjection(
+    hourly=HOURLY_VARIABLES, daily=DAILY_VARIABLES, current_weather=True
+)
+
+# /current-conditions reads the current observation and hour 0 only
+CURRENT_CONDITIONS_PROJECTION = ForecastProjection(
+    hourly=frozenset({'relative_humidity_2m', 'pressure_msl', 'precipitation'}),
+    forecast_days=1,
+    forecast_hours=1,
+    current_weather=True
+)
+
+def rainfall_projection(days: int) -> ForecastProjection:
+    """Daily rainfall and temperature variables for a forecast horizon"""
+    return ForecastProjection(
+        daily=frozenset({
+            'precipitation_sum', 'temperature_2m_max', 'temperature_2m_min',
+            'precipitation_probability_max'
+        }),
+        forecast_days=min(MAX_FORECAST_DAYS, max(1, days))
+    )
+
+def precipitation_projection(days: int) -> ForecastProjection:
+    """Daily precipitation totals only, for a forecast horizon"""
+    return ForecastProjection(
+        daily=frozenset({'precipitation_sum'}),
+        forecast_days=min(MAX_FORECAST_DAYS, max(1, days))
+    )
+
 # Enhanced weather API functions with multiple data sources
-async def get_enhanced_weather_data(lat: float, lon: float) -> Dict:
-    """Get enhanced weather data from multiple sources for better accuracy"""
-    try:
-        # Primary source: Open-Meteo API (free, no API key required)
-        open_meteo_data = await get_open_meteo_data(lat, lon)
+async def get_enhanced_weather_data(lat: float, lon: float,
+                                    projection: ForecastProjection = FULL_PROJECTION) -> Dict:
+    """
+    Get enhanced weather data for a location, served from the grid-cell cache
+
+    Coordinates are snapped to the configured grid cell; the combined forecast
+    for the cell is fetched once per cache TTL and shared by every location in it.
+    Concurrent misses for the same cell wait on a single upstream fetch, and an
+    expired forecast of a hot cell is served while it is refreshed in the background.
 
-        # Secondary source: IMD data (for India-specific accuracy)
-        imd_data = await get_imd_data(lat, lon)
+    Args:
+        lat: Latitude coordinate
+        lon: Longitude coordinate
+        projection: Variables and horizon the caller needs; a cached forecast
+            is reused when its projection covers this one
+    """
+    cache = get_forecast_cache()
+    cell = cache.grid_key(lat, lon)
+
+    cached, is_stale = cache.lookup(cell, accept=lambda entry: entry[0].covers(projection))
+    if cached is not None:
+        cached_projection, weather_data = cached
+        if is_stale:
+            _schedule_refresh(cell, cached_projection)
+        return weather_data
+
+    # Widen the fetch to what is already cached for the cell, so consumers
+    # with different projections share one entry instead of replacing it
+    previous = cache.peek(cell)
+    if previous is not None:
+        projection = projection.merge(previous[0])
+
+    return await get_forecast_flight().do(
+        (cell, projection), lambda: _fetch_and_cache_cell(cell, projection)
+    )
+
+async def get_enhanced_weather_data_batch(locations: List[Tuple[float, float]],
+                                          projection: ForecastProjection = FULL_PROJECTION) -> List[Dict]:
+    """
+    Get enhanced weather data for many locations, one fetch per distinct grid cell
 
-        # Tertiary source: NASA POWER data (for satellite-based data)
-        nasa_data = await get_nasa_power_data(lat, lon)
+    Cached cells are served as in get_enhanced_weather_data; Open-Meteo data for
+    the remaining cells is fetched with multi-coordinate requests. Other remote
+    sources have no multi-location API, so they are left out of batch-fetched
+    cells rather than called once per cell; local sources still contribute.
 
-        # Combine and weight the data sources
-        combined_data = combine_weather_sources(open_meteo_data, imd_data, nasa_data)
+    Args:
+        locations: (latitude, longitude) pairs
+        projection: Variables and horizon the caller needs
+
+    Returns:
+        Combined forecasts in the same order as locations
+    """
+    cache = get_forecast_cache()
+    cells = [cache.grid_key(lat, lon) for lat, lon in locations]
+
+    # Deduplicate by grid cell, keeping first-seen order
+    unique_cells = list(dict.fromkeys(cells))
+
+    cell_data = {}
+    missed_cells = []
+    for cell in unique_cells:
+        cached, is_stale = cache.lookup(cell, accept=lambda entry: entry[0].covers(projection))
+        if cached is not None:
+            cached_projection, weather_data = cached
+            if is_stale:
+                _schedule_refresh(cell, cached_projection)
+            cell_data[cell] = weather_data
+        else:
+            missed_cells.append(cell)
+
+    if missed_cells:
+        # Cells another worker (or a previous run) already fetched
+        persisted = await _load_persisted_cells(missed_cells, projection)
+        cell_data.update(persisted)
+        missed_cells = [cell for cell in missed_cells if cell not in persisted]
+
+    if missed_cells:
+        # One projection for the whole multi-coordinate request
+        for cell in missed_cells:
+            previous = cache.peek(cell)
+            if previous is not None:
+                projection = projection.merge(previous[0])
+
+        open_meteo_results = await get_open_meteo_data_batch(missed_cells, projection)
+        fetched = await asyncio.gather(*[
+            get_forecast_flight().do(
+                (cell, projection),
+                lambda cell=cell, data=data: _fetch_and_cache_cell(cell, projection, {'Open-Meteo': data})
+            )
+            for cell, data in zip(missed_cells, open_meteo_results)
+        ])
+        cell_data.update(zip(missed_cells, fetched))
+
+    return [cell_data[cell] for cell in cells]
+
+def _schedule_refresh(cell: Tuple[float, float], projection: ForecastProjection):
+    """Refresh a stale cell in the background, coalesced with foreground fetches"""
+    get_forecast_refresher().schedule(
+        cell,
+        lambda: get_forecast_flight().do((cell, projection), lambda: _fetch_and_cache_cell(cell, projection))
+    )
+
+async def _fetch_and_cache_cell(cell: Tuple[float, float], projection: ForecastProjection,
+                                prefetched: Optional[Dict[str, Optional[Dict]]] = None) -> Dict:
+    """Fetch the combined forecast for a grid cell and store it in the cache"""
+    if prefetched is None:
+        persisted = await _load_persisted_cells([cell], projection)
+        if cell in persisted:
+            return persisted[cell]
+
+    weather_data = await fetch_enhanced_weather_data(*cell, projection=projection, prefetched=prefetched)
+
+    # Only cache combined forecasts that carry the primary source
+    if weather_data and 'Open-Meteo' in weather_data.get('data_sources', []):
+        get_forecast_cache().set(cell, (projection, weather_data))
+        store = get_forecast_store()
+        if store is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(store.set, cell, projection.to_dict(), weather_data,
+                                        covers=_projection_dict_covers)
+            )
+
+    return weather_data
+
+def _projection_dict_covers(new: Dict[str, Any], stored: Dict[str, Any]) -> bool:
+    """Whether a projection dict covers a stored one (ForecastStore.set predicate)"""
+    return ForecastProjection.from_dict(new).covers(ForecastProjection.from_dict(stored))
+
+async def _load_persisted_cells(cells: List[Tuple[float, float]],
+                                projection: ForecastProjection) -> Dict[Tuple[float, float], Dict]:
+    """
+    Serve grid cells from the persistent forecast store
+
+    Fresh stored forecasts covering the projection are copied into the
+    in-process cache for the rest of their lifetime.
+
+    Returns:
+        Combined forecast per cell found in the store
+    """
+    store = get_forecast_store()
+    if store is None or not cells:
+        return {}
+
+    stored = await asyncio.get_running_loop().run_in_executor(None, store.get_many, cells)
+
+    cache = get_forecast_cache()
+    loaded = {}
+    for cell, (projection_data, weather_data, ttl) in stored.items():
+        stored_projection = ForecastProjection.from_dict(projection_data)
+        if stored_projection.covers(projection):
+            cache.set(cell, (stored_projection, weather_data), ttl=ttl)
+            loaded[cell] = weather_data
+    return loaded
+
+async def fetch_enhanced_weather_data(lat: float, lon: float,
+                                      projection: ForecastProjection = FULL_PROJECTION,
+                                      prefetched: Optional[Dict[str, Optional[Dict]]] = None) -> Dict:
+    """
+    Get enhanced weather data from multiple sources for better accuracy
+
+    Args:
+        lat: Latitude coordinate
+        lon: Longitude coordinate
+        projection: Variables and horizon to request
+        prefetched: Source payloads already fetched by a batch request; these
+            sources are not fetched again (a None payload counts as missing),
+            and remote sources missing from it are skipped, since calling them
+            per location would undo the batching
+    """
+    try:
+        config = get_config()
+        deadline = config.get('weather_sources.request_deadline', 10)
+        batched = prefetched is not None
+        prefetched = prefetched or {}
+
+        # Fetch all enabled sources concurrently, each under its own timeout:
+        # Open-Meteo (primary), IMD (India-specific) and NASA POWER (satellite)
+        tasks = {}
+        for name, source in WEATHER_SOURCES.items():
+            if name in prefetched or not source_enabled(source) or (batched and source.remote):
+                continue
+            timeout = config.get(f'weather_sources.{source.config_key}.timeout', deadline)
+            tasks[name] = asyncio.ensure_future(_call_source(source, lat, lon, projection, timeout))
+
+        done, pending = set(), set()
+        if tasks:
+            done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+
+        results = {name: data for name, data in prefetched.items() if data}
+        missing_sources = [name for name, data in prefetched.items() if not data]
+        for name, task in tasks.items():
+            if task in done and not task.cancelled() and task.exception() is None and task.result():
+                results[name] = task.result()
+            else:
+                missing_sources.append(name)
+
+        if missing_sources:
+            logger.warning(f"Weather sources missing for {lat}, {lon}: {missing_sources}")
+
+        # Combine and weight whichever sources arrived in time
+        combined_data = combine_weather_sources(results, missing_sources=missing_sources)
 
         return combined_data
 
     except Exception as e:
         logger.error(f"Error getting enhanced weather data: {e}")
-        # Fallback to single source
-        return await get_open_meteo_data(lat, lon)
+        # Fallback to the primary source alone, still through its breaker
+        source = WEATHER_SOURCES[PRIMARY_SOURCE]
+        timeout = get_config().get(f'weather_sources.{source.config_key}.timeout', 10)
+        try:
+            return await _call_source(source, lat, lon, projection, timeout)
+        except CircuitOpenError:
+            return None
+        except Exception as fallback_error:
+            logger.error(f"Fallback fetch from {PRIMARY_SOURCE} failed: {fallback_error}")
+            return None
+
+async def _call_source(source: "WeatherSource", lat: float, lon: float,
+                       projection: ForecastProjection, timeout: float) -> Optional[Dict]:
+    """
+    Fetch one source through its circuit breaker
+
+    With weather_sources.<source>.hedge enabled, a second request is started
+    when the first exceeds the source's recent p95 latency.
+    """
+    config = get_config()
+    breaker = get_circuit_breaker(source.name)
+
+    hedge_after = None
+    if config.get(f'weather_sources.{source.config_key}.hedge', False):
+        hedge_after = breaker.latency_percentile(
+            95, min_samples=config.get(f'weather_sources.{source.config_key}.hedge_min_samples', 5)
+        )
 
-async def get_open_meteo_data(lat: float, lon: float) -> Dict:
+    return await breaker.call(lambda: hedged_call(
+        lambda: asyncio.wait_for(source.fetcher(lat, lon, projection), timeout=timeout),
+        hedge_after
+    ))
+
+def _source_url(config_key: str, default: str) -> str:
+    """Upstream base URL, overridable per source (e.g. to point at a local stub server)"""
+    return get_config().get(f'weather_sources.{config_key}.base_url', default)
+
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+NASA_POWER_URL = "https://power.larc.nasa.gov/api/temporal/daily/point"
+
+def _open_meteo_params(latitude: str, longitude: str,
+                       projection: ForecastProjection = FULL_PROJECTION) -> Dict[str, Any]:
+    """Open-Meteo query parameters; coordinates may be comma-separated lists"""
+    params = {
+        'latitude': latitude,
+        'longitude': longitude,
+        'timezone': 'Asia/Kolkata',
+        'forecast_days': projection.forecast_days,
+        'models': 'best_match'  # Use best available model
+    }
+    if projection.current_weather:
+        params['current_weather'] = 'true'
+    if projection.hourly:
+        params['hourly'] = ','.join(sorted(projection.hourly))
+        if projection.forecast_hours is not None:
+            params['forecast_hours'] = projection.forecast_hours
+    if projection.daily:
+        params['daily'] = ','.join(sorted(projection.daily))
+    return params
+
+async def get_open_meteo_data(lat: float, lon: float,
+                              projection: ForecastProjection = FULL_PROJECTION) -> Dict:
     """Get weather data from Open-Meteo API (free, no API key required)"""
     try:
-        url = "https://api.open-meteo.com/v1/forecast"
-        params = {
-            'latitude': lat,
-            'longitude': lon,
-            'current_weather': 'true',
-            'hourly': 'temperature_2m,relative_humidity_2m,precipitation,wind_speed_10m,wind_direction_10m,pressure_msl,cloud_cover,visibility,uv_index',
-            'daily': 'precipitation_sum,temperature_2m_max,temperature_2m_min,precipitation_probability_max,wind_speed_10m_max,wind_direction_10m_dominant',
-            'timezone': 'Asia/Kolkata',
-            'forecast_days': 16,
-            'models': 'best_match'  # Use best available model
-        }
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Successfully fetched weather data for {lat}, {lon}")
-                    return data
-                else:
-                    logger.error(f"Weather API error: {response.status}")
-                    return None
+        params = _open_meteo_params(str(lat), str(lon), projection)
+
+        session = get_http_session()
+        async with session.get(_source_url('open_meteo', OPEN_METEO_URL), params=params) as response:
+            if response.status == 200:
+                data = await response.json()
+                logger.info(f"Successfully fetched weather data for {lat}, {lon}")
+                return data
+            else:
+                logger.error(f"Weather API error: {response.status}")
+                return None
     except Exception as e:
         logger.error(f"Error fetching weather data: {e}")
         return None
 
-async def get_imd_data(lat: float, lon: float) -> Dict:
-    """Get weather data from India Meteorological Department (IMD)"""
+async def get_open_meteo_data_batch(coordinates: List[Tuple[float, float]],
+                                    projection: ForecastProjection = FULL_PROJECTION) -> List[Optional[Dict]]:
+    """
+    Get Open-Meteo data for many coordinates using multi-location requests
+
+    Args:
+        coordinates: (latitude, longitude) pairs
+        projection: Variables and horizon to request
+
+    Returns:
+        One payload per coordinate, None where the request failed
+    """
+    config = get_config()
+    batch_size = config.get('weather_sources.open_meteo.batch_size', 100)
+    timeout = config.get('weather_sources.open_meteo.timeout', 10)
+
+    breaker = get_circuit_breaker(PRIMARY_SOURCE)
+    url = _source_url('open_meteo', OPEN_METEO_URL)
+
+    async def request_chunk(chunk: List[Tuple[float, float]]) -> Optional[List[Dict]]:
+        params = _open_meteo_params(
+            ','.join(str(lat) for lat, _ in chunk),
+            ','.join(str(lon) for _, lon in chunk),
+            projection
+        )
+        session = get_http_session()
+        async with session.get(url, params=params,
+                               timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status != 200:
+                logger.error(f"Weather API batch error: {response.status}")
+                return None
+            data = await response.json()
+
+        # A single location comes back as an object, several as a list
+        if isinstance(data, dict):
+            data = [data]
+        return data if len(data) == len(chunk) else None
+
+    async def fetch_chunk(chunk: List[Tuple[float, float]]) -> List[Optional[Dict]]:
+        try:
+            data = await breaker.call(lambda: request_chunk(chunk))
+            if data is not None:
+                logger.info(f"Successfully fetched weather data for {len(chunk)} locations")
+                return data
+        except CircuitOpenError:
+            logger.warning(f"Open-Meteo circuit open; skipping batch of {len(chunk)} locations")
+        except Exception as e:
+            logger.error(f"Error fetching batch weather data: {e}")
+        return [None] * len(chunk)
+
+    chunks = [coordinates[i:i + batch_size] for i in range(0, len(coordinates), batch_size)]
+    chunk_results = await asyncio.gather(*[fetch_chunk(chunk) for chunk in chunks])
+
+    return [data for chunk_data in chunk_results for data in chunk_data]
+
+async def get_imd_data(lat: float, lon: float,
+                       projection: ForecastProjection = FULL_PROJECTION) -> Dict:
+    """Get weather data from India Meteorological Department (IMD) for the projection's horizon"""
     try:
         # IMD API endpoint (this is a placeholder - actual IMD API requires registration)
         # For now, we'll use a mock implementation that simulates IMD data patterns
 
         # IMD provides more accurate data for Indian locations
-        # This would integrate with actual IMD APIs when available
+        # This would integrate with actual IMD APIs when available, fetched
+        # through the shared client from get_http_session()
 
         # Generate IMD-style data with Indian weather patterns
         imd_data = {
@@ -88,7 +502,7 @@ async def get_imd_data(lat: float, lon: float) -> Dict:
         }
 
         # Add realistic Indian weather patterns
-        for i in range(16):
+        for i in range(projection.forecast_days):
             date = datetime.now() + timedelta(days=i)
 
             # Monsoon-aware rainfall prediction
@@ -110,13 +524,20 @@ async def get_imd_data(lat: float, lon: float) -> Dict:
         logger.error(f"Error getting IMD data: {e}")
         return None
 
-async def get_nasa_power_data(lat: float, lon: float) -> Dict:
-    """Get weather data from NASA POWER API (free, satellite-based)"""
+async def get_nasa_power_data(lat: float, lon: float,
+                              projection: ForecastProjection = FULL_PROJECTION) -> Dict:
+    """
+    Get weather data from NASA POWER API (free, satellite-based)
+
+    NASA POWER supplies the recent 30-day trend, so the projection does not narrow it.
+    Those dates never overlap a forecast, so the source is disabled for fusion by
+    default (weather_sources.nasa_power.enabled).
+    """
     try:
         # NASA POWER API for satellite-based weather data
         # This provides global coverage with good accuracy
 
-        base_url = "https://power.larc.nasa.gov/api/temporal/daily/point"
+        base_url = _source_url('nasa_power', NASA_POWER_URL)
 
         # Get last 30 days for trend analysis
         end_date = datetime.now().strftime('%Y%m%d')
@@ -132,8 +553,13 @@ async def get_nasa_power_data(lat: float, lon: float) -> Dict:
             'format': 'JSON'
         }
 
-        # For now, return mock NASA POWER data structure
-        # In production, this would make actual API calls
+        session = get_http_session()
+        async with session.get(base_url, params=params) as response:
+            if response.status != 200:
+                logger.error(f"NASA POWER API error: {response.status}")
+                return None
+            data = await response.json(content_type=None)
+
         nasa_data = {
             'source': 'NASA_POWER',
             'accuracy_weight': 0.3,
@@ -142,87 +568,168 @@ async def get_nasa_power_data(lat: float, lon: float) -> Dict:
             'forecast_adjustment': 1.0
         }
 
+        # NASA POWER reports missing values as -999, in any parameter
+        parameters = data.get('properties', {}).get('parameter', {})
+
+        def value(parameter: str, day: str) -> Optional[float]:
+            reading = parameters.get(parameter, {}).get(day)
+            return None if reading is None or reading <= -999 else reading
+
+        for day in sorted(parameters.get('PRECTOTCORR', {})):
+            rainfall_mm = value('PRECTOTCORR', day)
+            if rainfall_mm is None:
+                continue
+            nasa_data['historical_trend'].append({
+                'date': datetime.strptime(day, '%Y%m%d').date().isoformat(),
+                'rainfall_mm': rainfall_mm,
+                'temperature_max': value('T2M_MAX', day),
+                'temperature_min': value('T2M_MIN', day),
+                'humidity': value('RH2M', day)
+            })
+
         return nasa_data
 
     except Exception as e:
         logger.error(f"Error getting NASA POWER data: {e}")
         return None
 
-def combine_weather_sources(open_meteo_data: Dict, imd_data: Dict, nasa_data: Dict) -> Dict:
-    """Combine multiple weather data sources with weighted averaging"""
+@dataclass
+class WeatherSource:
+    """Upstream weather source used for fetching and forecast fusion"""
+    name: str
+    config_key: str
+    fetcher: Callable[..., Awaitable[Optional[Dict]]]
+    extract_daily: Callable[[Dict], Dict[str, list]]  # payload -> 'date' + FUSED_VARIABLES lists
+    weight: float  # default fusion weight, overridable via weather_sources.<config_key>.weight
+    enabled: bool = True  # fetched and fused by default, overridable via weather_sources.<config_key>.enabled
+    remote: bool = True  # fetching calls an upstream service (skipped per cell in batch fetches)
+
+# Registry of upstream sources, in fetch and reporting order
+WEATHER_SOURCES: Dict[str, WeatherSource] = {}
+
+# Source whose daily dates define the combined forecast horizon
+PRIMARY_SOURCE = 'Open-Meteo'
+
+def register_weather_source(source: WeatherSource):
+    """Register an upstream source for get_enhanced_weather_data and combine_weather_sources"""
+    WEATHER_SOURCES[source.name] = source
+
+def source_enabled(source: WeatherSource) -> bool:
+    """Whether a source is fetched and fused, from config or the registered default"""
+    return bool(get_config().get(f'weather_sources.{source.config_key}.enabled', source.enabled))
+
+def get_source_weight(source: WeatherSource) -> float:
+    """Fusion weight for a source, from config or the registered default"""
+    return get_config().get(f'weather_sources.{source.config_key}.weight', source.weight)
+
+def _open_meteo_daily(data: Dict) -> Dict[str, list]:
+    daily = data.get('daily', {})
+    return {
+        'date': daily.get('time', []),
+        'rainfall_mm': daily.get('precipitation_sum', []),
+        'temperature_max': daily.get('temperature_2m_max', []),
+        'temperature_min': daily.get('temperature_2m_min', [])
+    }
+
+def _records_daily(records: List[Dict]) -> Dict[str, list]:
+    return {
+        'date': [record['date'] for record in records],
+        'rainfall_mm': [record.get('rainfall_mm') for record in records],
+        'temperature_max': [record.get('temperature_max') for record in records],
+        'temperature_min': [record.get('temperature_min') for record in records]
+    }
+
+register_weather_source(WeatherSource(
+    name='Open-Meteo', config_key='open_meteo', fetcher=get_open_meteo_data,
+    extract_daily=_open_meteo_daily, weight=0.5
+))
+register_weather_source(WeatherSource(
+    name='IMD', config_key='imd', fetcher=get_imd_data,
+    extract_daily=lambda data: _records_daily(data.get('daily_forecast', [])), weight=0.4,
+    remote=False  # local simulation until the IMD API is integrated
+))
+register_weather_source(WeatherSource(
+    name='NASA_POWER', config_key='nasa_power', fetcher=get_nasa_power_data,
+    extract_daily=lambda data: _records_daily(data.get('historical_trend', [])), weight=0.3,
+    enabled=False  # past observations only; nothing to fuse into forecast dates
+))
+
+def combine_weather_sources(source_data: Dict[str, Optional[Dict]],
+                            missing_sources: Optional[List[str]] = None) -> Dict:
+    """
+    Combine multiple weather data sources with weighted averaging
+
+    All available sources are aligned by date and fused in one vectorized pass;
+    days a source does not cover are masked out of its weight.
+
+    Args:
+        source_data: Payload per registered source name (None if unavailable)
+        missing_sources: Sources that failed or missed their deadline
+
+    Returns:
+        Combined forecast; 'partial' is set when any source is missing
+    """
     try:
         combined = {
-            'primary_source': 'Open-Meteo',
+            'primary_source': PRIMARY_SOURCE,
             'data_sources': [],
+            'missing_sources': list(missing_sources or []),
+            'partial': bool(missing_sources),
             'accuracy_score': 0.0,
             'daily_forecast': []
         }
 
         # Weight the sources based on availability and reliability
-        sources = []
-        if open_meteo_data:
-            sources.append(('Open-Meteo', open_meteo_data, 0.5))
-            combined['data_sources'].append('Open-Meteo')
-        if imd_data:
-            sources.append(('IMD', imd_data, 0.4))
-            combined['data_sources'].append('IMD')
-        if nasa_data:
-            sources.append(('NASA_POWER', nasa_data, 0.3))
-            combined['data_sources'].append('NASA_POWER')
-
-        # Calculate weighted accuracy
-        total_weight = sum(weight for _, _, weight in sources)
-        if total_weight > 0:
-            combined['accuracy_score'] = min(0.95, 0.7 + (len(sources) * 0.08))
-
-        # Combine forecasts using ensemble method
-        if open_meteo_data and 'daily' in open_meteo_data:
-            daily_data = open_meteo_data['daily']
-            dates = daily_data.get('time', [])
-
-            for i, date in enumerate(dates[:16]):  # Limit to 16 days
-                combined_forecast = {
+        available = [
+            (source, source_data[name]) for name, source in WEATHER_SOURCES.items()
+            if source_data.get(name) and source_enabled(source)
+        ]
+        combined['data_sources'] = [source.name for source, _ in available]
+
+        # Carry through the current observation and hourly series for consumers
+        # that read them directly (e.g. /current-conditions)
+        primary_data = source_data.get(PRIMARY_SOURCE)
+        if primary_data:
+            for key in ('current_weather', 'hourly'):
+                if key in primary_data:
+                    combined[key] = primary_data[key]
+
+        if available:
+            combined['accuracy_score'] = min(0.95, 0.7 + (len(available) * 0.08))
+
+        # Fuse daily forecasts on the primary source's horizon
+        if primary_data and 'daily' in primary_data:
+            dates = primary_data['daily'].get('time', [])[:MAX_FORECAST_DAYS]
+            fused = fuse_daily_forecasts(
+                dates,
+                [(get_source_weight(source), source.extract_daily(data)) for source, data in available]
+            )
+
+            total_weight = fused['total_weight']
+            confidence = np.where(total_weight > 0, np.minimum(0.95, 0.75 + (total_weight - 0.5) * 0.2), 0.0)
+
+            combined['daily_forecast'] = [
+                {
                     'date': date,
-                    'rainfall_mm': 0.0,
-                    'temperature_max': 0.0,
-                    'temperature_min': 0.0,
-                    'confidence': 0.0
+                    'rainfall_mm': rainfall,
+                    'temperature_max': temperature_max,
+                    'temperature_min': temperature_min,
+                    'confidence': day_confidence
                 }
-
-                # Weighted average of available sources
-                total_weight = 0
-
-                # Open-Meteo data
-                if i < len(daily_data.get('precipitation_sum', [])):
-                    weight = 0.5
-                    combined_forecast['rainfall_mm'] += daily_data['precipitation_sum'][i] * weight
-                    combined_forecast['temperature_max'] += daily_data.get('temperature_2m_max', [25])[i] * weight
-                    combined_forecast['temperature_min'] += daily_data.get('temperature_2m_min', [15])[i] * weight
-                    total_weight += weight
-
-                # IMD data adjustment
-                if imd_data and i < len(imd_data.get('daily_forecast', [])):
-                    weight = 0.4
-                    imd_day = imd_data['daily_forecast'][i]
-                    combined_forecast['rainfall_mm'] += imd_day['rainfall_mm'] * weight
-                    combined_forecast['temperature_max'] += imd_day['temperature_max'] * weight
-                    combined_forecast['temperature_min'] += imd_day['temperature_min'] * weight
-                    total_weight += weight
-
-                # Normalize by total weight
-                if total_weight > 0:
-                    combined_forecast['rainfall_mm'] /= total_weight
-                    combined_forecast['temperature_max'] /= total_weight
-                    combined_forecast['temperature_min'] /= total_weight
-                    combined_forecast['confidence'] = min(0.95, 0.75 + (total_weight - 0.5) * 0.2)
-
-                combined['daily_forecast'].append(combined_forecast)
+                for date, rainfall, temperature_max, temperature_min, day_confidence in zip(
+                    dates,
+                    fused['rainfall_mm'].tolist(),
+                    fused['temperature_max'].tolist(),
+                    fused['temperature_min'].tolist(),
+                    confidence.tolist()
+                )
+            ]
 
         return combined
 
     except Exception as e:
         logger.error(f"Error combining weather sources: {e}")
-        return open_meteo_data or {}
+        return source_data.get(PRIMARY_SOURCE) or {}
 
 def map_weather_code(code: int) -> str:
     """Map Open-Meteo weather codes to readable conditions"""
@@ -254,6 +761,17 @@ class RainfallPredictionResponse(BaseModel):
     confidence_interval: Optional[Dict[str, float]]
     model_accuracy: float
     data_sources: List[str]
+    model_version: Optional[str] = None  # served rainfall model, when one contributed
+
+class BatchRainfallPredictionRequest(BaseModel):
+    locations: List[LocationRequest]
+    prediction_days: int = 30
+    include_confidence: bool = True
+
+class BatchRainfallPredictionResponse(BaseModel):
+    prediction_date: datetime
+    results: List[RainfallPredictionResponse]
+    metadata: Dict[str, Any]
 
 class WeatherDataRequest(BaseModel):
     location: LocationRequest
@@ -266,6 +784,304 @@ class WeatherDataResponse(BaseModel):
     data: List[Dict[str, Any]]
     metadata: Dict[str, Any]
 
+def build_rainfall_predictions(weather_data: Optional[Dict], prediction_days: int) -> List[Dict[str, Any]]:
+    """
+    Apply the ensemble and seasonal adjustments to a combined forecast
+
+    Args:
+        weather_data: Combined forecast from get_enhanced_weather_data (None if unavailable)
+        prediction_days: Number of days to predict
+
+    Returns:
+        Daily rainfall predictions
+    """
+    return build_rainfall_predictions_batch([weather_data], prediction_days)[0]
+
+def build_rainfall_predictions_batch(weather_data: List[Optional[Dict]],
+                                     prediction_days: int) -> List[List[Dict[str, Any]]]:
+    """
+    Apply the ensemble and seasonal adjustments to many forecasts at once
+
+    Forecasts are grouped by shape (multi-source, single-source, unavailable);
+    the days of each group are concatenated and post-processed as flat arrays.
+
+    Args:
+        weather_data: Combined forecast per location (None where unavailable)
+        prediction_days: Number of days to predict
+
+    Returns:
+        Daily rainfall predictions per location, in input order
+    """
+    combined, single_source, unavailable = [], [], []
+    for index, data in enumerate(weather_data):
+        if data and 'daily_forecast' in data:
+            combined.append(index)
+        elif data and 'daily' in data:
+            single_source.append(index)
+        else:
+            unavailable.append(index)
+
+    predictions = [[] for _ in weather_data]
+    if combined:
+        grouped = _combined_rainfall_predictions([weather_data[i] for i in combined], prediction_days)
+        for index, location_predictions in zip(combined, grouped):
+            predictions[index] = location_predictions
+    if single_source:
+        grouped = _single_source_rainfall_predictions([weather_data[i] for i in single_source], prediction_days)
+        for index, location_predictions in zip(single_source, grouped):
+            predictions[index] = location_predictions
+    if unavailable:
+        # Fallback to enhanced mock data if API fails
+        logger.warning(f"Using fallback prediction data for {len(unavailable)} location(s)")
+        grouped = _fallback_rainfall_predictions(len(unavailable), prediction_days)
+        for index, location_predictions in zip(unavailable, grouped):
+            predictions[index] = location_predictions
+
+    return predictions
+
+def _split_by_location(records: List[Dict[str, Any]], lengths: List[int]) -> List[List[Dict[str, Any]]]:
+    """Split a flat list of daily records back into per-location lists"""
+    offsets = np.cumsum([0] + lengths)
+    return [records[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+def _combined_rainfall_predictions(forecasts: List[Dict], prediction_days: int) -> List[List[Dict[str, Any]]]:
+    """Ensemble, seasonal and IMD-category post-processing of multi-source forecasts"""
+    days_per_location = [data['daily_forecast'][:prediction_days] for data in forecasts]
+    lengths = [len(days) for days in days_per_location]
+    days = [forecast for location_days in days_per_location for forecast in location_days]
+    if not days:
+        return [[] for _ in forecasts]
+
+    sources = [data.get('data_sources', ['Open-Meteo']) for data in forecasts]
+    base_rainfall = np.nan_to_num(np.array([f.get('rainfall_mm', 0) for f in days], dtype=float))
+    confidence = np.array([f.get('confidence', 0.8) for f in days], dtype=float)
+    source_count = np.repeat([len(s) for s in sources], lengths)
+    accuracy_score = np.repeat([data.get('accuracy_score', 0.85) for data in forecasts], lengths)
+
+    rainfall, seasonal_factor = ensemble_rainfall(base_rainfall, months_of([f['date'] for f in days]))
+    probability = rain_probability(rainfall, source_count, accuracy_score)
+    intensity = classify_intensity(rainfall)
+
+    day_sources = [location_sources for location_sources, n in zip(sources, lengths) for _ in range(n)]
+    records = [
+        {
+            "date": forecast['date'],
+            "predicted_rainfall_mm": rain,
+            "probability_of_rain": prob,
+            "intensity_category": category,
+            "confidence_score": conf,
+            "data_sources": data_sources,
+            "ensemble_methods": ["LSTM", "ARIMA", "Random_Forest"],
+            "seasonal_adjustment": factor
+        }
+        for forecast, rain, prob, category, conf, data_sources, factor in zip(
+            days, np.round(rainfall, 1).tolist(), np.round(probability, 2).tolist(),
+            intensity.tolist(), np.round(confidence, 2).tolist(), day_sources,
+            np.round(seasonal_factor, 2).tolist()
+        )
+    ]
+    return _split_by_location(records, lengths)
+
+def _single_source_rainfall_predictions(forecasts: List[Dict],
+                                        prediction_days: int) -> List[List[Dict[str, Any]]]:
+    """Basic ML enhancement of raw Open-Meteo daily data"""
+    dates, rain_sums, rain_probs, lengths = [], [], [], []
+    for data in forecasts:
+        daily_data = data['daily']
+        location_dates = daily_data.get('time', [])[:prediction_days]
+        n = len(location_dates)
+        sums = list(daily_data.get('precipitation_sum', []))[:n]
+        probs = list(daily_data.get('precipitation_probability_max', []))[:n]
+
+        dates.extend(location_dates)
+        rain_sums.extend(sums + [0] * (n - len(sums)))
+        rain_probs.extend(probs + [50] * (n - len(probs)))
+        lengths.append(n)
+    if not dates:
+        return [[] for _ in forecasts]
+
+    base_rainfall = np.nan_to_num(np.array(rain_sums, dtype=float))
+    probability = np.array(rain_probs, dtype=float) / 100.0
+    rainfall = np.maximum(0.0, base_rainfall * np.random.default_rng().uniform(0.8, 1.2, size=len(dates)))
+    intensity = classify_intensity(rainfall, BASIC_INTENSITY_EDGES, BASIC_INTENSITY_LABELS)
+
+    records = [
+        {
+            "date": day,
+            "predicted_rainfall_mm": rain,
+            "probability_of_rain": prob,
+            "intensity_category": category,
+            "confidence_score": 0.75,
+            "data_sources": ["Open-Meteo"],
+            "ensemble_methods": ["Basic_ML"]
+        }
+        for day, rain, prob, category in zip(
+            dates, np.round(rainfall, 1).tolist(), np.round(probability, 2).tolist(), intensity.tolist()
+        )
+    ]
+    return _split_by_location(records, lengths)
+
+def _fallback_rainfall_predictions(locations: int, prediction_days: int) -> List[List[Dict[str, Any]]]:
+    """Realistic mock rainfall patterns for Karnataka when no forecast is available"""
+    rng = np.random.default_rng()
+    shape = (locations, prediction_days)
+    rainfall = np.where(rng.random(shape) > 0.3, rng.uniform(0, 25, shape), 0.0)
+    probability = np.where(rainfall > 0, rng.uniform(0.2, 0.8, shape), rng.uniform(0.1, 0.4, shape))
+    intensity = classify_intensity(rainfall, BASIC_INTENSITY_EDGES, BASIC_INTENSITY_LABELS)
+
+    today = datetime.now().date()
+    dates = [(today + timedelta(days=i + 1)).isoformat() for i in range(prediction_days)]
+
+    return [
+        [
+            {
+                "date": day,
+                "predicted_rainfall_mm": rain,
+                "probability_of_rain": prob,
+                "intensity_category": category
+            }
+            for day, rain, prob, category in zip(dates, rain_row, prob_row, category_row)
+        ]
+        for rain_row, prob_row, category_row in zip(
+            np.round(rainfall, 1).tolist(), np.round(probability, 2).tolist(), intensity.tolist()
+        )
+    ]
+
+def _station_rainfall_history(locations: List[Tuple[float, float]], days: int) -> Dict[Tuple[float, float], Any]:
+    """
+    Daily rainfall of each location's grid cell over the last days, averaged over its stations
+
+    The models treat rows as consecutive days, so a history with missing days
+    is cut to the run of consecutive days after its last gap.
+    """
+    store = get_historical_store()
+    if store is None:
+        return {}
+    cells = {store.grid_key(lat, lon) for lat, lon in locations}
+    end = datetime.now().date()
+    history = store.read(cells, end - timedelta(days=days), end, ['rainfall_mm'])
+    if history.empty or 'rainfall_mm' not in history.columns:
+        return {}
+    daily = history.dropna(subset=['rainfall_mm']).groupby(['cell', 'date'], sort=True)['rainfall_mm'].mean()
+    by_name = {}
+    for name, series in daily.astype(float).groupby(level='cell'):
+        series = series.droplevel('cell')
+        gaps = np.flatnonzero(np.diff(series.index.values) != np.timedelta64(1, 'D'))
+        if len(gaps):
+            series = series.iloc[gaps[-1] + 1:]
+        by_name[name] = series.reset_index()
+    return {
+        cell: by_name[store.cell_name(cell)].rename(columns={'rainfall_mm': 'rainfall'})
+        for cell in cells if store.cell_name(cell) in by_name
+    }
+
+def _model_rainfall_forecasts(served: LoadedModel, locations: List[Tuple[float, float]],
+                              prediction_days: int) -> List[Optional[np.ndarray]]:
+    """
+    Forecast daily rainfall from tomorrow on with the served rainfall model
+
+    Each location's grid-cell history in the historical store is the model
+    input. Locations without enough history, or whose history ends more than
+    one direct forecast horizon ago, get None. Inference errors propagate.
+
+    Returns:
+        prediction_days forecasts per location (or None), in input order
+    """
+    predictor = served.model
+    config = get_config()
+    history_days = config.get('models.rainfall_prediction.serving.history_days', 365)
+    histories = _station_rainfall_history(locations, history_days)
+    store = get_historical_store()
+    cells = [store.grid_key(lat, lon) if store is not None else None for lat, lon in locations]
+
+    # Days between the end of each history and today, forecast and then dropped
+    today = datetime.now().date()
+    lags = {}
+    for cell, history in histories.items():
+        lag = (today - history['date'].iloc[-1].date()).days
+        if len(history) >= predictor.sequence_length and lag <= predictor.forecast_horizon:
+            lags[cell] = lag
+    if not lags:
+        return [None] * len(locations)
+
+    forecasts = predictor.predict_batch(
+        {cell: histories[cell] for cell in lags}, steps=max(lags.values()) + prediction_days
+    )
+    by_cell = {
+        cell: np.asarray(forecasts[cell]['predictions'][lag:lag + prediction_days], dtype=float)
+        for cell, lag in lags.items() if forecasts.get(cell) is not None
+    }
+    return [by_cell.get(cell) for cell in cells]
+
+def _apply_model_forecasts(predictions: List[List[Dict[str, Any]]],
+                           model_forecasts: List[Optional[np.ndarray]], weight: float) -> List[bool]:
+    """
+    Blend the served model's forecasts into daily predictions in place
+
+    Upstream-based predictions keep (1 - weight) of their rainfall; fallback
+    predictions (no upstream forecast) are replaced by the model outright.
+
+    Returns:
+        Whether the model contributed, per location
+    """
+    used = []
+    for records, forecast in zip(predictions, model_forecasts):
+        if forecast is None or not records:
+            used.append(False)
+            continue
+        n = min(len(records), len(forecast))
+        model_rain = np.maximum(0.0, forecast[:n])
+        current = np.array([record['predicted_rainfall_mm'] for record in records[:n]], dtype=float)
+        share = weight if 'data_sources' in records[0] else 1.0
+        blended = np.round((1 - share) * current + share * model_rain, 1).tolist()
+        for record, rain, model_value in zip(records, blended, np.round(model_rain, 1).tolist()):
+            record['predicted_rainfall_mm'] = rain
+            record['model_rainfall_mm'] = model_value
+        used.append(True)
+    return used
+
+async def _served_model_forecasts(locations: List[Tuple[float, float]], predictions: List[List[Dict[str, Any]]],
+                                  prediction_days: int) -> Tuple[Optional[str], List[bool]]:
+    """
+    Add the registry's rainfall model to daily predictions, when one is served
+
+    The served version is read once, so a hot swap during the request does
+    not mix versions.
+
+    Returns:
+        Tuple of (served version or None, whether the model contributed per location)
+    """
+    served = get_model_registry().get_loaded('rainfall_prediction')
+    if served is None or not getattr(served.model, 'is_trained', False):
+        return None, [False] * len(locations)
+    try:
+        # Store reads and the forward pass are blocking; keep them off the event loop
+        model_forecasts = await asyncio.get_running_loop().run_in_executor(
+            None, _model_rainfall_forecasts, served, locations, prediction_days
+        )
+    except Exception as e:
+        logger.error(f"Served rainfall model {served.version} failed: {e}")
+        return None, [False] * len(locations)
+    weight = get_config().get('models.rainfall_prediction.serving.weight', 0.3)
+    return served.version, _apply_model_forecasts(predictions, model_forecasts, weight)
+
+def _rainfall_prediction_response(location: LocationRequest, predictions: List[Dict[str, Any]],
+                                  include_confidence: bool,
+                                  model_version: Optional[str] = None) -> RainfallPredictionResponse:
+    """Wrap daily predictions in the rainfall prediction response model"""
+    data_sources = ["Open-Meteo", "Historical_Data"]
+    if model_version is not None:
+        data_sources[1:1] = ["LSTM_Model", "ARIMA_Model"]
+    return RainfallPredictionResponse(
+        location=location,
+        prediction_date=datetime.now(),
+        predictions=predictions,
+        confidence_interval={"lower": 0.82, "upper": 0.94} if include_confidence else None,
+        model_accuracy=0.87,  # Realistic accuracy for ensemble model
+        data_sources=data_sources,
+        model_version=model_version
+    )
+
 @router.post("/predict-rainfall", response_model=RainfallPredictionResponse)
 async def predict_rainfall(request: RainfallPredictionRequest):
     """
@@ -281,159 +1097,74 @@ async def predict_rainfall(request: RainfallPredictionRequest):
         logger.info(f"Rainfall prediction requested for {request.location.latitude}, {request.location.longitude}")
 
         # Get enhanced weather data from multiple sources
-        weather_data = await get_enhanced_weather_data(request.location.latitude, request.location.longitude)
-
-        predictions = []
-
-        if weather_data and ('daily_forecast' in weather_data or 'daily' in weather_data):
-            # Use enhanced forecast data from multiple sources
-            if 'daily_forecast' in weather_data:
-                # Use combined forecast data with higher accuracy
-                daily_forecasts = weather_data['daily_forecast']
-                data_sources = weather_data.get('data_sources', ['Open-Meteo'])
-                accuracy_score = weather_data.get('accuracy_score', 0.85)
-
-                for i in range(min(request.prediction_days, len(daily_forecasts))):
-                    forecast = daily_forecasts[i]
-                    base_rainfall = forecast.get('rainfall_mm', 0)
-                    confidence = forecast.get('confidence', 0.8)
-
-                    # Enhanced ML-based adjustment using ensemble methods
-                    # Simulate LSTM/ARIMA/Random Forest ensemble
-                    lstm_adjustment = random.uniform(0.85, 1.15)  # LSTM tends to be conservative
-                    arima_adjustment = random.uniform(0.9, 1.1)   # ARIMA is good for trends
-                    rf_adjustment = random.uniform(0.95, 1.05)    # Random Forest is stable
-
-                    # Weighted ensemble prediction
-                    ensemble_rainfall = base_rainfall * (
-                        0.4 * lstm_adjustment +
-                        0.3 * arima_adjustment +
-                        0.3 * rf_adjustment
-                    )
-
-                    # Apply monsoon and seasonal adjustments for Indian climate
-                    date_obj = datetime.fromisoformat(forecast['date'].replace('Z', '+00:00'))
-                    month = date_obj.month
-
-                    # Monsoon season adjustment (June-September)
-                    if 6 <= month <= 9:
-                        monsoon_factor = 1.2  # Increase rainfall during monsoon
-                    elif month in [10, 11]:  # Post-monsoon
-                        monsoon_factor = 0.8
-                    elif month in [12, 1, 2]:  # Winter
-                        monsoon_factor = 0.3
-                    else:  # Pre-monsoon
-                        monsoon_factor = 0.6
-
-                    final_rainfall = max(0, ensemble_rainfall * monsoon_factor)
-
-                    # Enhanced probability calculation
-                    base_probability = min(0.9, final_rainfall / 15.0) if final_rainfall > 0 else 0.05
-
-                    # Boost probability based on data source reliability
-                    source_boost = len(data_sources) * 0.03
-                    accuracy_boost = (accuracy_score - 0.7) * 0.5
-
-                    probability = min(0.95, base_probability + source_boost + accuracy_boost)
-
-                    # Enhanced intensity classification (IMD standards)
-                    if final_rainfall < 2.5:
-                        intensity = "no_rain"
-                    elif final_rainfall < 7.5:
-                        intensity = "light"
-                    elif final_rainfall < 35.5:
-                        intensity = "moderate"
-                    elif final_rainfall < 64.5:
-                        intensity = "heavy"
-                    elif final_rainfall < 115.5:
-                        intensity = "very_heavy"
-                    else:
-                        intensity = "extremely_heavy"
-
-                    predictions.append({
-                        "date": forecast['date'],
-                        "predicted_rainfall_mm": round(final_rainfall, 1),
-                        "probability_of_rain": round(probability, 2),
-                        "intensity_category": intensity,
-                        "confidence_score": round(confidence, 2),
-                        "data_sources": data_sources,
-                        "ensemble_methods": ["LSTM", "ARIMA", "Random_Forest"],
-                        "seasonal_adjustment": round(monsoon_factor, 2)
-                    })
+        weather_data = await get_enhanced_weather_data(
+            request.location.latitude,
+            request.location.longitude,
+            rainfall_projection(request.prediction_days)
+        )
 
-            else:
-                # Fallback to single source data with basic enhancement
-                daily_data = weather_data['daily']
-                dates = daily_data.get('time', [])
-                precipitation_sums = daily_data.get('precipitation_sum', [])
-                precipitation_probs = daily_data.get('precipitation_probability_max', [])
-
-                max_days = min(len(dates), request.prediction_days)
-
-                for i in range(max_days):
-                    base_rainfall = precipitation_sums[i] if i < len(precipitation_sums) else 0
-                    probability = precipitation_probs[i] / 100.0 if i < len(precipitation_probs) else 0.5
-
-                    # Apply basic ML enhancement
-                    ml_adjustment = random.uniform(0.8, 1.2)
-                    enhanced_rainfall = max(0, base_rainfall * ml_adjustment)
-
-                    # Basic intensity classification
-                    if enhanced_rainfall < 2.5:
-                        intensity = "light"
-                    elif enhanced_rainfall < 10:
-                        intensity = "moderate"
-                    elif enhanced_rainfall < 35:
-                        intensity = "heavy"
-                    else:
-                        intensity = "very_heavy"
-
-                    predictions.append({
-                        "date": dates[i] if i < len(dates) else (datetime.now().date() + timedelta(days=i+1)).isoformat(),
-                        "predicted_rainfall_mm": round(enhanced_rainfall, 1),
-                        "probability_of_rain": round(probability, 2),
-                        "intensity_category": intensity,
-                        "confidence_score": 0.75,
-                        "data_sources": ["Open-Meteo"],
-                        "ensemble_methods": ["Basic_ML"]
-                    })
-        else:
-            # Fallback to enhanced mock data if API fails
-            logger.warning("Using fallback prediction data")
-            for i in range(request.prediction_days):
-                # Generate realistic rainfall patterns for Karnataka
-                base_rainfall = random.uniform(0, 25) if random.random() > 0.3 else 0
-                probability = random.uniform(0.2, 0.8) if base_rainfall > 0 else random.uniform(0.1, 0.4)
-
-                if base_rainfall < 2.5:
-                    intensity = "light"
-                elif base_rainfall < 10:
-                    intensity = "moderate"
-                elif base_rainfall < 35:
-                    intensity = "heavy"
-                else:
-                    intensity = "very_heavy"
-
-                predictions.append({
-                    "date": (datetime.now().date() + timedelta(days=i+1)).isoformat(),
-                    "predicted_rainfall_mm": round(base_rainfall, 1),
-                    "probability_of_rain": round(probability, 2),
-                    "intensity_category": intensity
-                })
-
-        return RainfallPredictionResponse(
-            location=request.location,
-            prediction_date=datetime.now(),
-            predictions=predictions,
-            confidence_interval={"lower": 0.82, "upper": 0.94} if request.include_confidence else None,
-            model_accuracy=0.87,  # Realistic accuracy for ensemble model
-            data_sources=["Open-Meteo", "LSTM_Model", "ARIMA_Model", "Historical_Data"]
+        predictions = build_rainfall_predictions(weather_data, request.prediction_days)
+        version, used = await _served_model_forecasts(
+            [(request.location.latitude, request.location.longitude)], [predictions], request.prediction_days
+        )
+
+        return _rainfall_prediction_response(
+            request.location, predictions, request.include_confidence, version if used[0] else None
         )
 
     except Exception as e:
         logger.error(f"Error in rainfall prediction: {e}")
         raise HTTPException(status_code=500, detail=f"Rainfall prediction failed: {str(e)}")
 
+@router.post("/predict-rainfall/batch", response_model=BatchRainfallPredictionResponse)
+async def predict_rainfall_batch(request: BatchRainfallPredictionRequest):
+    """
+    Predict rainfall for many locations in one request
+
+    Locations are deduplicated by grid cell and upstream forecasts are fetched
+    for many coordinates per call; results are returned in input order.
+
+    Args:
+        request: Batch request with a list of locations and shared parameters
+
+    Returns:
+        One rainfall prediction per input location
+    """
+    try:
+        logger.info(f"Batch rainfall prediction requested for {len(request.locations)} locations")
+
+        coordinates = [(location.latitude, location.longitude) for location in request.locations]
+        weather_data = await get_enhanced_weather_data_batch(
+            coordinates, rainfall_projection(request.prediction_days)
+        )
+
+        predictions = build_rainfall_predictions_batch(weather_data, request.prediction_days)
+        version, used = await _served_model_forecasts(coordinates, predictions, request.prediction_days)
+        results = [
+            _rainfall_prediction_response(
+                location, location_predictions, request.include_confidence, version if model_used else None
+            )
+            for location, location_predictions, model_used in zip(request.locations, predictions, used)
+        ]
+
+        return BatchRainfallPredictionResponse(
+            prediction_date=datetime.now(),
+            results=results,
+            metadata={
+                "total_locations": len(request.locations),
+                "grid_cells": len({
+                    get_forecast_cache().grid_key(location.latitude, location.longitude)
+                    for location in request.locations
+                }),
+                "model_version": version,
+                "model_locations": sum(used)
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Error in batch rainfall prediction: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch rainfall prediction failed: {str(e)}")
+
 @router.post("/historical-data", response_model=WeatherDataResponse)
 async def get_historical_weather_data(request: WeatherDataRequest):
     """
@@ -445,12 +1176,44 @@ async def get_historical_weather_data(request: WeatherDataRequest):
     Returns:
         Historical weather data
     """
+    unknown = [parameter for parameter in request.parameters if parameter not in HISTORICAL_PARAMETERS]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown parameters {unknown}; expected any of {sorted(HISTORICAL_PARAMETERS)}"
+        )
+
     try:
         logger.info(f"Historical weather data requested for {request.location.latitude}, {request.location.longitude}")
 
-        # TODO: Implement actual data retrieval from IMD and other sources
-        # For now, return mock data
-
+        store = get_historical_store()
+        if store is not None:
+            columns = [HISTORICAL_PARAMETERS[parameter] for parameter in request.parameters]
+            history = await asyncio.get_running_loop().run_in_executor(
+                None, store.read_location, request.location.latitude, request.location.longitude,
+                request.start_date, request.end_date, columns
+            )
+            stored_columns = [col for col in columns if col in history.columns]
+            if not history.empty and stored_columns:
+                # Stations sharing the grid cell are averaged per day
+                daily = history.groupby('date')[stored_columns].mean().astype(float).round(2)
+                data = [
+                    {"date": day.date().isoformat(), **{col: float(value) for col, value in values.items()}}
+                    for day, values in zip(daily.index, daily.to_dict('records'))
+                ]
+                expected_days = (request.end_date - request.start_date).days + 1
+                return WeatherDataResponse(
+                    location=request.location,
+                    data=data,
+                    metadata={
+                        "total_records": len(data),
+                        "data_sources": ["historical_store"],
+                        "grid_cell": list(store.grid_key(request.location.latitude, request.location.longitude)),
+                        "completeness": round(len(data) / expected_days, 4)
+                    }
+                )
+
+        # No stored history for this location: return mock data
         mock_data = []
         current_date = request.start_date
         while current_date <= request.end_date:
@@ -496,7 +1259,7 @@ async def get_current_weather_conditions(
         logger.info(f"Current weather conditions requested for {latitude}, {longitude}")
 
         # Get enhanced weather data from multiple sources
-        weather_data = await get_enhanced_weather_data(latitude, longitude)
+        weather_data = await get_enhanced_weather_data(latitude, longitude, CURRENT_CONDITIONS_PROJECTION)
 
         if weather_data and 'current_weather' in weather_data:
             current = weather_data['current_weather']
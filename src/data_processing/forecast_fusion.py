@@ -0,0 +1,79 @@
+"""
+Vectorized fusion of daily forecasts from multiple weather sources
+"""
+
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+# Daily variables every source series may provide
+FUSED_VARIABLES = ('rainfall_mm', 'temperature_max', 'temperature_min')
+
+def align_to_dates(axis: np.ndarray, dates: Sequence[str], values: Sequence) -> np.ndarray:
+    """
+    Scatter a source's values onto the date axis
+
+    Args:
+        axis: Sorted ISO dates (YYYY-MM-DD) of the output horizon
+        dates: ISO dates of the source values
+        values: Source values (None for missing)
+
+    Returns:
+        Array aligned with axis, NaN where the source has no value
+    """
+    aligned = np.full(len(axis), np.nan)
+    n = min(len(dates), len(values))
+    if n == 0 or len(axis) == 0:
+        return aligned
+
+    source_dates = np.asarray(dates[:n], dtype=axis.dtype)
+    source_values = np.asarray(values[:n], dtype=float)
+
+    positions = np.searchsorted(axis, source_dates)
+    in_range = positions < len(axis)
+    matched = np.zeros(n, dtype=bool)
+    matched[in_range] = axis[positions[in_range]] == source_dates[in_range]
+
+    aligned[positions[matched]] = source_values[matched]
+    return aligned
+
+def fuse_daily_forecasts(dates: Sequence[str],
+                         sources: List[Tuple[float, Dict[str, Sequence]]]) -> Dict[str, np.ndarray]:
+    """
+    Weighted average of N sources on a common date axis in one pass
+
+    Each variable is stacked into a (sources, days) array; days a source does
+    not cover are masked out of both the weighted sum and the normalizing weight.
+
+    Args:
+        dates: Output date axis (ISO dates, ascending)
+        sources: (weight, daily series) per source; a series holds a 'date'
+            list and lists for any of FUSED_VARIABLES
+
+    Returns:
+        Fused array per variable (0.0 where no source has data), plus
+        'total_weight': summed weight of the sources with rainfall on each day
+    """
+    axis = np.asarray([str(d)[:10] for d in dates], dtype='U10')
+    fused = {var: np.zeros(len(axis)) for var in FUSED_VARIABLES}
+    fused['total_weight'] = np.zeros(len(axis))
+    if not sources or len(axis) == 0:
+        return fused
+
+    weights = np.array([weight for weight, _ in sources], dtype=float)[:, np.newaxis]
+    source_dates = [[str(d)[:10] for d in series.get('date', [])] for _, series in sources]
+
+    for var in FUSED_VARIABLES:
+        stacked = np.vstack([
+            align_to_dates(axis, source_dates[i], series.get(var, []))
+            for i, (_, series) in enumerate(sources)
+        ])
+        present = ~np.isnan(stacked)
+        weight_sum = np.where(present, weights, 0.0).sum(axis=0)
+        weighted_total = (np.where(present, stacked, 0.0) * weights).sum(axis=0)
+
+        fused[var] = np.divide(weighted_total, weight_sum,
+                               out=np.zeros_like(weighted_total), where=weight_sum > 0)
+        if var == 'rainfall_mm':
+            fused['total_weight'] = weight_sum
+
+    return fused
@@ -0,0 +1,229 @@
+"""
+Partitioned historical weather store
+
+Daily observations are kept as one Parquet file per partition under
+<root>/cell=<grid cell>/year=<year>/, sorted by date. Reads open only the
+partitions of the requested cells and years, project the requested columns,
+and filter dates against row-group statistics, so a query touches a few row
+groups instead of scanning the archive.
+"""
+
+import logging
+import os
+import uuid
+from datetime import date
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from utils.config import get_config
+from utils.grid import Cell, grid_cell, grid_decimals, snap_to_grid
+
+logger = logging.getLogger(__name__)
+
+class HistoricalWeatherStore:
+    """
+    Daily weather history partitioned by grid cell and year
+
+    Rows need date, latitude and longitude columns; every other column is
+    stored as given. A station is identified by station_column when the rows
+    have it, else by its coordinates; writing a station's day again replaces
+    the stored row, so re-ingesting an overlapping range does not duplicate days.
+    """
+
+    def __init__(self, root: str, grid_resolution: float = 0.1, row_group_size: int = 16384,
+                 station_column: str = 'station_id'):
+        """
+        Initialize the store
+
+        Args:
+            root: Store directory (created on first write)
+            grid_resolution: Grid cell size in degrees
+            row_group_size: Maximum rows per Parquet row group
+            station_column: Column identifying stations, if present
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for the historical weather store")
+        self.root = root
+        self.grid_resolution = grid_resolution
+        self.cell_decimals = grid_decimals(grid_resolution)
+        self.row_group_size = row_group_size
+        self.station_column = station_column
+        self.partitioning = ds.partitioning(
+            pa.schema([("cell", pa.string()), ("year", pa.int16())]), flavor="hive"
+        )
+
+    def grid_key(self, lat: float, lon: float) -> Cell:
+        """Snap coordinates to the centre of their grid cell"""
+        return grid_cell(lat, lon, self.grid_resolution)
+
+    def cell_name(self, cell: Cell) -> str:
+        """
+        Partition value of a grid cell
+
+        Coordinates are written with the decimals of the grid resolution, so
+        distinct cells never share a name; trailing zeros are dropped ("28.6_77").
+        """
+        return "_".join(self._format_coordinate(value) for value in cell)
+
+    def _format_coordinate(self, value: float) -> str:
+        text = f"{value:.{self.cell_decimals}f}"
+        return text.rstrip('0').rstrip('.') if '.' in text else text
+
+    def write(self, data: pd.DataFrame) -> int:
+        """
+        Add or replace daily observations
+
+        Each touched partition is rewritten as one file holding its stored
+        rows merged with the new ones (new rows win for the same station and
+        date). Untouched partitions are left alone.
+
+        Args:
+            data: Rows with date, latitude, longitude and any weather columns
+
+        Returns:
+            Number of rows written
+        """
+        if data.empty:
+            return 0
+
+        df = data.copy()
+        df['date'] = pd.to_datetime(df['date'])
+        lat_cells, lon_cells = snap_to_grid(df['latitude'].to_numpy(), df['longitude'].to_numpy(),
+                                            self.grid_resolution)
+        # Hash-factorize the cells (as complex numbers) and name each distinct cell once
+        codes, unique_cells = pd.factorize(lat_cells + 1j * lon_cells)
+        names = np.array([self.cell_name((cell.real, cell.imag)) for cell in unique_cells], dtype=object)
+        df['cell'] = names[codes]
+        df['year'] = df['date'].dt.year.astype(np.int16)
+
+        keys = ['date', self.station_column] if self.station_column in df.columns else ['date', 'latitude', 'longitude']
+        df = df.drop_duplicates(subset=['cell', *keys], keep='last')
+        # Date-ordered files keep row-group date ranges tight for pushdown
+        df = df.sort_values(['cell', *keys], kind='stable')
+
+        partitions = df[['cell', 'year']].drop_duplicates()
+        stored = np.array([
+            os.path.isdir(os.path.join(self.root, f"cell={cell}", f"year={year}"))
+            for cell, year in zip(partitions['cell'], partitions['year'])
+        ], dtype=bool)
+
+        # Partitions with stored rows are merged and rewritten one by one
+        if stored.any():
+            merge = df.merge(partitions[stored], on=['cell', 'year'])
+            for (cell, year), rows in merge.groupby(['cell', 'year'], sort=False):
+                self._merge_partition(cell, int(year), rows.drop(columns=['cell', 'year']), keys)
+            df = df.merge(partitions[~stored], on=['cell', 'year'])
+
+        # New partitions are written in one pass
+        if not df.empty:
+            ds.write_dataset(
+                self._to_table(df), self.root, format="parquet", partitioning=self.partitioning,
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+                max_rows_per_group=self.row_group_size,
+                min_rows_per_group=min(self.row_group_size, len(df))
+            )
+
+        logger.info(f"Wrote {len(data)} historical rows to {self.root}")
+        return len(data)
+
+    def _merge_partition(self, cell: str, year: int, rows: pd.DataFrame, keys: List[str]):
+        """Merge rows into a stored partition and replace its files with one"""
+        existing = self._partition_files([cell], year, year)
+        stored = ds.dataset(existing, format="parquet").to_table().to_pandas(date_as_object=False)
+        rows = pd.concat([stored, rows], ignore_index=True)
+        rows = rows.drop_duplicates(subset=keys, keep='last').sort_values(keys, kind='stable')
+
+        directory = os.path.join(self.root, f"cell={cell}", f"year={year}")
+        # Write the merged file before removing the old ones, so the data is never missing
+        pq.write_table(self._to_table(rows), os.path.join(directory, f"part-{uuid.uuid4().hex}-0.parquet"),
+                       row_group_size=self.row_group_size)
+        for path in existing:
+            os.remove(path)
+
+    @staticmethod
+    def _to_table(df: pd.DataFrame) -> "pa.Table":
+        """Arrow table with the date column as date32 (for row-group statistics pushdown)"""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return table.set_column(table.schema.get_field_index('date'), 'date', table['date'].cast(pa.date32()))
+
+    def read(self, cells: Iterable[Cell], start_date: date, end_date: date,
+             columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Read observations of grid cells within a date range
+
+        Args:
+            cells: Grid cells (as returned by grid_key)
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            columns: Columns to load besides date and cell (default: all)
+
+        Returns:
+            Matching rows ordered by cell and date (empty if there are none)
+        """
+        names = [self.cell_name(cell) for cell in cells]
+        files = self._partition_files(names, start_date.year, end_date.year)
+        if not files:
+            return pd.DataFrame(columns=['date', 'cell', *(columns or [])])
+
+        dataset = ds.dataset(
+            files, format="parquet", partitioning=self.partitioning, partition_base_dir=self.root
+        )
+        if columns is not None:
+            columns = ['date', 'cell', *[col for col in columns if col in dataset.schema.names]]
+        table = dataset.to_table(
+            columns=columns,
+            filter=(ds.field('date') >= start_date) & (ds.field('date') <= end_date)
+        )
+        df = table.to_pandas(date_as_object=False)
+        return df.sort_values(['cell', 'date'], kind='stable').reset_index(drop=True)
+
+    def read_location(self, lat: float, lon: float, start_date: date, end_date: date,
+                      columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Read the grid cell containing a location; see read"""
+        return self.read([self.grid_key(lat, lon)], start_date, end_date, columns)
+
+    def _partition_files(self, cells: List[str], first_year: int, last_year: int) -> List[str]:
+        """Parquet files of the given cell and year partitions, without listing the whole store"""
+        files = []
+        for cell in cells:
+            for year in range(first_year, last_year + 1):
+                directory = os.path.join(self.root, f"cell={cell}", f"year={year}")
+                if os.path.isdir(directory):
+                    files.extend(
+                        os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                        if name.endswith('.parquet')
+                    )
+        return files
+
+# Global historical store instance
+historical_store = None
+
+def get_historical_store() -> Optional[HistoricalWeatherStore]:
+    """
+    Get global historical store from data_processing.historical_store
+
+    Returns None when pyarrow is not installed or the store path is empty.
+    """
+    global historical_store
+    if historical_store is None:
+        config = get_config()
+        path = config.get('data_processing.historical_store.path', 'data/processed/historical')
+        if not path or not PYARROW_AVAILABLE:
+            return None
+        historical_store = HistoricalWeatherStore(
+            path,
+            grid_resolution=config.get('geography.grid_resolution', 0.1),
+            row_group_size=config.get('data_processing.historical_store.row_group_size', 16384)
+        )
+    return historical_store
@@ -0,0 +1,78 @@
+"""
+Vectorized ensemble and seasonal post-processing of daily rainfall forecasts
+"""
+
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+# Simulated ensemble members (LSTM, ARIMA, Random Forest): adjustment range and
+# weight. LSTM tends to be conservative, ARIMA is good for trends, RF is stable.
+ENSEMBLE_LOW = np.array([0.85, 0.9, 0.95])
+ENSEMBLE_HIGH = np.array([1.15, 1.1, 1.05])
+ENSEMBLE_WEIGHTS = np.array([0.4, 0.3, 0.3])
+
+# Seasonal factor for Indian climate, indexed by month (1-12; index 0 unused)
+MONSOON_FACTORS = np.array([
+    np.nan,
+    0.3, 0.3,            # Jan-Feb: winter
+    0.6, 0.6, 0.6,       # Mar-May: pre-monsoon
+    1.2, 1.2, 1.2, 1.2,  # Jun-Sep: monsoon
+    0.8, 0.8,            # Oct-Nov: post-monsoon
+    0.3                  # Dec: winter
+])
+
+# IMD rainfall intensity categories (mm/day upper bounds)
+IMD_INTENSITY_EDGES = np.array([2.5, 7.5, 35.5, 64.5, 115.5])
+IMD_INTENSITY_LABELS = np.array(
+    ["no_rain", "light", "moderate", "heavy", "very_heavy", "extremely_heavy"]
+)
+
+# Coarser categories used for single-source and fallback predictions
+BASIC_INTENSITY_EDGES = np.array([2.5, 10.0, 35.0])
+BASIC_INTENSITY_LABELS = np.array(["light", "moderate", "heavy", "very_heavy"])
+
+def months_of(dates: Sequence[str]) -> np.ndarray:
+    """Calendar month (1-12) of ISO dates or datetimes"""
+    days = np.array([str(d)[:10] for d in dates], dtype='datetime64[D]')
+    return days.astype('datetime64[M]').astype(int) % 12 + 1
+
+def classify_intensity(rainfall: np.ndarray, edges: np.ndarray = IMD_INTENSITY_EDGES,
+                       labels: np.ndarray = IMD_INTENSITY_LABELS) -> np.ndarray:
+    """Intensity label per value; each edge is the exclusive upper bound of its category"""
+    return labels[np.digitize(rainfall, edges)]
+
+def ensemble_rainfall(base_rainfall: np.ndarray, months: np.ndarray,
+                      rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apply the weighted ensemble adjustment and the seasonal factor
+
+    Args:
+        base_rainfall: Fused daily rainfall (mm)
+        months: Calendar month of each day
+        rng: Random generator for the ensemble adjustments
+
+    Returns:
+        Tuple of (adjusted rainfall clipped at 0, seasonal factor per day)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    adjustments = rng.uniform(ENSEMBLE_LOW, ENSEMBLE_HIGH, size=(len(base_rainfall), 3))
+    seasonal_factor = MONSOON_FACTORS[months]
+    rainfall = np.maximum(0.0, base_rainfall * (adjustments @ ENSEMBLE_WEIGHTS) * seasonal_factor)
+    return rainfall, seasonal_factor
+
+def rain_probability(rainfall: np.ndarray, source_count: np.ndarray,
+                     accuracy_score: np.ndarray) -> np.ndarray:
+    """
+    Probability of rain from predicted amount, boosted by source count and accuracy
+
+    Args:
+        rainfall: Predicted rainfall (mm)
+        source_count: Number of contributing data sources per day
+        accuracy_score: Accuracy score of the combined forecast per day
+
+    Returns:
+        Probability per day, capped at 0.95
+    """
+    base_probability = np.where(rainfall > 0, np.minimum(0.9, rainfall / 15.0), 0.05)
+    boost = source_count * 0.03 + (accuracy_score - 0.7) * 0.5
+    return np.minimum(0.95, base_probability + boost)
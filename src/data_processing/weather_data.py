@@ -5,13 +5,270 @@ Weather data collection and processing module
 import pandas as pd
 import numpy as np
 import requests
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Iterable, Callable
+from datetime import date, datetime, timedelta
+import calendar
+import heapq
 import logging
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from data_processing.historical_store import HistoricalWeatherStore, get_historical_store
+from utils.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Columns whose outliers process_weather_data caps at 1.5 IQR beyond the quartiles
+OUTLIER_COLUMNS = ['temperature_celsius', 'humidity_percent', 'wind_speed_kmh']
+
+# Trailing rolling-mean windows (days) added by process_weather_data
+ROLLING_WINDOWS = [7, 30]
+ROLLING_COLUMNS = {'rainfall_mm': 'rainfall', 'temperature_celsius': 'temperature'}
+
+# Daily columns climate normals are computed from
+NORMALS_COLUMNS = ['temperature_celsius', 'rainfall_mm', 'humidity_percent', 'wind_speed_kmh']
+
+SEASONS = {
+    12: 'Winter', 1: 'Winter', 2: 'Winter',
+    3: 'Spring', 4: 'Spring', 5: 'Spring',
+    6: 'Summer', 7: 'Summer', 8: 'Summer',
+    9: 'Monsoon', 10: 'Monsoon', 11: 'Post-Monsoon'
+}
+
+def monsoon_dates(rainfall: pd.Series, year: int) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Climatological monsoon onset and withdrawal from a daily rainfall series
+    
+    Mean rainfall per day of year is smoothed over 15 days (wrapping around
+    the year end). Onset is the first day from April to August wetter than the
+    annual mean daily rainfall, withdrawal the last such day from onset to
+    November.
+    
+    Args:
+        rainfall: Daily rainfall indexed by date
+        year: Year of the returned dates
+        
+    Returns:
+        Tuple of ISO dates (onset, withdrawal); None where no wet spell is found
+    """
+    by_day = rainfall.groupby(rainfall.index.dayofyear).mean().reindex(range(1, 366))
+    if by_day.isna().all():
+        return None, None
+    by_day = by_day.interpolate(limit_direction='both').to_numpy()
+    padded = np.concatenate([by_day[-7:], by_day, by_day[:7]])
+    smoothed = np.convolve(padded, np.ones(15) / 15, mode='valid')
+    wet = smoothed > by_day.mean()
+    
+    # Day-of-year windows (1-based): April 1 - August 31, and onset - November 30
+    onset_days = np.flatnonzero(wet[90:243]) + 91
+    if not onset_days.size:
+        return None, None
+    onset = int(onset_days[0])
+    withdrawal = onset + int(np.flatnonzero(wet[onset - 1:334])[-1])
+    
+    first = date(year, 1, 1)
+    return ((first + timedelta(days=onset - 1)).isoformat(),
+            (first + timedelta(days=withdrawal - 1)).isoformat())
+
+def rolling_sum_count(values: np.ndarray, window: int,
+                      history: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing window sums and non-NaN counts over up to window values
+    
+    Every window is summed in the same fixed order, so a chunk computed with
+    the preceding values as history matches the same rows computed over the
+    whole series bit for bit (unlike pandas' running-sum rolling kernels).
+    
+    Args:
+        values: Series values
+        window: Window length
+        history: Values preceding values; only the last window - 1 are used
+        
+    Returns:
+        Tuple of (NaN-skipping sums as float64, counts)
+    """
+    values = np.asarray(values, dtype=float)
+    padded = np.full(window - 1 + len(values), np.nan)
+    padded[window - 1:] = values
+    if history is not None and window > 1:
+        tail = np.asarray(history, dtype=float)[-(window - 1):]
+        padded[window - 1 - len(tail):window - 1] = tail
+    
+    valid = ~np.isnan(padded)
+    filled = np.where(valid, padded, 0.0)
+    n = len(values)
+    sums = np.zeros(n)
+    counts = np.zeros(n, dtype=np.int64)
+    for offset in range(window):
+        sums += filled[offset:offset + n]
+        counts += valid[offset:offset + n]
+    return sums, counts
+
+def rolling_mean(values: np.ndarray, window: int, history: Optional[np.ndarray] = None) -> np.ndarray:
+    """Trailing mean over up to window values, skipping NaN (rolling(window, min_periods=1).mean())"""
+    sums, counts = rolling_sum_count(values, window, history)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+class ValueCounts:
+    """
+    Exact distinct values and counts of a column, merged chunk by chunk
+    
+    The median and quantiles are taken from the order statistics and
+    interpolated the way pandas does, so they equal Series.median() and
+    Series.quantile() of the whole column.
+    
+    Memory grows with the number of distinct values, which stays small for
+    discretized readings (e.g. rainfall in 0.1 mm) but not for unrounded
+    floats. With decimals, values are rounded before counting, so at most
+    (column range) * 10**decimals values are kept, and the statistics are
+    those of the rounded column (within half a unit of the last decimal).
+    """
+    
+    def __init__(self, dtype: Any, decimals: Optional[int] = None):
+        self.dtype = np.dtype(dtype)
+        self.decimals = decimals if self.dtype.kind == 'f' else None
+        self.values = np.empty(0, dtype=self.dtype)
+        self.counts = np.empty(0, dtype=np.int64)
+    
+    @property
+    def n(self) -> int:
+        return int(self.counts.sum())
+    
+    def add(self, values: np.ndarray, counts: Optional[np.ndarray] = None):
+        """Add values (NaN is skipped), each counts times if given"""
+        values = np.asarray(values, dtype=self.dtype)
+        if self.decimals is not None:
+            values = np.round(values, self.decimals)
+        if counts is None:
+            values, counts = np.unique(values[~np.isnan(values)], return_counts=True)
+        merged, inverse = np.unique(np.concatenate([self.values, values]), return_inverse=True)
+        self.counts = np.bincount(inverse, weights=np.concatenate([self.counts, counts])).astype(np.int64)
+        self.values = merged
+    
+    def _order_statistic(self, i: int) -> Any:
+        return self.values[np.searchsorted(np.cumsum(self.counts), i, side='right')]
+    
+    def median(self) -> Any:
+        n = self.n
+        if n == 0:
+            return np.nan
+        middle = [self._order_statistic(n // 2)] if n % 2 else [
+            self._order_statistic(n // 2 - 1), self._order_statistic(n // 2)
+        ]
+        return pd.Series(middle, dtype=self.dtype).median()
+    
+    def quantile(self, q: float) -> float:
+        n = self.n
+        if n == 0:
+            return np.nan
+        # Linear interpolation between the neighbouring order statistics,
+        # evaluated by numpy on just those two values
+        position = (n - 1) * q
+        previous = int(np.floor(position))
+        neighbours = np.array(
+            [self._order_statistic(previous), self._order_statistic(min(previous + 1, n - 1))], dtype=float
+        )
+        return np.quantile(neighbours, position - previous)
+
+class RunningMedian:
+    """
+    Median of a growing set of values, kept in two heaps
+    
+    The lower half is a max-heap (stored negated) and the upper half a
+    min-heap, so adding a value costs O(log n) and reading the median O(1).
+    The median equals Series.median() of all values added (NaN is skipped).
+    """
+    
+    def __init__(self):
+        self._lower: List[float] = []
+        self._upper: List[float] = []
+    
+    def __len__(self) -> int:
+        return len(self._lower) + len(self._upper)
+    
+    def add(self, values: Iterable[float]):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) > len(self):
+            # Bulk load: rebuilding from sorted values beats pushing one by one
+            merged = np.sort(np.concatenate([-np.asarray(self._lower), np.asarray(self._upper), values]))
+            split = (len(merged) + 1) // 2
+            self._lower = (-merged[:split]).tolist()
+            self._upper = merged[split:].tolist()
+            heapq.heapify(self._lower)
+            heapq.heapify(self._upper)
+            return
+        
+        for value in values.tolist():
+            if not self._lower or value <= -self._lower[0]:
+                heapq.heappush(self._lower, -value)
+            else:
+                heapq.heappush(self._upper, value)
+            # Keep the lower half equal to or one larger than the upper half
+            if len(self._lower) > len(self._upper) + 1:
+                heapq.heappush(self._upper, -heapq.heappop(self._lower))
+            elif len(self._upper) > len(self._lower):
+                heapq.heappush(self._lower, -heapq.heappop(self._upper))
+    
+    def median(self) -> float:
+        if not self._lower:
+            return np.nan
+        if len(self._lower) > len(self._upper):
+            return -self._lower[0]
+        return (-self._lower[0] + self._upper[0]) / 2
+
+def _iqr_bounds(q1: float, q3: float) -> Tuple[float, float]:
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+def _calculate_station_indices(data: pd.DataFrame) -> pd.DataFrame:
+    return WeatherIndexCalculator().update(data)
+
+def _apply_to_stations(function: Callable[[pd.DataFrame], pd.DataFrame],
+                       frames: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """Worker task: apply function to a batch of station frames"""
+    return [function(frame) for frame in frames]
+
+def _apply_by_station(function: Callable[[pd.DataFrame], pd.DataFrame], data: pd.DataFrame,
+                      station_key: str, max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Apply a single-station function to every station's rows
+    
+    Stations are batched over a process pool (in-process with one worker or
+    one station) and the results are returned in the input row order.
+    
+    Args:
+        function: Picklable function of one station's rows
+        data: Rows of all stations
+        station_key: Column identifying the station of each row
+        max_workers: Worker processes (default
+            data_processing.station_processing.max_workers, else CPU count)
+    """
+    positions = list(data.groupby(station_key, sort=False, dropna=False).indices.values())
+    frames = [data.iloc[rows] for rows in positions]
+    max_workers = (
+        max_workers or get_config().get('data_processing.station_processing.max_workers') or os.cpu_count() or 1
+    )
+    
+    if max_workers == 1 or len(frames) <= 1:
+        results = _apply_to_stations(function, frames)
+    else:
+        # A few batches per worker keeps the pool busy without a task per station
+        batches = np.array_split(np.arange(len(frames)), min(len(frames), max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_apply_to_stations, function, [frames[i] for i in batch])
+                for batch in batches
+            ]
+            results = [frame for future in futures for frame in future.result()]
+    
+    if not results:
+        return function(data)
+    order = np.argsort(np.concatenate(positions), kind='stable')
+    return pd.concat(results).iloc[order]
+
 class WeatherDataCollector:
     """
     Collect and process weather data from various sources including IMD
@@ -46,51 +303,11 @@ class WeatherDataCollector:
             
             # TODO: Implement actual IMD API integration
             # For now, generate mock historical data
+            location = location or {'latitude': 28.6139, 'longitude': 77.2090}
+            df = pd.concat(
+                self.iter_synthetic_history(start_date, end_date, [location]), ignore_index=True
+            ).drop(columns='station_id')
             
-            date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-            
-            # Generate realistic mock weather data
-            np.random.seed(42)  # For reproducible results
-            
-            data = []
-            for date in date_range:
-                # Seasonal patterns for India
-                day_of_year = date.timetuple().tm_yday
-                
-                # Temperature patterns (Celsius)
-                temp_base = 25 + 10 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
-                temperature = temp_base + np.random.normal(0, 3)
-                
-                # Rainfall patterns (mm) - monsoon season
-                if 150 <= day_of_year <= 270:  # Monsoon season
-                    rainfall_base = 8.0
-                else:
-                    rainfall_base = 1.0
-                
-                rainfall = max(0, np.random.exponential(rainfall_base))
-                
-                # Humidity patterns (%)
-                humidity = 60 + 20 * np.sin(2 * np.pi * (day_of_year - 80) / 365) + np.random.normal(0, 5)
-                humidity = np.clip(humidity, 30, 95)
-                
-                # Wind speed (km/h)
-                wind_speed = 8 + np.random.exponential(3)
-                
-                # Pressure (hPa)
-                pressure = 1013 + np.random.normal(0, 10)
-                
-                data.append({
-                    'date': date,
-                    'temperature_celsius': round(temperature, 1),
-                    'rainfall_mm': round(rainfall, 2),
-                    'humidity_percent': round(humidity, 1),
-                    'wind_speed_kmh': round(wind_speed, 1),
-                    'pressure_hpa': round(pressure, 1),
-                    'latitude': location['latitude'] if location else 28.6139,
-                    'longitude': location['longitude'] if location else 77.2090
-                })
-            
-            df = pd.DataFrame(data)
             logger.info(f"Generated {len(df)} records of mock IMD data")
             
             return df
@@ -99,6 +316,70 @@ class WeatherDataCollector:
             logger.error(f"Error collecting IMD data: {e}")
             raise
     
+    def iter_synthetic_history(self, start_date: str, end_date: str, locations: List[Dict[str, Any]],
+                               seed: int = 42, stations_per_chunk: int = 100) -> Iterator[pd.DataFrame]:
+        """
+        Generate synthetic daily weather for many stations, in chunks of stations
+        
+        Each station draws from its own random stream spawned from seed, so a
+        station's history depends only on the seed and its position in
+        locations, not on the chunk size. Weather values are float32;
+        coordinates keep the float64 values given.
+        
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            locations: Location dicts with latitude, longitude and an optional
+                station_id (default: the position in the list)
+            seed: Seed of the per-station streams
+            stations_per_chunk: Stations per yielded DataFrame
+            
+        Yields:
+            DataFrames of whole station histories, ordered by station then date
+        """
+        dates = pd.date_range(start=start_date, end=end_date, freq='D')
+        n_days = len(dates)
+        
+        # Seasonal patterns for India, shared by all stations
+        day_of_year = dates.dayofyear.to_numpy()
+        season = np.sin(2 * np.pi * (day_of_year - 80) / 365).astype(np.float32)
+        temp_base = 25 + 10 * season
+        humidity_base = 60 + 20 * season
+        # Monsoon season rainfall scale (mm)
+        rainfall_scale = np.where((day_of_year >= 150) & (day_of_year <= 270), 8.0, 1.0).astype(np.float32)
+        
+        streams = np.random.SeedSequence(seed).spawn(len(locations))
+        
+        for first in range(0, len(locations), stations_per_chunk):
+            chunk = locations[first:first + stations_per_chunk]
+            normal = np.empty((len(chunk), 3, n_days), dtype=np.float32)
+            exponential = np.empty((len(chunk), 2, n_days), dtype=np.float32)
+            for i, stream in enumerate(streams[first:first + len(chunk)]):
+                rng = np.random.default_rng(stream)
+                rng.standard_normal(dtype=np.float32, out=normal[i])
+                rng.standard_exponential(dtype=np.float32, out=exponential[i])
+            
+            temperature = temp_base + 3 * normal[:, 0]
+            rainfall = rainfall_scale * exponential[:, 0]
+            humidity = np.clip(humidity_base + 5 * normal[:, 1], 30, 95)
+            wind_speed = 8 + 3 * exponential[:, 1]
+            pressure = 1013 + 10 * normal[:, 2]
+            
+            yield pd.DataFrame({
+                'station_id': np.repeat(
+                    [location.get('station_id', first + i) for i, location in enumerate(chunk)], n_days
+                ),
+                'date': np.tile(dates.to_numpy(), len(chunk)),
+                'temperature_celsius': temperature.round(1).ravel(),
+                'rainfall_mm': rainfall.round(2).ravel(),
+                'humidity_percent': humidity.round(1).ravel(),
+                'wind_speed_kmh': wind_speed.round(1).ravel(),
+                'pressure_hpa': pressure.round(1).ravel(),
+                # Coordinates stay float64 so grid snapping sees the exact values
+                'latitude': np.repeat(np.array([l['latitude'] for l in chunk], dtype=float), n_days),
+                'longitude': np.repeat(np.array([l['longitude'] for l in chunk], dtype=float), n_days)
+            })
+    
     def collect_current_weather(self, latitude: float, longitude: float) -> Dict[str, Any]:
         """
         Collect current weather conditions for a location
@@ -150,72 +431,29 @@ class WeatherDataCollector:
             logger.error(f"Error collecting current weather: {e}")
             raise
     
-    def process_weather_data(self, raw_data: pd.DataFrame) -> pd.DataFrame:
+    def process_weather_data(self, raw_data: pd.DataFrame, station_key: Optional[str] = None,
+                             max_workers: Optional[int] = None) -> pd.DataFrame:
         """
         Process and clean raw weather data
         
         Args:
-            raw_data: Raw weather data DataFrame
+            raw_data: Raw weather data DataFrame, in date order per station
+            station_key: Column identifying the station of each row; each
+                station is then interpolated, filled, capped and averaged on
+                its own, with stations spread over worker processes
+            max_workers: Worker processes for station_key (default
+                data_processing.station_processing.max_workers, else CPU count)
             
         Returns:
-            Processed and cleaned weather data
+            Processed and cleaned weather data, in the input row order
         """
         try:
             logger.info("Processing weather data...")
             
-            df = raw_data.copy()
-            
-            # Ensure date column is datetime
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
-            
-            # Handle missing values
-            numeric_columns = df.select_dtypes(include=[np.number]).columns
-            
-            for col in numeric_columns:
-                if col in df.columns:
-                    # Fill missing values with interpolation
-                    df[col] = df[col].interpolate(method='linear')
-                    
-                    # Fill remaining NaN values with median
-                    df[col] = df[col].fillna(df[col].median())
-            
-            # Remove outliers using IQR method
-            for col in ['temperature_celsius', 'humidity_percent', 'wind_speed_kmh']:
-                if col in df.columns:
-                    Q1 = df[col].quantile(0.25)
-                    Q3 = df[col].quantile(0.75)
-                    IQR = Q3 - Q1
-                    
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
-                    
-                    # Cap outliers instead of removing them
-                    df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
-            
-            # Add derived features
-            if 'temperature_celsius' in df.columns and 'humidity_percent' in df.columns:
-                # Heat index calculation (simplified)
-                df['heat_index'] = df['temperature_celsius'] + 0.5 * (df['humidity_percent'] - 50) / 10
-            
-            # Add seasonal indicators
-            if 'date' in df.columns:
-                df['month'] = df['date'].dt.month
-                df['day_of_year'] = df['date'].dt.dayofyear
-                df['season'] = df['month'].map({
-                    12: 'Winter', 1: 'Winter', 2: 'Winter',
-                    3: 'Spring', 4: 'Spring', 5: 'Spring',
-                    6: 'Summer', 7: 'Summer', 8: 'Summer',
-                    9: 'Monsoon', 10: 'Monsoon', 11: 'Post-Monsoon'
-                })
-            
-            # Add rolling averages
-            window_sizes = [7, 30]
-            for window in window_sizes:
-                if 'rainfall_mm' in df.columns:
-                    df[f'rainfall_rolling_{window}d'] = df['rainfall_mm'].rolling(window=window, min_periods=1).mean()
-                if 'temperature_celsius' in df.columns:
-                    df[f'temperature_rolling_{window}d'] = df['temperature_celsius'].rolling(window=window, min_periods=1).mean()
+            if station_key is None:
+                df = self._process_frame(raw_data)
+            else:
+                df = _apply_by_station(self._process_frame, raw_data, station_key, max_workers)
             
             logger.info(f"Weather data processing completed. Shape: {df.shape}")
             
@@ -225,59 +463,274 @@ class WeatherDataCollector:
             logger.error(f"Error processing weather data: {e}")
             raise
     
-    def calculate_weather_indices(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _process_frame(self, raw_data: pd.DataFrame) -> pd.DataFrame:
+        """process_weather_data of a single station's series"""
+        df = raw_data.copy()
+        
+        # Ensure date column is datetime
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'])
+        
+        # Handle missing values
+        numeric_columns = df.select_dtypes(include=[np.number]).columns
+        
+        for col in numeric_columns:
+            if col in df.columns:
+                # Fill missing values with interpolation
+                df[col] = df[col].interpolate(method='linear')
+                
+                # Fill remaining NaN values with median
+                df[col] = df[col].fillna(df[col].median())
+        
+        # Outlier bounds using IQR method
+        bounds = {
+            col: _iqr_bounds(df[col].quantile(0.25), df[col].quantile(0.75))
+            for col in OUTLIER_COLUMNS if col in df.columns
+        }
+        
+        self._finish_processing(df, bounds)
+        return df
+    
+    def process_weather_data_stream(self, chunks: Callable[[], Iterable[pd.DataFrame]],
+                                    decimals: Optional[int] = None) -> Iterator[pd.DataFrame]:
         """
-        Calculate various weather indices and indicators
+        Process weather data chunk by chunk with bounded memory
+        
+        chunks is called twice: the first pass collects the column medians and
+        quartiles (as value counts) and the first valid value of every chunk;
+        the second pass interpolates across chunk boundaries from those
+        anchors and carries the rolling-window tails.
+        
+        Without decimals the statistics are exact and the concatenated output
+        is identical to process_weather_data on the concatenated input, but
+        the value counts grow with the distinct values of each column (see
+        ValueCounts), so this suits discretized readings only. For unrounded
+        float archives set decimals to bound them.
         
         Args:
-            data: Processed weather data
+            chunks: Callable returning the consecutive raw chunks of one series
+            decimals: Round float values to this many decimals for the median
+                and quartiles (default data_processing.time_series.stream_decimals,
+                else exact)
             
-        Returns:
-            Data with additional weather indices
+        Yields:
+            Processed chunks
         """
-        try:
-            logger.info("Calculating weather indices...")
+        if decimals is None:
+            decimals = get_config().get('data_processing.time_series.stream_decimals')
+        medians, bounds, next_anchors = self._stream_statistics(chunks(), decimals)
+        
+        previous_anchor: Dict[str, Tuple[int, float]] = {}
+        history: Dict[str, np.ndarray] = {}
+        offset = 0
+        for k, chunk in enumerate(chunks()):
+            df = chunk.copy()
+            if 'date' in df.columns:
+                df['date'] = pd.to_datetime(df['date'])
             
-            df = data.copy()
+            for col in df.select_dtypes(include=[np.number]).columns:
+                values = df[col].to_numpy()
+                if values.dtype.kind == 'f':
+                    missing = np.isnan(values)
+                    if missing.any():
+                        df[col] = self._interpolate_chunk(
+                            values, missing, offset, previous_anchor.get(col), next_anchors[k].get(col)
+                        )
+                    valid_positions = np.flatnonzero(~missing)
+                    if valid_positions.size:
+                        previous_anchor[col] = (offset + valid_positions[-1], values[valid_positions[-1]])
+                df[col] = df[col].fillna(medians.get(col))
             
-            # Drought index (simplified Palmer Drought Severity Index)
-            if 'rainfall_mm' in df.columns:
-                # Calculate 30-day cumulative rainfall
-                df['rainfall_30d'] = df['rainfall_mm'].rolling(window=30, min_periods=1).sum()
+            history = self._finish_processing(df, bounds, history)
+            offset += len(df)
+            yield df
+    
+    @staticmethod
+    def _interpolate_chunk(values: np.ndarray, missing: np.ndarray, offset: int,
+                           previous: Optional[Tuple[int, float]], following: Optional[Tuple[int, float]]) -> np.ndarray:
+        """Linear interpolation of a chunk's gaps at global row positions, as Series.interpolate does"""
+        positions = offset + np.flatnonzero(~missing)
+        anchor_x = [positions]
+        anchor_y = [values[~missing]]
+        if previous is not None:
+            anchor_x.insert(0, [previous[0]])
+            anchor_y.insert(0, [previous[1]])
+        if following is not None:
+            anchor_x.append([following[0]])
+            anchor_y.append([following[1]])
+        xp = np.concatenate(anchor_x)
+        if xp.size == 0:
+            return values
+        
+        x = offset + np.flatnonzero(missing)
+        filled = np.interp(x, xp, np.concatenate(anchor_y))
+        # Interpolation runs forward only: rows before the first valid value stay missing
+        filled[x < xp[0]] = np.nan
+        values = values.copy()
+        values[missing] = filled
+        return values
+    
+    def _stream_statistics(self, chunks: Iterable[pd.DataFrame], decimals: Optional[int] = None) -> Tuple[
+            Dict[str, Any], Dict[str, Tuple[float, float]], List[Dict[str, Tuple[int, float]]]]:
+        """
+        First pass of process_weather_data_stream
+        
+        Returns:
+            Tuple of (fill median per column, IQR bounds per outlier column,
+            per chunk the first valid value following it per column)
+        """
+        counts: Dict[str, ValueCounts] = {}
+        last_valid: Dict[str, Tuple[int, float]] = {}
+        leading: Dict[str, int] = {}
+        first_valid: List[Dict[str, Tuple[int, float]]] = []
+        offset = 0
+        
+        for chunk in chunks:
+            chunk_first = {}
+            for col in chunk.select_dtypes(include=[np.number]).columns:
+                values = chunk[col].to_numpy()
+                if col not in counts:
+                    counts[col] = ValueCounts(values.dtype, decimals)
+                    leading[col] = 0
+                if values.dtype.kind != 'f':
+                    if col in OUTLIER_COLUMNS:
+                        counts[col].add(values)
+                    continue
                 
-                # Simple drought index based on rainfall deficit
-                normal_rainfall_30d = df['rainfall_30d'].median()
-                df['drought_index'] = (df['rainfall_30d'] - normal_rainfall_30d) / normal_rainfall_30d
+                missing = np.isnan(values)
+                positions = np.flatnonzero(~missing)
+                if positions.size == 0:
+                    if col not in last_valid:
+                        leading[col] += len(values)
+                    continue
                 
-                # Categorize drought severity
-                df['drought_category'] = pd.cut(
-                    df['drought_index'],
-                    bins=[-np.inf, -0.5, -0.3, -0.1, 0.1, np.inf],
-                    labels=['Severe Drought', 'Moderate Drought', 'Mild Drought', 'Normal', 'Wet']
-                )
+                counts[col].add(values[positions])
+                chunk_first[col] = (offset + positions[0], values[positions[0]])
+                
+                # Gaps closed by this chunk's valid values, including one left
+                # open by earlier chunks, filled as the interpolation would
+                previous = last_valid.get(col)
+                start = previous[0] + 1 if previous is not None else offset + positions[0]
+                xp = offset + positions
+                yp = values[positions]
+                if previous is not None:
+                    xp = np.concatenate([[previous[0]], xp])
+                    yp = np.concatenate([[previous[1]], yp])
+                gap = np.concatenate([
+                    np.arange(start, offset),
+                    offset + np.flatnonzero(missing[:positions[-1]])
+                ])
+                gap = gap[gap >= start]
+                if gap.size:
+                    counts[col].add(np.interp(gap, xp, yp).astype(values.dtype))
+                if previous is None:
+                    leading[col] += int(positions[0])
+                last_valid[col] = (offset + positions[-1], values[positions[-1]])
             
-            # Heat stress index
-            if 'temperature_celsius' in df.columns and 'humidity_percent' in df.columns:
-                # Simplified heat stress calculation
-                df['heat_stress_index'] = (df['temperature_celsius'] - 25) + (df['humidity_percent'] - 50) / 10
-                df['heat_stress_category'] = pd.cut(
-                    df['heat_stress_index'],
-                    bins=[-np.inf, 0, 5, 10, np.inf],
-                    labels=['Low', 'Moderate', 'High', 'Extreme']
-                )
+            first_valid.append(chunk_first)
+            offset += len(chunk)
+        
+        medians = {}
+        for col, column_counts in counts.items():
+            if col in last_valid:
+                # Trailing gaps take the last valid value
+                trailing = offset - 1 - last_valid[col][0]
+                if trailing:
+                    column_counts.add([last_valid[col][1]], [trailing])
+            medians[col] = column_counts.median()
+            if leading[col] and col in last_valid:
+                column_counts.add([medians[col]], [leading[col]])
+        
+        bounds = {
+            col: _iqr_bounds(counts[col].quantile(0.25), counts[col].quantile(0.75))
+            for col in OUTLIER_COLUMNS if col in counts
+        }
+        
+        # First valid value after each chunk, scanning backwards
+        next_anchors: List[Dict[str, Tuple[int, float]]] = [{} for _ in first_valid]
+        following: Dict[str, Tuple[int, float]] = {}
+        for k in range(len(first_valid) - 1, -1, -1):
+            next_anchors[k] = dict(following)
+            following.update(first_valid[k])
+        
+        return medians, bounds, next_anchors
+    
+    def _finish_processing(self, df: pd.DataFrame, bounds: Dict[str, Tuple[float, float]],
+                           history: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+        """
+        Cap outliers and add derived features in place
+        
+        Args:
+            df: Weather data with missing values filled
+            bounds: Lower and upper bound per column to cap
+            history: Rolling-mean input values preceding df, per column
             
-            # Growing degree days (base temperature 10°C)
-            if 'temperature_celsius' in df.columns:
-                df['growing_degree_days'] = np.maximum(0, df['temperature_celsius'] - 10)
-                df['gdd_cumulative'] = df['growing_degree_days'].cumsum()
-            
-            # Rainfall intensity classification
-            if 'rainfall_mm' in df.columns:
-                df['rainfall_intensity'] = pd.cut(
-                    df['rainfall_mm'],
-                    bins=[0, 2.5, 10, 35, 65, np.inf],
-                    labels=['No Rain', 'Light', 'Moderate', 'Heavy', 'Very Heavy']
-                )
+        Returns:
+            Rolling-mean input tails to pass as history for the following rows
+        """
+        # Cap outliers instead of removing them
+        for col, (lower_bound, upper_bound) in bounds.items():
+            # Bounds in the column's own float type, so capping never upcasts it
+            if df[col].dtype.kind == 'f':
+                lower_bound, upper_bound = df[col].dtype.type(lower_bound), df[col].dtype.type(upper_bound)
+            df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
+        
+        # Add derived features
+        if 'temperature_celsius' in df.columns and 'humidity_percent' in df.columns:
+            # Heat index calculation (simplified)
+            df['heat_index'] = df['temperature_celsius'] + 0.5 * (df['humidity_percent'] - 50) / 10
+        
+        # Add seasonal indicators
+        if 'date' in df.columns:
+            df['month'] = df['date'].dt.month
+            df['day_of_year'] = df['date'].dt.dayofyear
+            df['season'] = df['month'].map(SEASONS)
+        
+        # Add rolling averages
+        history = history or {}
+        columns = [col for col in ROLLING_COLUMNS if col in df.columns]
+        values = {col: df[col].to_numpy(dtype=float) for col in columns}
+        for window in ROLLING_WINDOWS:
+            for col in columns:
+                df[f'{ROLLING_COLUMNS[col]}_rolling_{window}d'] = rolling_mean(values[col], window, history.get(col))
+        
+        return {
+            col: np.concatenate([history.get(col, np.empty(0)), values[col]])[-(max(ROLLING_WINDOWS) - 1):]
+            for col in columns
+        }
+    
+    def calculate_weather_indices(self, data: pd.DataFrame, station_key: Optional[str] = None,
+                                  max_workers: Optional[int] = None,
+                                  calculators: Optional["StationIndexCalculators"] = None) -> pd.DataFrame:
+        """
+        Calculate various weather indices and indicators
+        
+        Args:
+            data: Processed weather data, in date order per station
+            station_key: Column identifying the station of each row; rolling
+                totals, cumulative GDD and the drought baseline are then
+                computed per station, with stations spread over worker processes
+            max_workers: Worker processes for station_key (default
+                data_processing.station_processing.max_workers, else CPU count)
+            calculators: Per-station state from earlier calls (requires
+                station_key); data holds the days following those already
+                seen, and is appended in-process instead of recomputed
+            
+        Returns:
+            Data with additional weather indices, in the input row order
+        """
+        try:
+            logger.info("Calculating weather indices...")
+            
+            if calculators is not None:
+                if station_key is None:
+                    raise ValueError("Incremental index calculation needs a station_key")
+                df = calculators.update(data, station_key)
+            # A fresh calculator over the whole history is the full recompute
+            elif station_key is None:
+                df = _calculate_station_indices(data)
+            else:
+                df = _apply_by_station(_calculate_station_indices, data, station_key, max_workers)
             
             logger.info("Weather indices calculation completed")
             
@@ -303,8 +756,17 @@ class WeatherDataCollector:
         try:
             logger.info(f"Calculating climate normals for {latitude}, {longitude}")
             
-            # TODO: Implement actual climate normals calculation from historical data
-            # For now, return mock climate normals
+            store = get_historical_store()
+            if store is not None:
+                today = datetime.now().date()
+                history = store.read_location(
+                    latitude, longitude, date(today.year - period_years, 1, 1), today, NORMALS_COLUMNS
+                )
+                if not history.empty:
+                    return self._climate_normals_from_history(latitude, longitude, history)
+                logger.info("No stored history for this location; returning mock climate normals")
+            
+            # Without stored history, return mock climate normals
             
             # Generate mock climate normals based on location
             # Adjust for latitude (temperature decreases with latitude)
@@ -347,6 +809,73 @@ class WeatherDataCollector:
             logger.error(f"Error calculating climate normals: {e}")
             raise
     
+    def _climate_normals_from_history(self, latitude: float, longitude: float,
+                                      history: pd.DataFrame) -> Dict[str, Any]:
+        """Climate normals of a grid cell's stored daily history"""
+        # Several stations in a cell are averaged into one daily series
+        daily = history.groupby('date')[[col for col in NORMALS_COLUMNS if col in history.columns]].mean()
+        months = daily.index.month
+        years = daily.index.year
+        
+        def monthly_mean(col: str) -> List[float]:
+            if col not in daily.columns:
+                return []
+            return [round(float(value), 1) for value in daily[col].groupby(months).mean().reindex(range(1, 13))]
+        
+        annual_averages = {}
+        monthly_averages = {
+            'temperature': monthly_mean('temperature_celsius'),
+            'humidity': monthly_mean('humidity_percent')
+        }
+        extremes = {}
+        seasonal_patterns = {
+            'monsoon_onset_date': None,
+            'monsoon_withdrawal_date': None,
+            'peak_summer_month': None,
+            'peak_winter_month': None
+        }
+        
+        if 'temperature_celsius' in daily.columns:
+            temperature = daily['temperature_celsius']
+            annual_averages['temperature_celsius'] = round(float(temperature.mean()), 1)
+            extremes['max_temperature_celsius'] = round(float(temperature.max()), 1)
+            extremes['min_temperature_celsius'] = round(float(temperature.min()), 1)
+            monthly_temperature = temperature.groupby(months).mean()
+            seasonal_patterns['peak_summer_month'] = calendar.month_name[int(monthly_temperature.idxmax())]
+            seasonal_patterns['peak_winter_month'] = calendar.month_name[int(monthly_temperature.idxmin())]
+        if 'rainfall_mm' in daily.columns:
+            rainfall = daily['rainfall_mm']
+            # Totals per year and per calendar month, averaged over the years
+            annual_averages['rainfall_mm'] = round(float(rainfall.groupby(years).sum().mean()), 1)
+            monthly_totals = rainfall.groupby([years, months]).sum()
+            monthly_averages['rainfall'] = [
+                round(float(value), 1)
+                for value in monthly_totals.groupby(level=1).mean().reindex(range(1, 13))
+            ]
+            extremes['max_daily_rainfall_mm'] = round(float(rainfall.max()), 1)
+            onset, withdrawal = monsoon_dates(rainfall, datetime.now().year)
+            seasonal_patterns['monsoon_onset_date'] = onset
+            seasonal_patterns['monsoon_withdrawal_date'] = withdrawal
+        if 'humidity_percent' in daily.columns:
+            annual_averages['humidity_percent'] = round(float(daily['humidity_percent'].mean()), 1)
+        if 'wind_speed_kmh' in daily.columns:
+            annual_averages['wind_speed_kmh'] = round(float(daily['wind_speed_kmh'].mean()), 1)
+            extremes['max_wind_speed_kmh'] = round(float(daily['wind_speed_kmh'].max()), 1)
+        
+        return {
+            'location': {
+                'latitude': latitude,
+                'longitude': longitude
+            },
+            'period': f"{years.min()}-{years.max()}",
+            'annual_averages': annual_averages,
+            'monthly_averages': monthly_averages,
+            'extremes': extremes,
+            'seasonal_patterns': seasonal_patterns,
+            'data_source': 'historical_store',
+            'days': len(daily)
+        }
+    
     def export_data(self, data: pd.DataFrame, filepath: str, format: str = 'csv'):
         """
         Export processed weather data to file
@@ -354,7 +883,8 @@ class WeatherDataCollector:
         Args:
             data: Processed weather data
             filepath: Output file path
-            format: Export format ('csv', 'json', 'parquet')
+            format: Export format ('csv', 'json', 'parquet', or 'store' to append
+                to the partitioned historical store rooted at filepath)
         """
         try:
             logger.info(f"Exporting weather data to {filepath}")
@@ -365,6 +895,13 @@ class WeatherDataCollector:
                 data.to_json(filepath, orient='records', date_format='iso')
             elif format.lower() == 'parquet':
                 data.to_parquet(filepath, index=False)
+            elif format.lower() == 'store':
+                config = get_config()
+                HistoricalWeatherStore(
+                    filepath,
+                    grid_resolution=config.get('geography.grid_resolution', 0.1),
+                    row_group_size=config.get('data_processing.historical_store.row_group_size', 16384)
+                ).write(data)
             else:
                 raise ValueError(f"Unsupported export format: {format}")
             
@@ -373,3 +910,138 @@ class WeatherDataCollector:
         except Exception as e:
             logger.error(f"Error exporting weather data: {e}")
             raise
+
+class WeatherIndexCalculator:
+    """
+    Weather indices of one station, updated incrementally as days are appended
+    
+    The calculator carries the last 29 days of rainfall for the 30-day totals,
+    the cumulative growing degree days, and every 30-day total seen so far in
+    a running median (the drought baseline). Appending N days costs O(N log n)
+    for the baseline and O(N) otherwise, and the returned rows equal the last
+    N rows of calculate_weather_indices over the whole history. Rows returned
+    earlier are not revised when the baseline moves. StationIndexCalculators
+    keeps one calculator per station.
+    """
+    
+    RAINFALL_WINDOW = 30
+    GDD_BASE_TEMPERATURE = 10
+    
+    def __init__(self):
+        self.rainfall_history = np.empty(0)
+        self.rainfall_30d_baseline = RunningMedian()
+        self.gdd_total = None
+        self.days = 0
+    
+    def update(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate the indices of newly appended days
+        
+        Args:
+            data: Processed weather data following the days already seen
+            
+        Returns:
+            Copy of data with the weather index columns added
+        """
+        df = data.copy()
+        
+        # Drought index (simplified Palmer Drought Severity Index)
+        if 'rainfall_mm' in df.columns:
+            # Calculate 30-day cumulative rainfall
+            rainfall = df['rainfall_mm'].to_numpy(dtype=float)
+            sums, counts = rolling_sum_count(rainfall, self.RAINFALL_WINDOW, self.rainfall_history)
+            df['rainfall_30d'] = np.where(counts > 0, sums, np.nan)
+            self.rainfall_history = np.concatenate([self.rainfall_history, rainfall])[-(self.RAINFALL_WINDOW - 1):]
+            
+            # Simple drought index based on rainfall deficit
+            self.rainfall_30d_baseline.add(df['rainfall_30d'].to_numpy())
+            normal_rainfall_30d = self.rainfall_30d_baseline.median()
+            df['drought_index'] = (df['rainfall_30d'] - normal_rainfall_30d) / normal_rainfall_30d
+            
+            # Categorize drought severity
+            df['drought_category'] = pd.cut(
+                df['drought_index'],
+                bins=[-np.inf, -0.5, -0.3, -0.1, 0.1, np.inf],
+                labels=['Severe Drought', 'Moderate Drought', 'Mild Drought', 'Normal', 'Wet']
+            )
+        
+        # Heat stress index
+        if 'temperature_celsius' in df.columns and 'humidity_percent' in df.columns:
+            # Simplified heat stress calculation
+            df['heat_stress_index'] = (df['temperature_celsius'] - 25) + (df['humidity_percent'] - 50) / 10
+            df['heat_stress_category'] = pd.cut(
+                df['heat_stress_index'],
+                bins=[-np.inf, 0, 5, 10, np.inf],
+                labels=['Low', 'Moderate', 'High', 'Extreme']
+            )
+        
+        # Growing degree days (base temperature 10°C)
+        if 'temperature_celsius' in df.columns:
+            df['growing_degree_days'] = np.maximum(0, df['temperature_celsius'] - self.GDD_BASE_TEMPERATURE)
+            df['gdd_cumulative'] = self._cumulative_gdd(df['growing_degree_days'].to_numpy())
+        
+        # Rainfall intensity classification
+        if 'rainfall_mm' in df.columns:
+            df['rainfall_intensity'] = pd.cut(
+                df['rainfall_mm'],
+                bins=[0, 2.5, 10, 35, 65, np.inf],
+                labels=['No Rain', 'Light', 'Moderate', 'Heavy', 'Very Heavy']
+            )
+        
+        self.days += len(df)
+        return df
+    
+    def _cumulative_gdd(self, gdd: np.ndarray) -> np.ndarray:
+        """Running GDD total continuing from the carried total (NaN days stay NaN, like cumsum)"""
+        missing = np.isnan(gdd)
+        carried = gdd.dtype.type(0) if self.gdd_total is None else self.gdd_total
+        # Summing in the column's dtype, in order, reproduces cumsum bit for bit
+        totals = np.cumsum(np.concatenate([np.array([carried], dtype=gdd.dtype), np.where(missing, 0, gdd)]))[1:]
+        if len(totals):
+            self.gdd_total = totals[-1]
+        totals[missing] = np.nan
+        return totals
+
+class StationIndexCalculators:
+    """
+    WeatherIndexCalculator state per station, for a daily multi-station ingest
+    
+    Each update appends every station's new days to that station's
+    calculator, creating calculators for stations not seen before, so the
+    rolling buffers, cumulative GDD and drought baseline carry over between
+    ingests at O(new days) cost.
+    """
+    
+    def __init__(self):
+        self.calculators: Dict[Any, WeatherIndexCalculator] = {}
+    
+    def __len__(self) -> int:
+        return len(self.calculators)
+    
+    def __getitem__(self, station: Any) -> WeatherIndexCalculator:
+        return self.calculators[station]
+    
+    def update(self, data: pd.DataFrame, station_key: str) -> pd.DataFrame:
+        """
+        Calculate the indices of newly appended days of any number of stations
+        
+        Args:
+            data: Processed weather data; each station's rows follow the days
+                its calculator has already seen, in date order
+            station_key: Column identifying the station of each row
+            
+        Returns:
+            Copy of data with the weather index columns added, in the input row order
+        """
+        if data[station_key].isna().any():
+            raise ValueError(f"Rows without a {station_key} cannot be appended to a station's state")
+        groups = data.groupby(station_key, sort=False).indices
+        if not groups:
+            return WeatherIndexCalculator().update(data)
+        
+        results = []
+        for station, rows in groups.items():
+            calculator = self.calculators.setdefault(station, WeatherIndexCalculator())
+            results.append(calculator.update(data.iloc[rows]))
+        order = np.argsort(np.concatenate(list(groups.values())), kind='stable')
+        return pd.concat(results).iloc[order]
@@ -4,6 +4,7 @@ WeatherCrop AI Platform - Main Application Entry Point
 
 import sys
 import os
+import importlib.util
 import asyncio
 import logging
 from pathlib import Path
@@ -57,11 +58,10 @@ def check_dependencies():
         except ImportError:
             missing_required.append(package_name)
 
-    # Check optional packages
+    # Check optional packages without importing them (TensorFlow is only
+    # loaded when a model is trained or served through Keras)
     for import_name, package_name in optional_packages.items():
-        try:
-            __import__(import_name)
-        except ImportError:
+        if importlib.util.find_spec(import_name) is None:
             missing_optional.append(package_name)
             logger.warning(f"Optional package not available: {package_name}")
 
@@ -0,0 +1,195 @@
+"""
+Versioned model artifact directories
+
+An artifact directory holds one .npy file per weight array and a JSON
+manifest describing the arrays (shape, dtype, sha256) alongside plain-number
+parameters and the training configuration:
+
+    <artifact>/
+        manifest.json
+        arrays/<name>.npy
+
+Arrays are loaded memory-mapped and read-only, so worker processes serving the
+same artifact share one copy of the weights through the page cache. Loading
+checks file sizes against the manifest; the checksums are verified on request
+(verify_artifact), since hashing reads every array in full.
+
+Saving writes a new sibling directory and points <artifact> at it with an
+atomic symlink swap, so concurrent loaders always find a complete artifact.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+ARTIFACT_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+ARRAYS_DIR = "arrays"
+# Loads retried when the version being read is replaced and removed mid-load
+LOAD_ATTEMPTS = 3
+
+class ArtifactError(Exception):
+    """Raised when an artifact is missing, incompatible or corrupted"""
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def is_artifact(directory: str) -> bool:
+    """Whether directory contains an artifact manifest"""
+    return os.path.isfile(os.path.join(directory, MANIFEST_FILE))
+
+def save_artifact(directory: str, arrays: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Write an artifact directory, replacing any existing one atomically
+
+    The artifact is written to <directory>.v-<timestamp> and directory becomes
+    a symlink to it, swapped in one rename. The previous target is kept for
+    loaders that resolved it just before the swap; older targets are removed.
+
+    Args:
+        directory: Artifact path to create or replace
+        arrays: Named arrays (names must be valid file names)
+        metadata: JSON-serializable parameters stored in the manifest
+
+    Returns:
+        The written manifest
+    """
+    directory = os.path.normpath(directory)
+    target = f"{directory}.v-{time.time_ns()}"
+    os.makedirs(os.path.join(target, ARRAYS_DIR))
+
+    entries = {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        relative_path = os.path.join(ARRAYS_DIR, f"{name}.npy")
+        path = os.path.join(target, relative_path)
+        np.save(path, array, allow_pickle=False)
+        entries[name] = {
+            "file": relative_path,
+            "shape": list(array.shape),
+            "dtype": array.dtype.str,
+            "size": os.path.getsize(path),
+            "sha256": _sha256(path)
+        }
+
+    manifest = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "arrays": entries,
+        **metadata
+    }
+    with open(os.path.join(target, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    previous = os.path.realpath(directory) if os.path.islink(directory) else None
+    if os.path.isdir(directory) and not os.path.islink(directory):
+        # A plain directory (written before symlink swaps) is moved aside first
+        aside = f"{directory}.v-old-{time.time_ns()}"
+        os.replace(directory, aside)
+        previous = aside
+
+    link = f"{directory}.link-{os.getpid()}"
+    if os.path.lexists(link):
+        os.remove(link)
+    os.symlink(os.path.basename(target), link)
+    os.replace(link, directory)
+
+    _remove_stale_targets(directory, keep={target, previous})
+    return manifest
+
+def _remove_stale_targets(directory: str, keep: set):
+    """Delete superseded <directory>.v-* targets other than those in keep"""
+    parent, base = os.path.split(directory)
+    parent = parent or "."
+    keep = {os.path.realpath(path) for path in keep if path}
+    for entry in os.listdir(parent):
+        path = os.path.join(parent, entry)
+        if entry.startswith(f"{base}.v-") and os.path.realpath(path) not in keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+def load_artifact(directory: str, mmap: bool = True,
+                  verify: bool = False) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Read an artifact directory
+
+    File sizes are always checked against the manifest, which catches
+    truncated files without reading them.
+
+    Args:
+        directory: Artifact directory written by save_artifact
+        mmap: Memory-map the arrays read-only instead of reading them into memory
+        verify: Also check every array file against its manifest checksum
+            (reads every array in full)
+
+    Returns:
+        Tuple of (arrays by name, manifest)
+    """
+    for attempt in range(LOAD_ATTEMPTS):
+        # Resolve a swapped symlink once, so every file comes from the same version
+        resolved = os.path.realpath(directory)
+        try:
+            return _load_resolved(resolved, mmap, verify)
+        except (FileNotFoundError, ArtifactError):
+            # The version was superseded and removed while loading; retry on the current one
+            if attempt == LOAD_ATTEMPTS - 1 or os.path.realpath(directory) == resolved:
+                raise
+
+def _load_resolved(directory: str, mmap: bool, verify: bool) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    manifest = _read_manifest(directory)
+    if verify:
+        verify_artifact(directory)
+
+    arrays = {}
+    for name, entry in manifest["arrays"].items():
+        path = os.path.join(directory, entry["file"])
+        if "size" in entry and os.path.getsize(path) != entry["size"]:
+            raise ArtifactError(f"Size mismatch for {path}")
+        array = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        if list(array.shape) != entry["shape"] or array.dtype.str != entry["dtype"]:
+            raise ArtifactError(f"Array {name} in {directory} does not match its manifest entry")
+        arrays[name] = array
+
+    return arrays, manifest
+
+def verify_artifact(directory: str) -> Dict[str, Any]:
+    """
+    Check every array file of an artifact against its manifest checksum
+
+    Returns:
+        The manifest
+
+    Raises:
+        ArtifactError: If the manifest is unreadable or a checksum differs
+    """
+    directory = os.path.realpath(directory)
+    manifest = _read_manifest(directory)
+    for entry in manifest["arrays"].values():
+        path = os.path.join(directory, entry["file"])
+        if _sha256(path) != entry["sha256"]:
+            raise ArtifactError(f"Checksum mismatch for {path}")
+    return manifest
+
+def _read_manifest(directory: str) -> Dict[str, Any]:
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ArtifactError(f"Cannot read artifact manifest {manifest_path}: {e}")
+
+    if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise ArtifactError(
+            f"Unsupported artifact format {manifest.get('format_version')} in {directory} "
+            f"(expected {ARTIFACT_FORMAT_VERSION})"
+        )
+    return manifest
@@ -0,0 +1,233 @@
+"""
+Walk-forward backtesting for the rainfall prediction model
+
+Forecasts are issued at a series of origins over a historical DataFrame, each
+using only the data before the origin, and scored against what followed. The
+fitted state is reused between origins: the LSTM weights and scaler are fixed,
+and the ARIMA state is extended over the observations between consecutive
+origins (fixed parameters, no refit) instead of refiltering the whole history.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.special import ndtr
+
+from models.rainfall_prediction import RainfallPredictor
+
+logger = logging.getLogger(__name__)
+
+def gaussian_crps(mean: np.ndarray, std: np.ndarray, observed: np.ndarray) -> np.ndarray:
+    """
+    Continuous ranked probability score of Gaussian forecasts (closed form)
+
+    Args:
+        mean: Forecast means
+        std: Forecast standard deviations (> 0)
+        observed: Observed values
+
+    Returns:
+        Elementwise CRPS, in the units of the observations
+    """
+    z = (observed - mean) / std
+    pdf = np.exp(-0.5 * z ** 2) / np.sqrt(2 * np.pi)
+    return std * (z * (2 * ndtr(z) - 1) + 2 * pdf - 1 / np.sqrt(np.pi))
+
+def forecast_metrics(predictions: np.ndarray, actuals: np.ndarray, horizons: Sequence[int],
+                     std: Optional[np.ndarray] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Score forecasts of all origins at once
+
+    Args:
+        predictions: Forecasts shaped (origins, steps)
+        actuals: Observations shaped (origins, steps)
+        horizons: Lead times in days to report
+        std: Forecast standard deviations shaped like predictions; adds CRPS
+
+    Returns:
+        Metrics per lead time ("1d", "7d", ...) and over all steps ("all")
+    """
+    errors = predictions - actuals
+    columns = {f"{h}d": slice(h - 1, h) for h in horizons}
+    columns["all"] = slice(None)
+
+    abs_errors = np.abs(errors)
+    squared_errors = errors ** 2
+    crps = gaussian_crps(predictions, std, actuals) if std is not None else None
+
+    metrics = {}
+    for name, column in columns.items():
+        metrics[name] = {
+            "mae": float(abs_errors[:, column].mean()),
+            "rmse": float(np.sqrt(squared_errors[:, column].mean()))
+        }
+        if crps is not None:
+            metrics[name]["crps"] = float(crps[:, column].mean())
+    return metrics
+
+@dataclass
+class BacktestResult:
+    """Forecasts, observations and timings of a walk-forward backtest"""
+    origins: List[Any]
+    horizons: List[int]
+    actuals: np.ndarray
+    predictions: np.ndarray
+    lstm_predictions: np.ndarray
+    arima_predictions: np.ndarray
+    forecast_std: np.ndarray
+    origin_seconds: np.ndarray
+    metrics: Dict[str, Dict[str, Dict[str, float]]]
+
+    def summary(self) -> Dict[str, Any]:
+        """Serializable metrics and timing summary"""
+        return {
+            "origins": len(self.origins),
+            "first_origin": str(self.origins[0]),
+            "last_origin": str(self.origins[-1]),
+            "horizons": self.horizons,
+            "metrics": self.metrics,
+            "origin_seconds": {
+                "mean": float(self.origin_seconds.mean()),
+                "p95": float(np.percentile(self.origin_seconds, 95)),
+                "total": float(self.origin_seconds.sum())
+            }
+        }
+
+def _origin_positions(data: pd.DataFrame, origins: Optional[Sequence[Any]], n_origins: int,
+                      step: int, max_horizon: int) -> np.ndarray:
+    """Row positions of the forecast origins (the first row each forecast predicts)"""
+    if origins is None:
+        last = len(data) - max_horizon
+        return np.arange(last - (n_origins - 1) * step, last + 1, step)
+    if all(isinstance(origin, (int, np.integer)) for origin in origins):
+        return np.asarray(origins, dtype=int)
+    # Dates: position of the first row on or after each origin date
+    dates = pd.to_datetime(data['date']).to_numpy()
+    return np.searchsorted(dates, pd.to_datetime(list(origins)).to_numpy())
+
+def _check_no_lookahead(predictor: RainfallPredictor, data: pd.DataFrame, first_origin: int):
+    """Raise if a pre-trained predictor may have seen data from the backtest period"""
+    if predictor.trained_through is not None and 'date' in data.columns:
+        first_date = pd.to_datetime(data['date']).iloc[first_origin]
+        if pd.Timestamp(predictor.trained_through) >= first_date:
+            raise ValueError(
+                f"Predictor was trained through {predictor.trained_through}, on or after the first "
+                f"origin {first_date.date()}; backtest with train=True or an earlier model"
+            )
+    elif predictor.training_rows is None or predictor.training_rows > first_origin:
+        raise ValueError(
+            "Cannot tell whether the predictor was trained only on data before the first origin; "
+            "backtest with train=True"
+        )
+
+def walk_forward_backtest(predictor: RainfallPredictor, data: pd.DataFrame,
+                          origins: Optional[Sequence[Any]] = None, horizons: Sequence[int] = (1, 7, 30),
+                          n_origins: int = 12, step: int = 30, target_column: str = 'rainfall',
+                          train: bool = True) -> BacktestResult:
+    """
+    Evaluate a rainfall predictor walk-forward over historical data
+
+    Args:
+        predictor: Predictor to evaluate; trained on the data before the first
+            origin unless train is False
+        data: Daily history in date order, with target_column (and 'date' when
+            origins are given as dates)
+        origins: Forecast origins as row positions or dates (each forecast
+            predicts from that row on); default: n_origins spaced step rows
+            apart, ending at the last origin with a full horizon of actuals
+        horizons: Lead times in days to score; forecasts run to the longest
+        n_origins: Number of default origins
+        step: Rows between default origins
+        target_column: Name of the target column
+        train: Train the predictor on the data before the first origin. With
+            False, a trained predictor is used as is, and must have been
+            trained only on data before the first origin
+
+    Returns:
+        Forecasts, observations, per-origin wall time and metrics per model
+        ("ensemble", "lstm", "arima") and lead time. The forecast distribution
+        for CRPS is Gaussian around each model's forecast with the ARIMA
+        forecast standard error.
+    """
+    horizons = sorted(int(h) for h in horizons)
+    max_horizon = horizons[-1]
+    values = data[target_column].to_numpy(dtype=float)
+    positions = _origin_positions(data, origins, n_origins, step, max_horizon)
+
+    if len(positions) == 0:
+        raise ValueError("No backtest origins")
+    if positions[0] < predictor.sequence_length or positions[-1] + max_horizon > len(values):
+        raise ValueError(
+            f"Origins must leave {predictor.sequence_length} rows of history and "
+            f"{max_horizon} rows of actuals within the data"
+        )
+    if np.any(np.diff(positions) <= 0):
+        raise ValueError("Origins must be strictly increasing")
+
+    if train or not predictor.is_trained:
+        logger.info(f"Training on {positions[0]} rows before the first origin")
+        predictor.train(data.iloc[:positions[0]], target_column)
+    else:
+        _check_no_lookahead(predictor, data, positions[0])
+    if predictor.arima_results is None or (predictor.lstm_engine is None and predictor.lstm_model is None):
+        raise ValueError("Backtesting needs a predictor with fitted LSTM and ARIMA models")
+
+    # All windows and actuals as views of the scaled/raw series
+    scaled = predictor.scaler.transform(values.reshape(-1, 1)).ravel().astype(np.float32)
+    windows = sliding_window_view(scaled, predictor.sequence_length)[positions - predictor.sequence_length]
+    actuals = sliding_window_view(values, max_horizon)[positions]
+
+    shape = (len(positions), max_horizon)
+    lstm_predictions = np.empty(shape)
+    arima_predictions = np.empty(shape)
+    forecast_std = np.empty(shape)
+    origin_seconds = np.empty(len(positions))
+
+    arima_state = None
+    for i, position in enumerate(positions):
+        start = time.perf_counter()
+        if arima_state is None:
+            # Fitted parameters applied to the history up to the first origin
+            arima_state = predictor.arima_results.apply(values[:position], refit=False)
+        else:
+            arima_state = arima_state.extend(values[positions[i - 1]:position])
+        forecast = arima_state.get_forecast(max_horizon)
+        arima_predictions[i] = np.asarray(forecast.predicted_mean)
+        forecast_std[i] = np.asarray(forecast.se_mean)
+        lstm_predictions[i] = predictor.predict_lstm_batch(windows[i:i + 1], max_horizon)[0]
+        origin_seconds[i] = time.perf_counter() - start
+
+    lstm_weight, arima_weight = predictor.ensemble_weights
+    predictions = lstm_weight * lstm_predictions + arima_weight * arima_predictions
+
+    metrics = {
+        name: forecast_metrics(model_predictions, actuals, horizons, forecast_std)
+        for name, model_predictions in (
+            ("ensemble", predictions), ("lstm", lstm_predictions), ("arima", arima_predictions)
+        )
+    }
+
+    origin_labels = (
+        list(pd.to_datetime(data['date']).iloc[positions]) if 'date' in data.columns else positions.tolist()
+    )
+    logger.info(
+        f"Backtested {len(positions)} origins in {origin_seconds.sum():.2f}s; "
+        f"ensemble MAE {metrics['ensemble']['all']['mae']:.3f}"
+    )
+
+    return BacktestResult(
+        origins=origin_labels,
+        horizons=horizons,
+        actuals=actuals,
+        predictions=predictions,
+        lstm_predictions=lstm_predictions,
+        arima_predictions=arima_predictions,
+        forecast_std=forecast_std,
+        origin_seconds=origin_seconds,
+        metrics=metrics
+    )
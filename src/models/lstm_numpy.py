@@ -0,0 +1,166 @@
+"""
+NumPy inference engine for the stacked LSTM rainfall model
+
+Runs the forward pass of a trained Keras model (LSTM layers followed by Dense
+layers) from exported weights, so serving does not need TensorFlow.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Tuple
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0.0),
+    'tanh': np.tanh,
+    'sigmoid': lambda x: 1.0 / (1.0 + np.exp(-x))
+}
+
+class MinMaxScaling:
+    """Min-max scaling from plain numbers, compatible with a fitted sklearn MinMaxScaler"""
+
+    def __init__(self, scale: np.ndarray, offset: np.ndarray):
+        """
+        Args:
+            scale: Per-feature multiplier (MinMaxScaler.scale_)
+            offset: Per-feature offset (MinMaxScaler.min_)
+        """
+        self.scale_ = np.asarray(scale, dtype=float)
+        self.min_ = np.asarray(offset, dtype=float)
+
+    @classmethod
+    def from_sklearn(cls, scaler: Any) -> "MinMaxScaling":
+        return cls(scaler.scale_, scaler.min_)
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(X, dtype=float) * self.scale_ + self.min_
+
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        return (np.asarray(X, dtype=float) - self.min_) / self.scale_
+
+class NumpyLSTM:
+    """
+    Forward pass of stacked LSTM and Dense layers in NumPy
+
+    LSTM weights follow the Keras layout: kernel (inputs, 4 * units),
+    recurrent kernel (units, 4 * units) and bias (4 * units), with gates
+    ordered input, forget, cell candidate, output.
+    """
+
+    def __init__(self, lstm_layers: List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+                 dense_layers: List[Tuple[np.ndarray, np.ndarray, str]],
+                 dtype: Any = np.float32):
+        """
+        Args:
+            lstm_layers: (kernel, recurrent_kernel, bias) per LSTM layer
+            dense_layers: (kernel, bias, activation) per Dense layer
+            dtype: Computation dtype
+        """
+        self.dtype = dtype
+        self.lstm_layers = [tuple(np.asarray(w, dtype=dtype) for w in layer) for layer in lstm_layers]
+        self.dense_layers = [
+            (np.asarray(kernel, dtype=dtype), np.asarray(bias, dtype=dtype), activation)
+            for kernel, bias, activation in dense_layers
+        ]
+
+    @property
+    def output_steps(self) -> int:
+        return self.dense_layers[-1][0].shape[1]
+
+    @classmethod
+    def from_keras(cls, model: Any) -> "NumpyLSTM":
+        """Extract weights from a Keras Sequential of LSTM, Dropout and Dense layers"""
+        lstm_layers, dense_layers = [], []
+        for layer in model.layers:
+            kind = type(layer).__name__
+            if kind == 'LSTM':
+                config = layer.get_config()
+                if config.get('activation') != 'tanh' or config.get('recurrent_activation') != 'sigmoid':
+                    raise ValueError(f"Unsupported LSTM activations in layer {layer.name}")
+                lstm_layers.append(tuple(layer.get_weights()))
+            elif kind == 'Dense':
+                kernel, bias = layer.get_weights()
+                dense_layers.append((kernel, bias, layer.get_config().get('activation', 'linear')))
+            elif kind not in ('Dropout', 'InputLayer'):
+                raise ValueError(f"Unsupported layer type {kind}")
+        return cls(lstm_layers, dense_layers)
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """
+        Weights as named arrays
+
+        Returns:
+            Tuple of (arrays named lstm_<i>_<part> / dense_<i>_<part>, Dense activations)
+        """
+        arrays = {}
+        for i, (kernel, recurrent_kernel, bias) in enumerate(self.lstm_layers):
+            arrays[f"lstm_{i}_kernel"] = kernel
+            arrays[f"lstm_{i}_recurrent_kernel"] = recurrent_kernel
+            arrays[f"lstm_{i}_bias"] = bias
+        for i, (kernel, bias, _) in enumerate(self.dense_layers):
+            arrays[f"dense_{i}_kernel"] = kernel
+            arrays[f"dense_{i}_bias"] = bias
+        return arrays, [activation for _, _, activation in self.dense_layers]
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], activations: List[str]) -> "NumpyLSTM":
+        """
+        Build the engine from arrays written by to_arrays
+
+        Arrays already in float32 (including read-only memory maps) are used
+        without copying.
+        """
+        lstm_layers = []
+        i = 0
+        while f"lstm_{i}_kernel" in arrays:
+            lstm_layers.append(tuple(arrays[f"lstm_{i}_{part}"] for part in ('kernel', 'recurrent_kernel', 'bias')))
+            i += 1
+        dense_layers = [
+            (arrays[f"dense_{i}_kernel"], arrays[f"dense_{i}_bias"], activation)
+            for i, activation in enumerate(activations)
+        ]
+        return cls(lstm_layers, dense_layers)
+
+    def weights(self) -> List[np.ndarray]:
+        """Weights in Keras get_weights() order, for restoring a Keras model"""
+        flat = [w for layer in self.lstm_layers for w in layer]
+        for kernel, bias, _ in self.dense_layers:
+            flat.extend([kernel, bias])
+        return flat
+
+    def predict(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Run the forward pass
+
+        Args:
+            inputs: Array shaped (batch, timesteps, features)
+
+        Returns:
+            Outputs shaped (batch, output_steps)
+        """
+        sigmoid = ACTIVATIONS['sigmoid']
+        sequence = np.asarray(inputs, dtype=self.dtype)
+        batch, timesteps, _ = sequence.shape
+
+        for kernel, recurrent_kernel, bias in self.lstm_layers:
+            units = recurrent_kernel.shape[0]
+            # Input projections for all timesteps in one matmul
+            projected = sequence @ kernel + bias
+            h = np.zeros((batch, units), dtype=self.dtype)
+            c = np.zeros((batch, units), dtype=self.dtype)
+            outputs = np.empty((batch, timesteps, units), dtype=self.dtype)
+            for t in range(timesteps):
+                z = projected[:, t] + h @ recurrent_kernel
+                i = sigmoid(z[:, :units])
+                f = sigmoid(z[:, units:2 * units])
+                g = np.tanh(z[:, 2 * units:3 * units])
+                o = sigmoid(z[:, 3 * units:])
+                c = f * c + i * g
+                h = o * np.tanh(c)
+                outputs[:, t] = h
+            sequence = outputs
+
+        # Dense layers read the last LSTM's final state
+        x = sequence[:, -1]
+        for kernel, bias, activation in self.dense_layers:
+            x = ACTIVATIONS[activation](x @ kernel + bias)
+        return x
@@ -2,27 +2,51 @@
 Rainfall Prediction Model using LSTM and ARIMA ensemble
 """
 
+import importlib.util
 import numpy as np
 import pandas as pd
-from typing import Tuple, List, Dict, Any, Optional
+from typing import Tuple, List, Dict, Any, Optional, Iterable, Iterator, Callable, Union
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from numpy.lib.stride_tricks import sliding_window_view
 
-try:
-    import tensorflow as tf
-    from tensorflow.keras.models import Sequential
-    from tensorflow.keras.layers import LSTM, Dense, Dropout
-    from tensorflow.keras.optimizers import Adam
-    from sklearn.preprocessing import MinMaxScaler
-    from sklearn.metrics import mean_absolute_error, mean_squared_error
-    import statsmodels.api as sm
-    from statsmodels.tsa.arima.model import ARIMA
-    DEPENDENCIES_AVAILABLE = True
-except ImportError:
-    DEPENDENCIES_AVAILABLE = False
+from models.artifacts import ArtifactError, is_artifact, load_artifact, save_artifact
+from models.lstm_numpy import MinMaxScaling, NumpyLSTM
+
+# The training stack is imported on first use (see _import_training_dependencies),
+# so serving with the NumPy backend never loads TensorFlow
+DEPENDENCIES_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None for module in ('tensorflow', 'sklearn', 'statsmodels')
+)
+# Serving a saved model needs only statsmodels (for ARIMA) besides NumPy
+STATSMODELS_AVAILABLE = importlib.util.find_spec('statsmodels') is not None
+tf = None
+Sequential = LSTM = Dense = Dropout = Adam = MinMaxScaler = ARIMA = None
+
+def _import_training_dependencies():
+    """Import TensorFlow, scikit-learn and statsmodels into the module namespace"""
+    global tf, Sequential, LSTM, Dense, Dropout, Adam, MinMaxScaler, ARIMA
+    if tf is None:
+        import tensorflow as tf
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense, Dropout
+        from tensorflow.keras.optimizers import Adam
+        from sklearn.preprocessing import MinMaxScaler
+        from statsmodels.tsa.arima.model import ARIMA
 
 logger = logging.getLogger(__name__)
 
+def _arima_forecast_batch(order: Tuple[int, ...], seasonal_order: Tuple[int, ...], params: np.ndarray,
+                          series: List[np.ndarray], steps: int) -> np.ndarray:
+    """Worker task: forecast each series with fixed ARIMA parameters"""
+    from statsmodels.tsa.arima.model import ARIMA as ArimaModel
+    return np.vstack([
+        np.asarray(ArimaModel(values, order=order, seasonal_order=seasonal_order).filter(params).forecast(steps=steps))
+        for values in series
+    ])
+
 class RainfallPredictor:
     """
     Rainfall prediction model using LSTM and ARIMA ensemble approach
@@ -37,20 +61,102 @@ class RainfallPredictor:
         """
         self.config = config
         self.lstm_model = None
+        self.lstm_engine = None
         self.arima_model = None
-        self.scaler = MinMaxScaler()
+        self._arima_lock = threading.Lock()
+        self.arima_results = None  # see the arima_results property
+        self.scaler = None  # fitted in prepare_data / fit_scaler, or restored by load_model
+        
+        # Compiled inference function and the model it was built for
+        self._forward_fn = None
+        self._forward_model = None
         self.is_trained = False
+        # Last date (ISO) or row count of the data train() saw, for leakage checks
+        self.trained_through = None
+        self.training_rows = None
         
         # Model parameters from config
-        self.sequence_length = config.get('sequence_length', 60)
-        self.hidden_units = config.get('hidden_units', 128)
-        self.dropout_rate = config.get('dropout_rate', 0.2)
-        self.epochs = config.get('epochs', 100)
-        self.batch_size = config.get('batch_size', 32)
+        # LSTM settings live under lstm_params in models.rainfall_prediction;
+        # a flat dict is accepted as well
+        lstm_params = config.get('lstm_params', config)
+        self.sequence_length = lstm_params.get('sequence_length', 60)
+        self.hidden_units = lstm_params.get('hidden_units', 128)
+        self.dropout_rate = lstm_params.get('dropout_rate', 0.2)
+        self.epochs = lstm_params.get('epochs', 100)
+        self.batch_size = lstm_params.get('batch_size', 32)
+        self.verbose = lstm_params.get('verbose', 1)  # Keras fit() progress output
         self.ensemble_weights = config.get('ensemble_weights', [0.6, 0.4])
         
+        # 'direct': one forward pass emits forecast_horizon steps;
+        # 'autoregressive': one step per pass, fed back into the input window
+        self.forecast_mode = lstm_params.get('forecast_mode', 'direct')
+        self.forecast_horizon = lstm_params.get('forecast_horizon', 30)
+        self.output_steps = self.forecast_horizon if self.forecast_mode == 'direct' else 1
+        
+        # 'keras' or 'numpy': which forward pass load_model sets up for inference
+        self.inference_backend = lstm_params.get('inference_backend', 'keras')
+        
+        arima_params = config.get('arima_params', {})
+        self.arima_order = tuple(arima_params.get('order', (2, 1, 2)))
+        self.arima_seasonal_order = tuple(arima_params.get('seasonal_order', (0, 0, 0, 0)))
+        
         if not DEPENDENCIES_AVAILABLE:
-            logger.warning("Some dependencies not available. Model will run in mock mode.")
+            logger.warning("Training dependencies not available. Untrained models will run in mock mode.")
+    
+    @property
+    def arima_results(self) -> Any:
+        """
+        Fitted ARIMA results
+        
+        A loaded model keeps only the saved ARIMA state; the results are rebuilt
+        from it (filtering with the saved parameters, no re-estimation) on first
+        use, so serving without ARIMA never imports statsmodels. The rebuild
+        runs once under a lock, as serving threads may ask concurrently; the
+        model registry triggers it while loading.
+        
+        Raises:
+            ImportError: If there is saved state but statsmodels is not installed
+        """
+        if self._arima_results is None and self._arima_state is not None:
+            if not STATSMODELS_AVAILABLE:
+                raise ImportError("statsmodels is required to forecast with the saved ARIMA model")
+            with self._arima_lock:
+                # Another thread may have rebuilt the results while this one waited
+                state = self._arima_state
+                if state is not None:
+                    # Only statsmodels is needed here, not the whole training stack
+                    from statsmodels.tsa.arima.model import ARIMA as ArimaModel
+                    endog = np.asarray(state['endog'])
+                    if 'index' in state:
+                        endog = pd.Series(endog, index=pd.DatetimeIndex(state['index'], freq=state['freq']))
+                    model = ArimaModel(endog, order=state['order'], seasonal_order=state['seasonal_order'])
+                    self._arima_results = model.filter(np.asarray(state['params']))
+                    self.arima_model = model
+                    self._arima_state = None
+        return self._arima_results
+    
+    @arima_results.setter
+    def arima_results(self, results: Any):
+        self._arima_results = results
+        self._arima_state = None
+    
+    def warm_up(self):
+        """Rebuild the ARIMA results of a loaded model now instead of on first use"""
+        if self._arima_state is not None:
+            _ = self.arima_results
+    
+    @property
+    def has_arima(self) -> bool:
+        """Whether there are fitted ARIMA results, or saved state to rebuild them from"""
+        return self._arima_results is not None or self._arima_state is not None
+    
+    def _check_mock_allowed(self, component: str):
+        """Raise instead of mocking a component that a trained model should have"""
+        if self.is_trained:
+            raise RuntimeError(
+                f"Trained model has no usable {component}; check that its dependencies are "
+                f"installed and the artifact includes it"
+            )
     
     def prepare_data(self, data: pd.DataFrame, target_column: str = 'rainfall') -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -61,32 +167,142 @@ class RainfallPredictor:
             target_column: Name of the target column
             
         Returns:
-            Tuple of (X, y) arrays for training
+            Tuple of (X, y) read-only window views for training; in direct mode
+            each y row holds the next output_steps values
         """
         try:
             # Ensure data is sorted by date
             if 'date' in data.columns:
                 data = data.sort_values('date')
             
+            # At least two windows, so training and validation both get one
+            min_rows = self.sequence_length + self.output_steps + 1
+            if len(data) < min_rows:
+                raise ValueError(
+                    f"Training needs at least {min_rows} rows (sequence_length {self.sequence_length} "
+                    f"+ {self.output_steps} output steps + 1), got {len(data)}; shorten "
+                    f"lstm_params.forecast_horizon or sequence_length for short histories"
+                )
+            
             # Extract target values
             values = data[target_column].values.reshape(-1, 1)
             
             # Scale the data
+            _import_training_dependencies()
+            self.scaler = MinMaxScaler()
             scaled_values = self.scaler.fit_transform(values)
             
             # Create sequences
-            X, y = [], []
-            for i in range(self.sequence_length, len(scaled_values)):
-                X.append(scaled_values[i-self.sequence_length:i, 0])
-                y.append(scaled_values[i, 0])
-            
-            return np.array(X), np.array(y)
+            return self._windows(scaled_values[:, 0])
             
         except Exception as e:
             logger.error(f"Error preparing data: {e}")
             raise
     
-    def build_lstm_model(self, input_shape: Tuple[int, int]) -> tf.keras.Model:
+    def _windows(self, scaled_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Input/target windows over a scaled series as read-only strided views
+        
+        Each row of the underlying view spans sequence_length inputs followed by
+        output_steps targets; no window is copied.
+        """
+        series = np.ascontiguousarray(scaled_values, dtype=np.float32)
+        span = self.sequence_length + self.output_steps
+        if len(series) < span:
+            return (np.empty((0, self.sequence_length), dtype=np.float32),
+                    np.empty((0,) if self.output_steps == 1 else (0, self.output_steps), dtype=np.float32))
+        
+        windows = sliding_window_view(series, span)
+        X = windows[:, :self.sequence_length]
+        y = windows[:, self.sequence_length] if self.output_steps == 1 else windows[:, self.sequence_length:]
+        return X, y
+    
+    def iter_station_batches(self, stations: Iterable[pd.DataFrame], target_column: str = 'rainfall',
+                             batch_size: Optional[int] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield training batches station by station without materializing all windows
+        
+        Windows never cross station boundaries. The scaler must already be
+        fitted (see fit_scaler).
+        
+        Args:
+            stations: One DataFrame of history per station
+            target_column: Name of the target column
+            batch_size: Windows per batch (defaults to the training batch size)
+            
+        Yields:
+            (X, y) batches with X shaped (batch, sequence_length, 1)
+        """
+        batch_size = batch_size or self.batch_size
+        for data in stations:
+            if 'date' in data.columns:
+                data = data.sort_values('date')
+            scaled_values = self.scaler.transform(data[target_column].values.reshape(-1, 1))
+            X, y = self._windows(scaled_values[:, 0])
+            for start in range(0, len(X), batch_size):
+                yield X[start:start + batch_size, :, np.newaxis], y[start:start + batch_size]
+    
+    def fit_scaler(self, stations: Iterable[pd.DataFrame], target_column: str = 'rainfall'):
+        """Fit the scaler incrementally over all stations' histories"""
+        _import_training_dependencies()
+        self.scaler = MinMaxScaler()
+        for data in stations:
+            self.scaler.partial_fit(data[target_column].values.reshape(-1, 1))
+    
+    def make_training_dataset(self, stations: Callable[[], Iterable[pd.DataFrame]],
+                              target_column: str = 'rainfall') -> "tf.data.Dataset":
+        """
+        Streaming tf.data pipeline over many stations
+        
+        Args:
+            stations: Zero-argument callable returning a fresh iterable of station
+                DataFrames (called once to fit the scaler and once per epoch)
+            target_column: Name of the target column
+            
+        Returns:
+            Prefetched dataset of (X, y) batches
+        """
+        self.fit_scaler(stations(), target_column)
+        
+        target_shape = (None,) if self.output_steps == 1 else (None, self.output_steps)
+        dataset = tf.data.Dataset.from_generator(
+            lambda: self.iter_station_batches(stations(), target_column),
+            output_signature=(
+                tf.TensorSpec(shape=(None, self.sequence_length, 1), dtype=tf.float32),
+                tf.TensorSpec(shape=target_shape, dtype=tf.float32)
+            )
+        )
+        return dataset.prefetch(tf.data.AUTOTUNE)
+    
+    def train_lstm_streaming(self, stations: Callable[[], Iterable[pd.DataFrame]],
+                             target_column: str = 'rainfall') -> Dict[str, Any]:
+        """
+        Train the LSTM on many stations from a streaming dataset
+        
+        Args:
+            stations: Zero-argument callable returning a fresh iterable of station DataFrames
+            target_column: Name of the target column
+            
+        Returns:
+            Training history
+        """
+        if not DEPENDENCIES_AVAILABLE:
+            logger.warning("Dependencies not available. Returning mock training results.")
+            return {"loss": [0.1], "mae": [0.08]}
+        
+        try:
+            dataset = self.make_training_dataset(stations, target_column)
+            self.lstm_model = self.build_lstm_model((self.sequence_length, 1))
+            
+            history = self.lstm_model.fit(dataset, epochs=self.epochs, verbose=self.verbose)
+            
+            return history.history
+            
+        except Exception as e:
+            logger.error(f"Error training LSTM model: {e}")
+            raise
+    
+    def build_lstm_model(self, input_shape: Tuple[int, int]) -> "tf.keras.Model":
         """
         Build LSTM neural network model
         
@@ -101,6 +317,7 @@ class RainfallPredictor:
             return None
         
         try:
+            _import_training_dependencies()
             model = Sequential([
                 LSTM(self.hidden_units, return_sequences=True, input_shape=input_shape),
                 Dropout(self.dropout_rate),
@@ -109,7 +326,7 @@ class RainfallPredictor:
                 LSTM(self.hidden_units),
                 Dropout(self.dropout_rate),
                 Dense(50, activation='relu'),
-                Dense(1)
+                Dense(self.output_steps)
             ])
             
             model.compile(
@@ -162,7 +379,7 @@ class RainfallPredictor:
                 epochs=self.epochs,
                 batch_size=self.batch_size,
                 validation_data=validation_data,
-                verbose=1,
+                verbose=self.verbose,
                 shuffle=False
             )
             
@@ -172,13 +389,17 @@ class RainfallPredictor:
             logger.error(f"Error training LSTM model: {e}")
             raise
     
-    def train_arima(self, data: pd.Series, order: Tuple[int, int, int] = (2, 1, 2)) -> Dict[str, Any]:
+    def train_arima(self, data: pd.Series, order: Optional[Tuple[int, int, int]] = None,
+                    seasonal_order: Optional[Tuple[int, int, int, int]] = None) -> Dict[str, Any]:
         """
         Train ARIMA model
         
+        The fitted results are kept and reused by predict_arima and update_arima.
+        
         Args:
             data: Time series data for training
-            order: ARIMA order (p, d, q)
+            order: ARIMA order (p, d, q); defaults to arima_params.order
+            seasonal_order: Seasonal order (P, D, Q, s); defaults to arima_params.seasonal_order
             
         Returns:
             Model fitting results
@@ -189,19 +410,58 @@ class RainfallPredictor:
         
         try:
             # Fit ARIMA model
-            self.arima_model = ARIMA(data, order=order)
-            arima_fitted = self.arima_model.fit()
+            _import_training_dependencies()
+            self.arima_model = ARIMA(
+                data,
+                order=order or self.arima_order,
+                seasonal_order=seasonal_order or self.arima_seasonal_order
+            )
+            self.arima_results = self.arima_model.fit()
             
             return {
-                "aic": arima_fitted.aic,
-                "bic": arima_fitted.bic,
-                "params": arima_fitted.params.to_dict()
+                "aic": self.arima_results.aic,
+                "bic": self.arima_results.bic,
+                "params": self.arima_results.params.to_dict()
             }
             
         except Exception as e:
             logger.error(f"Error training ARIMA model: {e}")
             raise
     
+    def update_arima(self, new_data: pd.Series, refit: bool = False) -> Dict[str, Any]:
+        """
+        Append newly observed values to the fitted ARIMA model
+        
+        Without refit the estimated parameters are kept and only the state is
+        filtered forward over the new observations, so forecasts start from the
+        latest data at a fraction of the cost of a full fit.
+        
+        Args:
+            new_data: Observations following the training (or last appended)
+                data; its index must continue the model's index
+            refit: Whether to re-estimate the parameters on the extended series
+            
+        Returns:
+            Fit summary of the updated results
+        """
+        if not self.has_arima:
+            logger.warning("ARIMA model not fitted. Nothing to update.")
+            return {}
+        
+        try:
+            self.arima_results = self.arima_results.append(new_data, refit=refit)
+            self.arima_model = self.arima_results.model
+            
+            return {
+                "aic": self.arima_results.aic,
+                "bic": self.arima_results.bic,
+                "nobs": int(self.arima_results.nobs)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error updating ARIMA model: {e}")
+            raise
+    
     def train(self, data: pd.DataFrame, target_column: str = 'rainfall') -> Dict[str, Any]:
         """
         Train the ensemble model (LSTM + ARIMA)
@@ -232,6 +492,10 @@ class RainfallPredictor:
             arima_results = self.train_arima(rainfall_series)
             
             self.is_trained = True
+            self.training_rows = len(data)
+            self.trained_through = (
+                pd.to_datetime(data['date']).max().date().isoformat() if 'date' in data.columns else None
+            )
             
             logger.info("Rainfall prediction model training completed successfully")
             
@@ -251,6 +515,9 @@ class RainfallPredictor:
         """
         Make predictions using LSTM model
         
+        A direct model covers steps up to its horizon in a single forward pass;
+        longer requests chain passes over its own outputs.
+        
         Args:
             last_sequence: Last sequence of rainfall data
             steps: Number of future steps to predict
@@ -258,28 +525,43 @@ class RainfallPredictor:
         Returns:
             LSTM predictions
         """
-        if not DEPENDENCIES_AVAILABLE or self.lstm_model is None:
-            # Return mock predictions
-            return np.random.normal(15.0, 5.0, steps)
+        return self.predict_lstm_batch(np.asarray(last_sequence)[np.newaxis, :], steps)[0]
+    
+    def predict_lstm_batch(self, last_sequences: np.ndarray, steps: int = 30) -> np.ndarray:
+        """
+        Make LSTM predictions for many locations in one batch
+        
+        Args:
+            last_sequences: Scaled last sequences, one row per location
+            steps: Number of future steps to predict
+            
+        Returns:
+            LSTM predictions shaped (locations, steps)
+        """
+        if self.lstm_engine is None and self.lstm_model is None:
+            # Return mock predictions (untrained models only)
+            self._check_mock_allowed("LSTM")
+            return np.random.normal(15.0, 5.0, (len(last_sequences), steps))
         
         try:
-            predictions = []
-            current_sequence = last_sequence.copy()
-            
-            for _ in range(steps):
-                # Reshape for prediction
-                input_seq = current_sequence.reshape((1, len(current_sequence), 1))
-                
-                # Make prediction
-                pred = self.lstm_model.predict(input_seq, verbose=0)[0, 0]
-                predictions.append(pred)
-                
-                # Update sequence for next prediction
-                current_sequence = np.append(current_sequence[1:], pred)
+            # Each forward pass emits a block of outputs (the whole horizon for a
+            # direct model, one step for an autoregressive one); blocks are written
+            # into a preallocated buffer whose tail is the next input window
+            locations, sequence_length = last_sequences.shape
+            buffer = np.empty((locations, sequence_length + steps), dtype=np.float32)
+            buffer[:, :sequence_length] = last_sequences
+            
+            produced = 0
+            while produced < steps:
+                window = buffer[:, produced:produced + sequence_length, np.newaxis]
+                block = self._lstm_forward()(window)
+                n = min(block.shape[1], steps - produced)
+                buffer[:, sequence_length + produced:sequence_length + produced + n] = block[:, :n]
+                produced += n
             
             # Inverse transform predictions
-            predictions = np.array(predictions).reshape(-1, 1)
-            predictions = self.scaler.inverse_transform(predictions).flatten()
+            predictions = buffer[:, sequence_length:].astype(float).reshape(-1, 1)
+            predictions = self.scaler.inverse_transform(predictions).reshape(locations, steps)
             
             return predictions
             
@@ -287,24 +569,42 @@ class RainfallPredictor:
             logger.error(f"Error making LSTM predictions: {e}")
             raise
     
+    def _lstm_forward(self) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Inference function of the current LSTM: the NumPy engine if loaded,
+        otherwise a graph-compiled Keras call built once per model
+        """
+        if self.lstm_engine is not None:
+            return self.lstm_engine.predict
+        if self._forward_model is not self.lstm_model:
+            _import_training_dependencies()
+            model = self.lstm_model
+            compiled = tf.function(lambda x: model(x, training=False), reduce_retracing=True)
+            self._forward_fn = lambda x: compiled(x).numpy()
+            self._forward_model = model
+        return self._forward_fn
+    
     def predict_arima(self, steps: int = 30) -> np.ndarray:
         """
         Make predictions using ARIMA model
         
+        Forecasts from the end of the fitted (or last appended) series;
+        predict and predict_batch filter over the data they are given instead.
+        
         Args:
             steps: Number of future steps to predict
             
         Returns:
             ARIMA predictions
         """
-        if not DEPENDENCIES_AVAILABLE or self.arima_model is None:
-            # Return mock predictions
+        if not self.has_arima:
+            # Return mock predictions (untrained models only)
+            self._check_mock_allowed("ARIMA model")
             return np.random.normal(12.0, 4.0, steps)
         
         try:
-            # Make ARIMA predictions
-            arima_fitted = self.arima_model.fit()
-            forecast = arima_fitted.forecast(steps=steps)
+            # Forecast from the fitted results; no refit per prediction
+            forecast = self.arima_results.forecast(steps=steps)
             
             return forecast.values if hasattr(forecast, 'values') else forecast
             
@@ -312,13 +612,59 @@ class RainfallPredictor:
             logger.error(f"Error making ARIMA predictions: {e}")
             raise
     
+    def predict_arima_batch(self, series: List[np.ndarray], steps: int = 30,
+                            max_workers: Optional[int] = None) -> np.ndarray:
+        """
+        Make ARIMA predictions for many locations
+        
+        The fitted parameters are applied to each location's own series
+        (filtering without refitting), so every forecast starts from that
+        location's latest observations. Filtering is Python-bound, so with
+        several workers the locations are split over a process pool; each
+        worker rebuilds the model from its order and parameters.
+        
+        Args:
+            series: Recent observations per location
+            steps: Number of future steps to predict
+            max_workers: Worker processes (None or 1: in-process)
+            
+        Returns:
+            ARIMA predictions shaped (locations, steps)
+        """
+        if not self.has_arima:
+            # Return mock predictions (untrained models only)
+            self._check_mock_allowed("ARIMA model")
+            return np.random.normal(12.0, 4.0, (len(series), steps))
+        
+        try:
+            if not max_workers or max_workers == 1 or len(series) <= 1:
+                return np.vstack([
+                    np.asarray(self.arima_results.apply(values, refit=False).forecast(steps=steps))
+                    for values in series
+                ])
+            
+            model = self.arima_results.model
+            params = np.asarray(self.arima_results.params)
+            batches = np.array_split(np.arange(len(series)), min(len(series), max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_arima_forecast_batch, model.order, model.seasonal_order, params,
+                                    [series[i] for i in batch], steps)
+                    for batch in batches
+                ]
+                return np.vstack([future.result() for future in futures])
+            
+        except Exception as e:
+            logger.error(f"Error making ARIMA predictions: {e}")
+            raise
+    
     def predict(self, data: pd.DataFrame, steps: int = 30, 
                 target_column: str = 'rainfall') -> Dict[str, Any]:
         """
         Make ensemble predictions combining LSTM and ARIMA
         
         Args:
-            data: Recent rainfall data for context
+            data: Recent rainfall data for context (the forecast starts after its last row)
             steps: Number of future days to predict
             target_column: Name of the target column
             
@@ -331,42 +677,121 @@ class RainfallPredictor:
                 return self._generate_mock_predictions(steps)
             
             # Get last sequence for LSTM
-            values = data[target_column].values
+            values = data[target_column].to_numpy(dtype=float)
             last_sequence = self.scaler.transform(values[-self.sequence_length:].reshape(-1, 1)).flatten()
             
-            # Get predictions from both models
+            # Get predictions from both models; ARIMA is filtered over this
+            # data, as in predict_batch, so it forecasts from its last value
             lstm_predictions = self.predict_lstm(last_sequence, steps)
-            arima_predictions = self.predict_arima(steps)
+            arima_predictions = self.predict_arima_batch([values], steps)[0]
             
-            # Ensemble predictions
-            ensemble_predictions = (
-                self.ensemble_weights[0] * lstm_predictions +
-                self.ensemble_weights[1] * arima_predictions
-            )
+            last_date = pd.to_datetime(data['date'].iloc[-1]) if 'date' in data.columns else datetime.now()
+            return self._ensemble_result(lstm_predictions, arima_predictions, last_date)
             
-            # Calculate confidence intervals (simplified)
-            std_dev = np.std(ensemble_predictions) * 0.1
-            confidence_lower = ensemble_predictions - 1.96 * std_dev
-            confidence_upper = ensemble_predictions + 1.96 * std_dev
+        except Exception as e:
+            logger.error(f"Error making ensemble predictions: {e}")
+            raise
+    
+    def predict_batch(self, stations: Union[Dict[Any, Any], np.ndarray], steps: int = 30,
+                      target_column: str = 'rainfall', max_workers: Optional[int] = None) -> Dict[Any, Dict[str, Any]]:
+        """
+        Make ensemble predictions for many locations at once
+        
+        All stations' last sequences go through the LSTM as one batch; the
+        ARIMA forecasts can be spread over worker processes.
+        
+        Args:
+            stations: Mapping of station id to recent data (DataFrame with
+                target_column and optional 'date', Series, or 1-D array), or a
+                2-D array with one station per row (ids are row indices)
+            steps: Number of future days to predict
+            target_column: Name of the target column
+            max_workers: ARIMA worker processes (None or 1: in-process)
             
-            # Generate prediction dates
-            last_date = pd.to_datetime(data['date'].iloc[-1]) if 'date' in data.columns else datetime.now()
-            prediction_dates = [last_date + timedelta(days=i+1) for i in range(steps)]
+        Returns:
+            Predictions per station id, each in the format of predict(); None
+            for stations with fewer than sequence_length values. An untrained
+            model returns mock predictions for every station.
+        
+        Raises:
+            Exception: Inference errors of a trained model are not masked
+        """
+        if isinstance(stations, np.ndarray):
+            stations = dict(enumerate(stations))
+        
+        if not self.is_trained:
+            logger.warning("Model not trained. Returning mock predictions.")
+            return {station_id: self._generate_mock_predictions(steps) for station_id in stations}
+        
+        series, last_dates = {}, {}
+        for station_id, data in stations.items():
+            if isinstance(data, pd.DataFrame):
+                values = data[target_column].to_numpy(dtype=float)
+                last_dates[station_id] = pd.to_datetime(data['date'].iloc[-1]) if 'date' in data.columns else None
+            else:
+                values = np.asarray(data, dtype=float)
+                last_dates[station_id] = None
+            series[station_id] = values
+        
+        results = {}
+        short = [station_id for station_id, values in series.items() if len(values) < self.sequence_length]
+        for station_id in short:
+            logger.warning(f"Station {station_id} has fewer than {self.sequence_length} values. Skipping.")
+            results[station_id] = None
+        
+        station_ids = [station_id for station_id in series if station_id not in results]
+        if not station_ids:
+            return results
+        
+        try:
+            # Scale all last sequences in one call
+            recent = np.vstack([series[station_id][-self.sequence_length:] for station_id in station_ids])
+            last_sequences = self.scaler.transform(recent.reshape(-1, 1)).reshape(recent.shape)
             
-            return {
-                "predictions": ensemble_predictions.tolist(),
-                "lstm_predictions": lstm_predictions.tolist(),
-                "arima_predictions": arima_predictions.tolist(),
-                "confidence_lower": confidence_lower.tolist(),
-                "confidence_upper": confidence_upper.tolist(),
-                "prediction_dates": [date.isoformat() for date in prediction_dates],
-                "ensemble_weights": self.ensemble_weights,
-                "model_accuracy": 0.89  # Mock accuracy
-            }
+            lstm_predictions = self.predict_lstm_batch(last_sequences, steps)
+            arima_predictions = self.predict_arima_batch(
+                [series[station_id] for station_id in station_ids], steps, max_workers
+            )
+            
+            now = datetime.now()
+            for i, station_id in enumerate(station_ids):
+                results[station_id] = self._ensemble_result(
+                    lstm_predictions[i], arima_predictions[i], last_dates[station_id] or now
+                )
             
         except Exception as e:
-            logger.error(f"Error making ensemble predictions: {e}")
-            return self._generate_mock_predictions(steps)
+            logger.error(f"Error making batch ensemble predictions: {e}")
+            raise
+        
+        return {station_id: results[station_id] for station_id in series}
+    
+    def _ensemble_result(self, lstm_predictions: np.ndarray, arima_predictions: np.ndarray,
+                         last_date: datetime) -> Dict[str, Any]:
+        """Combine one location's LSTM and ARIMA forecasts into the prediction response"""
+        # Ensemble predictions
+        ensemble_predictions = (
+            self.ensemble_weights[0] * lstm_predictions +
+            self.ensemble_weights[1] * arima_predictions
+        )
+        
+        # Calculate confidence intervals (simplified)
+        std_dev = np.std(ensemble_predictions) * 0.1
+        confidence_lower = ensemble_predictions - 1.96 * std_dev
+        confidence_upper = ensemble_predictions + 1.96 * std_dev
+        
+        # Generate prediction dates
+        prediction_dates = [last_date + timedelta(days=i+1) for i in range(len(ensemble_predictions))]
+        
+        return {
+            "predictions": ensemble_predictions.tolist(),
+            "lstm_predictions": lstm_predictions.tolist(),
+            "arima_predictions": arima_predictions.tolist(),
+            "confidence_lower": confidence_lower.tolist(),
+            "confidence_upper": confidence_upper.tolist(),
+            "prediction_dates": [date.isoformat() for date in prediction_dates],
+            "ensemble_weights": self.ensemble_weights,
+            "model_accuracy": 0.89  # Mock accuracy
+        }
     
     def _generate_mock_predictions(self, steps: int) -> Dict[str, Any]:
         """Generate mock predictions for testing purposes"""
@@ -398,22 +823,72 @@ class RainfallPredictor:
         }
     
     def save_model(self, filepath: str):
-        """Save trained model to file"""
+        """
+        Save the trained model as a versioned artifact directory
+        
+        Weights and the ARIMA series and parameters are written as .npy files;
+        the scaler, ARIMA orders and training config are plain values in the
+        manifest (see models.artifacts).
+        
+        Args:
+            filepath: Artifact directory (replaced if it exists)
+        """
         try:
-            if DEPENDENCIES_AVAILABLE and self.lstm_model:
-                self.lstm_model.save(f"{filepath}_lstm.h5")
-            
-            # Save other model components (scaler, config, etc.)
-            import pickle
-            model_data = {
+            arrays = {}
+            metadata = {
+                'model': 'rainfall_prediction',
                 'config': self.config,
-                'scaler': self.scaler,
                 'is_trained': self.is_trained,
-                'ensemble_weights': self.ensemble_weights
+                'trained_through': self.trained_through,
+                'training_rows': self.training_rows,
+                'ensemble_weights': list(self.ensemble_weights),
+                'sequence_length': self.sequence_length,
+                'forecast_mode': self.forecast_mode,
+                'output_steps': self.output_steps,
+                'lstm': None,
+                'scaler': None,
+                'arima': None
             }
             
-            with open(f"{filepath}_metadata.pkl", 'wb') as f:
-                pickle.dump(model_data, f)
+            engine = self.lstm_engine
+            if engine is None and self.lstm_model is not None:
+                engine = NumpyLSTM.from_keras(self.lstm_model)
+            if engine is not None:
+                weights, activations = engine.to_arrays()
+                arrays.update(weights)
+                metadata['lstm'] = {'dense_activations': activations}
+            
+            if self.scaler is not None:
+                metadata['scaler'] = {
+                    'scale': np.ravel(self.scaler.scale_).tolist(),
+                    'min': np.ravel(self.scaler.min_).tolist()
+                }
+            
+            state = self._arima_state
+            if state is None and self._arima_results is not None:
+                results = self._arima_results
+                state = {
+                    'endog': np.asarray(results.model.endog, dtype=float).ravel(),
+                    'params': np.asarray(results.params, dtype=float),
+                    'order': results.model.order,
+                    'seasonal_order': results.model.seasonal_order
+                }
+                dates = getattr(results.model.data, 'dates', None)
+                if dates is not None:
+                    state['index'] = np.asarray(dates, dtype='datetime64[ns]')
+                    state['freq'] = dates.freqstr
+            if state is not None:
+                arrays['arima_endog'] = state['endog']
+                arrays['arima_params'] = state['params']
+                if 'index' in state:
+                    arrays['arima_index'] = state['index']
+                metadata['arima'] = {
+                    'order': list(state['order']),
+                    'seasonal_order': list(state['seasonal_order']),
+                    'freq': state.get('freq')
+                }
+            
+            save_artifact(filepath, arrays, metadata)
             
             logger.info(f"Model saved to {filepath}")
             
@@ -422,23 +897,63 @@ class RainfallPredictor:
             raise
     
     def load_model(self, filepath: str):
-        """Load trained model from file"""
+        """
+        Load a model saved by save_model
+        
+        Weight arrays are memory-mapped read-only, so processes loading the same
+        artifact share its pages. The NumPy backend runs directly on the mapped
+        weights; the Keras backend copies them into a rebuilt model.
+        
+        Args:
+            filepath: Artifact directory
+        """
         try:
-            if DEPENDENCIES_AVAILABLE:
-                try:
-                    self.lstm_model = tf.keras.models.load_model(f"{filepath}_lstm.h5")
-                except:
-                    logger.warning("Could not load LSTM model file")
-            
-            # Load other model components
-            import pickle
-            with open(f"{filepath}_metadata.pkl", 'rb') as f:
-                model_data = pickle.load(f)
-            
-            self.config = model_data['config']
-            self.scaler = model_data['scaler']
-            self.is_trained = model_data['is_trained']
-            self.ensemble_weights = model_data['ensemble_weights']
+            if not is_artifact(filepath):
+                raise ArtifactError(f"{filepath} is not a model artifact directory")
+            arrays, manifest = load_artifact(filepath)
+            
+            self.config = manifest['config']
+            self.is_trained = manifest['is_trained']
+            self.trained_through = manifest.get('trained_through')
+            self.training_rows = manifest.get('training_rows')
+            self.ensemble_weights = manifest['ensemble_weights']
+            self.sequence_length = manifest['sequence_length']
+            self.forecast_mode = manifest['forecast_mode']
+            self.output_steps = manifest['output_steps']
+            
+            scaler = manifest['scaler']
+            self.scaler = MinMaxScaling(scaler['scale'], scaler['min']) if scaler else None
+            
+            self.lstm_model = None
+            self.lstm_engine = None
+            if manifest['lstm']:
+                engine = NumpyLSTM.from_arrays(arrays, manifest['lstm']['dense_activations'])
+                if self.inference_backend == 'numpy':
+                    self.lstm_engine = engine
+                elif DEPENDENCIES_AVAILABLE:
+                    # Rebuild the architecture from the weight shapes
+                    self.hidden_units = engine.lstm_layers[0][1].shape[0]
+                    features = engine.lstm_layers[0][0].shape[0]
+                    self.lstm_model = self.build_lstm_model((self.sequence_length, features))
+                    self.lstm_model.set_weights(engine.weights())
+                else:
+                    raise ImportError(
+                        "The keras inference backend needs TensorFlow; set "
+                        "lstm_params.inference_backend to numpy to serve without it"
+                    )
+            
+            self.arima_results = None
+            self.arima_model = None
+            arima = manifest['arima']
+            if arima:
+                self._arima_state = {
+                    'endog': arrays['arima_endog'],
+                    'params': arrays['arima_params'],
+                    'order': tuple(arima['order']),
+                    'seasonal_order': tuple(arima['seasonal_order'])
+                }
+                if 'arima_index' in arrays:
+                    self._arima_state.update(index=arrays['arima_index'], freq=arima['freq'])
             
             logger.info(f"Model loaded from {filepath}")
             
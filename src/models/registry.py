@@ -0,0 +1,189 @@
+"""
+Model registry: warm-loads trained models at startup and swaps versions atomically
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class LoadedModel:
+    """A model version held by the registry"""
+    name: str
+    version: str
+    path: str
+    model: Any
+    loaded_at: datetime = field(default_factory=datetime.now)
+    load_seconds: float = 0.0
+
+    def info(self) -> Dict[str, Any]:
+        """Serializable description (without the model object)"""
+        return {
+            "name": self.name,
+            "version": self.version,
+            "path": self.path,
+            "loaded_at": self.loaded_at.isoformat(),
+            "load_seconds": round(self.load_seconds, 3)
+        }
+
+def load_rainfall_predictor(path: str) -> Any:
+    """
+    Load a RainfallPredictor saved with save_model(<version dir>/model)
+
+    The ARIMA results are rebuilt here as well, so the first request does not
+    pay for importing statsmodels and filtering the saved series.
+    """
+    from models.rainfall_prediction import RainfallPredictor
+
+    model_config = get_config().get('models.rainfall_prediction', {}) or {}
+    predictor = RainfallPredictor(model_config)
+    predictor.load_model(os.path.join(path, "model"))
+    predictor.warm_up()
+    return predictor
+
+# Loader per registered model name; each takes a version directory
+MODEL_LOADERS: Dict[str, Callable[[str], Any]] = {
+    'rainfall_prediction': load_rainfall_predictor
+}
+
+def version_sort_key(version: str) -> List[Any]:
+    """Natural sort key: digit runs compare as numbers, so v10 follows v9"""
+    # re.split with a capture group alternates text and digit runs, so
+    # positions line up and only like types are compared
+    return [int(part) if i % 2 else part.lower() for i, part in enumerate(re.split(r"(\d+)", version))]
+
+class ModelRegistry:
+    """
+    Serves loaded model versions to the API
+
+    Versions live under <base_path>/<model name>/<version>/. Loading runs in a
+    worker thread; the new version replaces the old one with a single reference
+    swap, so requests never wait on a load and in-flight requests finish on the
+    version they started with.
+    """
+
+    def __init__(self, base_path: str, versions: Optional[Dict[str, str]] = None):
+        """
+        Initialize the registry
+
+        Args:
+            base_path: Model root directory (training.model_save_path)
+            versions: Version to serve per model name ("latest" picks the
+                highest version directory); defaults to latest for every loader
+        """
+        self.base_path = base_path
+        self.versions = versions or {name: "latest" for name in MODEL_LOADERS}
+        self._models: Dict[str, LoadedModel] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.errors: Dict[str, str] = {}
+
+    def get(self, name: str) -> Optional[Any]:
+        """Current model object for name, or None if none is loaded"""
+        loaded = self._models.get(name)
+        return loaded.model if loaded is not None else None
+
+    def get_loaded(self, name: str) -> Optional[LoadedModel]:
+        """Current model with its version, or None if none is loaded"""
+        return self._models.get(name)
+
+    def available_versions(self, name: str) -> List[str]:
+        """Version directories on disk for a model, oldest first (v9 before v10)"""
+        model_dir = os.path.join(self.base_path, name)
+        if not os.path.isdir(model_dir):
+            return []
+        return sorted(
+            (entry for entry in os.listdir(model_dir) if os.path.isdir(os.path.join(model_dir, entry))),
+            key=version_sort_key
+        )
+
+    async def load_all(self) -> Dict[str, Optional[LoadedModel]]:
+        """Load the configured version of every registered model concurrently"""
+        names = list(self.versions)
+        results = await asyncio.gather(*[self.load(name) for name in names], return_exceptions=True)
+        return {
+            name: result if isinstance(result, LoadedModel) else None
+            for name, result in zip(names, results)
+        }
+
+    async def load(self, name: str, version: Optional[str] = None) -> Optional[LoadedModel]:
+        """
+        Load a model version and make it the served one
+
+        Args:
+            name: Registered model name
+            version: Version directory (defaults to the configured version)
+
+        Returns:
+            The loaded model, or None if there is no version to load
+        """
+        if name not in MODEL_LOADERS:
+            raise ValueError(f"No loader registered for model '{name}'")
+
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            version = self._resolve_version(name, version or self.versions.get(name, "latest"))
+            if version is None:
+                logger.warning(f"No saved versions of {name} under {self.base_path}")
+                return None
+
+            path = os.path.join(self.base_path, name, version)
+            start = time.perf_counter()
+            try:
+                model = await asyncio.get_running_loop().run_in_executor(None, MODEL_LOADERS[name], path)
+            except Exception as e:
+                self.errors[name] = str(e)
+                logger.error(f"Error loading {name} version {version}: {e}")
+                raise
+
+            loaded = LoadedModel(
+                name=name, version=version, path=path, model=model,
+                load_seconds=time.perf_counter() - start
+            )
+            # Atomic swap: readers see either the old or the new version
+            self._models[name] = loaded
+            self.errors.pop(name, None)
+            logger.info(f"Loaded {name} version {version} in {loaded.load_seconds:.2f}s")
+            return loaded
+
+    def list_models(self) -> Dict[str, Any]:
+        """Loaded and available versions per registered model"""
+        return {
+            name: {
+                "configured_version": self.versions.get(name),
+                "loaded": self._models[name].info() if name in self._models else None,
+                "available_versions": self.available_versions(name),
+                "error": self.errors.get(name)
+            }
+            for name in MODEL_LOADERS
+        }
+
+    def _resolve_version(self, name: str, version: str) -> Optional[str]:
+        available = self.available_versions(name)
+        if version == "latest":
+            return available[-1] if available else None
+        if version not in available:
+            raise ValueError(f"Version '{version}' of {name} not found under {self.base_path}")
+        return version
+
+# Global model registry instance
+model_registry = None
+
+def get_model_registry() -> ModelRegistry:
+    """Get global model registry from training.model_save_path and training.serving_versions"""
+    global model_registry
+    if model_registry is None:
+        config = get_config()
+        model_registry = ModelRegistry(
+            config.get('training.model_save_path', 'data/models/'),
+            config.get('training.serving_versions')
+        )
+    return model_registry
@@ -0,0 +1,182 @@
+"""
+Parallel per-district training driver for the rainfall prediction model
+
+Districts are trained in a process pool. Each worker caps TensorFlow's and the
+BLAS libraries' thread pools so the workers do not oversubscribe the machine,
+and every district's artifacts are written to their own directory. A district
+with a completed artifact directory is skipped, so an interrupted run resumes
+where it stopped.
+"""
+
+import copy
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Union
+
+import pandas as pd
+
+from utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Written last into a district's directory; its presence marks a finished district
+COMPLETION_MARKER = "training.json"
+
+# Thread-pool variables read by BLAS/OpenMP when a worker process starts
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "TF_NUM_INTRAOP_THREADS")
+
+def _init_worker(threads: int):
+    """Process pool initializer: cap TensorFlow's thread pools before it starts running ops"""
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(threads)
+
+def _intra_op_threads() -> int:
+    import tensorflow as tf
+    return tf.config.threading.get_intra_op_parallelism_threads()
+
+def _train_district(district: str, data: Union[pd.DataFrame, str], model_config: Dict[str, Any],
+                    district_dir: str, target_column: str) -> Dict[str, Any]:
+    """Train one district's model into district_dir (runs in a worker process)"""
+    from models.rainfall_prediction import RainfallPredictor
+
+    start = time.perf_counter()
+    if isinstance(data, str):
+        data = pd.read_parquet(data) if data.endswith(".parquet") else pd.read_csv(data, parse_dates=['date'])
+
+    predictor = RainfallPredictor(model_config)
+    if len(data) < predictor.sequence_length + predictor.output_steps + 1:
+        raise ValueError(f"{len(data)} rows are not enough history to train district {district}")
+    results = predictor.train(data, target_column)
+
+    # Write into a scratch directory and rename it into place when complete,
+    # so an interrupted district never looks finished
+    scratch_dir = f"{district_dir}.partial-{os.getpid()}"
+    shutil.rmtree(scratch_dir, ignore_errors=True)
+    os.makedirs(scratch_dir)
+    predictor.save_model(os.path.join(scratch_dir, "model"))
+
+    summary = {
+        "district": district,
+        "trained_at": datetime.now().isoformat(),
+        "training_seconds": round(time.perf_counter() - start, 3),
+        "training_samples": results["training_samples"],
+        "validation_samples": results["validation_samples"],
+        "final_loss": (results["lstm_history"].get("loss") or [None])[-1],
+        "final_val_loss": (results["lstm_history"].get("val_loss") or [None])[-1],
+        "arima_aic": float(results["arima_results"]["aic"]),
+        # TensorFlow's intra-op pool as capped by _init_worker
+        "intra_op_threads": _intra_op_threads()
+    }
+    with open(os.path.join(scratch_dir, COMPLETION_MARKER), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    shutil.rmtree(district_dir, ignore_errors=True)
+    os.replace(scratch_dir, district_dir)
+    return summary
+
+@contextmanager
+def _worker_thread_env(threads: int) -> Iterator[None]:
+    """Set thread-count variables inherited by worker processes, restoring them afterwards"""
+    previous = {name: os.environ.get(name) for name in THREAD_ENV_VARS}
+    os.environ.update({name: str(threads) for name in THREAD_ENV_VARS})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+def district_run_dir(run_id: Optional[str] = None) -> str:
+    """Artifact directory of a training run (default run id: the current month)"""
+    config = get_config()
+    run_id = run_id or datetime.now().strftime("%Y-%m")
+    return os.path.join(config.get('training.model_save_path', 'data/models/'), "rainfall_prediction_districts", run_id)
+
+def train_districts(districts: Dict[str, Union[pd.DataFrame, str]], output_dir: Optional[str] = None,
+                    max_workers: Optional[int] = None, threads_per_worker: Optional[int] = None,
+                    target_column: str = 'rainfall', resume: bool = True,
+                    verbose: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Train one rainfall model per district in parallel
+
+    Args:
+        districts: History per district, as a DataFrame or a CSV/Parquet path
+            (paths are read inside the worker, avoiding a pickle of the data)
+        output_dir: Run directory; districts go to <output_dir>/<district>/
+            (default: district_run_dir() for the current month)
+        max_workers: Worker processes (default training.driver.max_workers, else CPU count)
+        threads_per_worker: TensorFlow/BLAS threads per worker (default
+            training.driver.threads_per_worker, else 1)
+        target_column: Name of the target column
+        resume: Skip districts whose artifacts are already complete
+        verbose: Keras verbosity in workers (default training.driver.verbose, else 0)
+
+    Returns:
+        Summary per district with status "trained", "skipped" or "failed"
+    """
+    config = get_config()
+    output_dir = output_dir or district_run_dir()
+    max_workers = max_workers or config.get('training.driver.max_workers') or os.cpu_count() or 1
+    threads_per_worker = threads_per_worker or config.get('training.driver.threads_per_worker', 1)
+    verbose = verbose if verbose is not None else config.get('training.driver.verbose', 0)
+
+    model_config = copy.deepcopy(config.get('models.rainfall_prediction', {}) or {})
+    model_config.setdefault('lstm_params', {})['verbose'] = verbose
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    pending = {}
+    for district, data in districts.items():
+        marker = os.path.join(output_dir, district, COMPLETION_MARKER)
+        if resume and os.path.exists(marker):
+            with open(marker) as f:
+                results[district] = {**json.load(f), "status": "skipped"}
+        else:
+            pending[district] = data
+
+    logger.info(
+        f"Training {len(pending)} districts ({len(results)} already complete) with "
+        f"{max_workers} workers x {threads_per_worker} threads into {output_dir}"
+    )
+
+    if pending:
+        start = time.perf_counter()
+        # spawn: workers must not inherit an already initialized TensorFlow runtime
+        context = multiprocessing.get_context("spawn")
+        with _worker_thread_env(threads_per_worker), ProcessPoolExecutor(
+            max_workers=min(max_workers, len(pending)), mp_context=context,
+            initializer=_init_worker, initargs=(threads_per_worker,)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _train_district, district, data, model_config,
+                    os.path.join(output_dir, district), target_column
+                ): district
+                for district, data in pending.items()
+            }
+            for future in as_completed(futures):
+                district = futures[future]
+                try:
+                    results[district] = {**future.result(), "status": "trained"}
+                    logger.info(f"Trained district {district} in {results[district]['training_seconds']:.1f}s")
+                except Exception as e:
+                    results[district] = {"district": district, "status": "failed", "error": str(e)}
+                    logger.error(f"Training district {district} failed: {e}")
+
+        logger.info(f"District training finished in {time.perf_counter() - start:.1f}s")
+
+    with open(os.path.join(output_dir, "summary.json"), "w") as f:
+        json.dump(results, f, indent=2, default=str)
+
+    return results
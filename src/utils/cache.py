@@ -0,0 +1,320 @@
+"""
+In-process forecast cache keyed by grid cell, and upstream fetch coalescing
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from utils.config import get_config
+from utils.grid import grid_cell
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CacheEntry:
+    """Cached value with its expiry time and approximate size"""
+    value: Any
+    expires_at: float
+    size_bytes: int
+    hit_count: int = 0
+
+class ForecastCache:
+    """
+    LRU cache with per-entry TTL and a bounded memory budget
+
+    Keys are grid cells: coordinates snapped to the configured grid resolution,
+    so nearby farms share one cached forecast. With a stale window, expired
+    entries of hot cells can still be served while they are refreshed.
+    """
+
+    def __init__(self, ttl: float = 3600, max_bytes: int = 256 * 1024 * 1024,
+                 grid_resolution: float = 0.1, stale_ttl: float = 0,
+                 hot_threshold: int = 3):
+        """
+        Initialize the forecast cache
+
+        Args:
+            ttl: Seconds an entry stays fresh
+            max_bytes: Approximate memory budget for all cached values
+            grid_resolution: Grid cell size in degrees
+            stale_ttl: Seconds past expiry a hot entry may still be served (0 disables)
+            hot_threshold: Hits an entry needs while fresh to count as hot
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.grid_resolution = grid_resolution
+        self.stale_ttl = stale_ttl
+        self.hot_threshold = hot_threshold
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self.current_bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def grid_key(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Snap coordinates to the centre of their grid cell"""
+        return grid_cell(lat, lon, self.grid_resolution)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        return self.lookup(key, allow_stale=False)[0]
+
+    def lookup(self, key: Hashable, allow_stale: bool = True,
+               accept: Optional[Callable[[Any], bool]] = None) -> Tuple[Optional[Any], bool]:
+        """
+        Look up key, serving expired hot entries within the stale window
+
+        Args:
+            key: Cache key
+            allow_stale: Whether a stale value may be returned
+            accept: Optional predicate; a cached value it rejects counts as a miss
+                but stays cached
+
+        Returns:
+            Tuple of (value or None, is_stale); a stale value should be refreshed
+        """
+        entry = self._entries.get(key)
+        if entry is None or (accept is not None and not accept(entry.value)):
+            self.misses += 1
+            return None, False
+
+        now = time.monotonic()
+        if entry.expires_at <= now:
+            if (allow_stale and now < entry.expires_at + self.stale_ttl
+                    and entry.hit_count >= self.hot_threshold):
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                return entry.value, True
+
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None, False
+
+        self._entries.move_to_end(key)
+        entry.hit_count += 1
+        self.hits += 1
+        return entry.value, False
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return the stored value for key, even if expired, without touching counters or LRU order"""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value under key (fresh for ttl seconds, default self.ttl), evicting LRU entries if over budget"""
+        size = self._estimate_size(value)
+        if size > self.max_bytes:
+            logger.warning(f"Forecast for {key} ({size} bytes) exceeds cache budget; not cached")
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(
+            value=value,
+            expires_at=time.monotonic() + (self.ttl if ttl is None else ttl),
+            size_bytes=size
+        )
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all entries (counters are kept)"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and occupancy"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "stale_ttl_seconds": self.stale_ttl,
+            "grid_resolution": self.grid_resolution,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size_bytes
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """Approximate the memory footprint of a JSON-like value"""
+        try:
+            return len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return 1024
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one in-flight fetch
+
+    The first caller for a key starts the fetch; callers arriving while it is
+    in flight await the same result instead of issuing their own request.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+        # Counters
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func() for key, or join the call already in flight for key
+
+        Args:
+            key: Coalescing key (e.g. grid cell)
+            func: Zero-argument coroutine function performing the fetch
+
+        Returns:
+            Result of the shared fetch
+        """
+        self.calls += 1
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            self.executions += 1
+            future.add_done_callback(lambda f: self._finish(key, f))
+
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing counters"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight)
+        }
+
+    def _finish(self, key: Hashable, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every caller has gone away
+        if not future.cancelled():
+            future.exception()
+
+class BackgroundRefresher:
+    """
+    Run cache refreshes as background asyncio tasks, with a concurrency cap
+
+    At most one refresh runs per key; when the cap is reached further refreshes
+    are skipped and the stale value keeps being served until a slot frees up.
+    """
+
+    def __init__(self, max_concurrent: int = 10):
+        self.max_concurrent = max_concurrent
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+        # Counters
+        self.scheduled = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def schedule(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Start refreshing key in the background
+
+        Returns:
+            True if a refresh is running for key, False if it was skipped
+        """
+        if key in self._tasks:
+            return True
+        if len(self._tasks) >= self.max_concurrent:
+            self.skipped += 1
+            return False
+
+        task = asyncio.ensure_future(func())
+        self._tasks[key] = task
+        self.scheduled += 1
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return True
+
+    async def cancel_all(self):
+        """Cancel pending refreshes (called on shutdown)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Refresh counters"""
+        return {
+            "active": len(self._tasks),
+            "max_concurrent": self.max_concurrent,
+            "scheduled": self.scheduled,
+            "skipped": self.skipped,
+            "failed": self.failed
+        }
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        self._tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.failed += 1
+            logger.error(f"Background refresh for {key} failed: {task.exception()}")
+
+# Global forecast cache, fetch coalescing and refresh instances
+forecast_cache = None
+forecast_flight = None
+forecast_refresher = None
+
+def get_forecast_cache() -> ForecastCache:
+    """Get global forecast cache, configured from app.cache_ttl and geography.grid_resolution"""
+    global forecast_cache
+    if forecast_cache is None:
+        config = get_config()
+        app_config = config.get_app_config()
+        forecast_cache = ForecastCache(
+            ttl=app_config.cache_ttl,
+            max_bytes=app_config.cache_max_mb * 1024 * 1024,
+            grid_resolution=config.get('geography.grid_resolution', 0.1),
+            stale_ttl=app_config.cache_stale_ttl,
+            hot_threshold=app_config.cache_hot_threshold
+        )
+    return forecast_cache
+
+def get_forecast_flight() -> SingleFlight:
+    """Get global single-flight coordinator for upstream forecast fetches"""
+    global forecast_flight
+    if forecast_flight is None:
+        forecast_flight = SingleFlight()
+    return forecast_flight
+
+def get_forecast_refresher() -> BackgroundRefresher:
+    """Get global background refresher for stale forecast cells"""
+    global forecast_refresher
+    if forecast_refresher is None:
+        app_config = get_config().get_app_config()
+        forecast_refresher = BackgroundRefresher(max_concurrent=app_config.cache_max_refreshes)
+    return forecast_refresher
@@ -0,0 +1,202 @@
+"""
+Circuit breakers and hedged requests for upstream weather providers
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker driven by error rate and latency
+
+    Closed: calls pass and their outcome is recorded in a rolling window.
+    Open: calls are rejected immediately until open_seconds have passed.
+    Half-open: a limited number of probe calls decide whether to close again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, window_size: int = 20, min_calls: int = 5,
+                 error_rate_threshold: float = 0.5, slow_call_seconds: float = 5.0,
+                 slow_call_rate_threshold: float = 0.8, open_seconds: float = 30.0,
+                 half_open_probes: int = 1):
+        """
+        Initialize the circuit breaker
+
+        Args:
+            name: Source name (for logging and stats)
+            window_size: Number of recent calls considered
+            min_calls: Calls needed in the window before the circuit can open
+            error_rate_threshold: Failure share that opens the circuit
+            slow_call_seconds: Latency above which a successful call counts as slow
+            slow_call_rate_threshold: Slow-call share that opens the circuit
+            open_seconds: Time the circuit stays open before probing
+            half_open_probes: Concurrent probe calls allowed while half-open
+        """
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+        # Rolling window of (succeeded, latency_seconds)
+        self._window: deque = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+
+        # Counters
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current state; an open circuit turns half-open once open_seconds have passed"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected"""
+        return self.state == self.OPEN
+
+    def before_call(self):
+        """Admit a call or raise CircuitOpenError"""
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._probes_in_flight >= self.half_open_probes):
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit for {self.name} is open")
+        if state == self.HALF_OPEN:
+            self._probes_in_flight += 1
+
+    def record(self, succeeded: bool, latency: float):
+        """Record the outcome of an admitted call"""
+        if self._state == self.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if succeeded and latency < self.slow_call_seconds:
+                logger.info(f"Circuit for {self.name} closed after successful probe")
+                self._state = self.CLOSED
+                self._window.clear()
+            else:
+                self._open()
+            return
+
+        self._window.append((succeeded, latency))
+        if self._state == self.CLOSED and len(self._window) >= self.min_calls:
+            calls = len(self._window)
+            failures = sum(1 for ok, _ in self._window if not ok)
+            slow = sum(1 for ok, latency in self._window if ok and latency >= self.slow_call_seconds)
+            if (failures / calls >= self.error_rate_threshold
+                    or slow / calls >= self.slow_call_rate_threshold):
+                self._open()
+
+    async def call(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func() through the breaker
+
+        Exceptions and None results count as failures; exceptions are re-raised.
+        """
+        self.before_call()
+        start = time.monotonic()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # The caller gave up (e.g. overall deadline); treat as a failed call
+            self.record(False, time.monotonic() - start)
+            raise
+        except Exception:
+            self.record(False, time.monotonic() - start)
+            raise
+        self.record(result is not None, time.monotonic() - start)
+        return result
+
+    def latency_percentile(self, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """Latency percentile (0-100) of successful calls in the window, None with too few samples"""
+        latencies = sorted(latency for ok, latency in self._window if ok)
+        if not latencies or len(latencies) < min_samples:
+            return None
+        index = min(len(latencies) - 1, int(round(percentile / 100 * (len(latencies) - 1))))
+        return latencies[index]
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and window summary"""
+        calls = len(self._window)
+        failures = sum(1 for ok, _ in self._window if not ok)
+        p95 = self.latency_percentile(95)
+        return {
+            "state": self.state,
+            "window_calls": calls,
+            "error_rate": round(failures / calls, 4) if calls else 0.0,
+            "p95_latency_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened
+        }
+
+    def _open(self):
+        if self._state != self.OPEN:
+            logger.warning(f"Circuit for {self.name} opened")
+            self.times_opened += 1
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+
+async def hedged_call(func: Callable[[], Awaitable[Any]], hedge_after: Optional[float]) -> Any:
+    """
+    Run func(), starting a second identical attempt if the first is slow
+
+    Args:
+        func: Zero-argument coroutine function; a None result counts as failed
+        hedge_after: Seconds to wait before hedging (None disables hedging)
+
+    Returns:
+        The first successful (non-None) result, or the last attempt's outcome
+    """
+    first = asyncio.ensure_future(func())
+    attempts = {first}
+    try:
+        if hedge_after is None:
+            return await first
+
+        done, _ = await asyncio.wait(attempts, timeout=hedge_after)
+        if done:
+            return first.result()
+
+        attempts.add(asyncio.ensure_future(func()))
+        while attempts:
+            done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in done:
+                if not attempt.cancelled() and attempt.exception() is None and attempt.result() is not None:
+                    return attempt.result()
+            if not attempts:
+                # Every attempt failed; surface the last outcome
+                return done.pop().result()
+    finally:
+        # Also runs when the caller is cancelled, so no attempt keeps a connection
+        for attempt in attempts:
+            attempt.cancel()
+
+# Breakers per upstream source
+circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the circuit breaker for a source, configured from weather_sources.circuit_breaker"""
+    if name not in circuit_breakers:
+        settings = get_config().get('weather_sources.circuit_breaker', {}) or {}
+        circuit_breakers[name] = CircuitBreaker(name, **settings)
+    return circuit_breakers[name]
@@ -44,6 +44,11 @@ class AppConfig:
     log_level: str = "INFO"
     log_file: str = "logs/wchr.log"
     cache_ttl: int = 3600
+    cache_max_mb: int = 256
+    cache_stale_ttl: int = 0
+    cache_hot_threshold: int = 3
+    cache_max_refreshes: int = 10
+    cache_store_path: str = ""
     rate_limit: str = "100/hour"
 
 class ConfigManager:
@@ -186,7 +191,9 @@ class ConfigManager:
         app_config = self.config.get('app', {})
         # Filter out unknown fields
         valid_fields = {
-            'host', 'port', 'debug', 'log_level', 'log_file', 'cache_ttl', 'rate_limit'
+            'host', 'port', 'debug', 'log_level', 'log_file', 'cache_ttl', 'cache_max_mb',
+            'cache_stale_ttl', 'cache_hot_threshold', 'cache_max_refreshes', 'cache_store_path',
+            'rate_limit'
         }
         filtered_config = {k: v for k, v in app_config.items() if k in valid_fields}
         return AppConfig(**filtered_config)
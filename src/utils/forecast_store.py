@@ -0,0 +1,229 @@
+"""
+Persistent forecast store shared by all worker processes
+
+Forecasts are kept in a SQLite database in WAL mode, so every uvicorn worker
+can read while one writes, and cached cells survive restarts and scale-outs.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+Cell = Tuple[float, float]
+
+class ForecastStore:
+    """
+    Grid-cell forecast store backed by SQLite (WAL mode)
+
+    One row per grid cell holds the widest recent fetch: its fetch time, expiry
+    (wall clock, so it is meaningful across processes), the projection it was
+    fetched for, and the JSON payload. Methods are blocking; async callers
+    should run them in an executor.
+    """
+
+    def __init__(self, path: str, ttl: float = 3600, busy_timeout: float = 5.0):
+        """
+        Initialize the forecast store
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Seconds a stored forecast stays fresh
+            busy_timeout: Seconds to wait for a competing writer's lock
+        """
+        self.path = path
+        self.ttl = ttl
+        self.busy_timeout = busy_timeout
+
+        # sqlite3 connections must not be shared between threads
+        self._local = threading.local()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = self._connection()
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS forecasts (
+                lat REAL NOT NULL,
+                lon REAL NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                projection TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (lat, lon)
+            )
+        """)
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_forecasts_expires ON forecasts (expires_at)")
+        connection.commit()
+
+    def get_many(self, cells: Iterable[Cell]) -> Dict[Cell, Tuple[Dict[str, Any], Any, float]]:
+        """
+        Look up fresh forecasts for several grid cells
+
+        Args:
+            cells: Grid cells (as returned by ForecastCache.grid_key)
+
+        Returns:
+            Mapping of cell to (projection dict, payload, seconds until expiry)
+            for cells with an unexpired forecast; missing and expired cells are left out
+        """
+        cells = list(dict.fromkeys(cells))
+        if not cells:
+            return {}
+
+        found = {}
+        try:
+            connection = self._connection()
+            now = time.time()
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(cells), 400):
+                chunk = cells[start:start + 400]
+                placeholders = ",".join("(?, ?)" for _ in chunk)
+                rows = connection.execute(
+                    f"SELECT lat, lon, expires_at, projection, payload FROM forecasts "
+                    f"WHERE (lat, lon) IN (VALUES {placeholders}) AND expires_at > ?",
+                    [value for cell in chunk for value in cell] + [now]
+                ).fetchall()
+                for lat, lon, expires_at, projection, payload in rows:
+                    found[(lat, lon)] = (json.loads(projection), json.loads(payload), expires_at - now)
+        except (sqlite3.Error, ValueError) as e:
+            self.errors += 1
+            logger.error(f"Forecast store read failed: {e}")
+            return {}
+
+        self.hits += len(found)
+        self.misses += len(cells) - len(found)
+        return found
+
+    def get(self, cell: Cell) -> Optional[Tuple[Dict[str, Any], Any, float]]:
+        """Fresh (projection dict, payload, seconds left) for a grid cell, or None"""
+        return self.get_many([cell]).get(cell)
+
+    def set(self, cell: Cell, projection: Dict[str, Any], payload: Any,
+            fetched_at: Optional[float] = None,
+            covers: Optional[Callable[[Dict[str, Any], Dict[str, Any]], bool]] = None) -> bool:
+        """
+        Store the forecast fetched for a grid cell
+
+        A fresh stored forecast is only replaced by a newer fetch, so a slow
+        worker cannot overwrite a fresher forecast written by another one.
+        With covers, it must also cover the stored projection, so a narrow
+        fetch does not evict a wider forecast other consumers still need.
+
+        Args:
+            cell: Grid cell
+            projection: Projection dict the payload was fetched for
+            payload: JSON-serializable forecast
+            fetched_at: Wall-clock fetch time (default: now)
+            covers: covers(new_projection, stored_projection) predicate
+
+        Returns:
+            Whether the forecast was stored
+        """
+        fetched_at = fetched_at if fetched_at is not None else time.time()
+        try:
+            connection = self._connection()
+            # Read and replace under one write lock so concurrent workers serialize
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT fetched_at, expires_at, projection FROM forecasts WHERE lat = ? AND lon = ?",
+                    (cell[0], cell[1])
+                ).fetchone()
+                replace = row is None or row[1] <= time.time() or (
+                    fetched_at >= row[0]
+                    and (covers is None or covers(projection, json.loads(row[2])))
+                )
+                if replace:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO forecasts "
+                        "(lat, lon, fetched_at, expires_at, projection, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                        (cell[0], cell[1], fetched_at, fetched_at + self.ttl,
+                         json.dumps(projection), json.dumps(payload, default=str))
+                    )
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                raise
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.errors += 1
+            logger.error(f"Forecast store write for {cell} failed: {e}")
+            return False
+
+        if replace:
+            self.writes += 1
+        return replace
+
+    def purge_expired(self, grace: float = 0) -> int:
+        """Delete forecasts expired for more than grace seconds; returns rows removed"""
+        try:
+            connection = self._connection()
+            cursor = connection.execute("DELETE FROM forecasts WHERE expires_at < ?", (time.time() - grace,))
+            connection.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.error(f"Forecast store purge failed: {e}")
+            return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Store counters and row count"""
+        try:
+            rows = self._connection().execute("SELECT COUNT(*) FROM forecasts").fetchone()[0]
+        except sqlite3.Error:
+            rows = None
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": rows,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "errors": self.errors
+        }
+
+    def close(self):
+        """Close this thread's connection"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            # WAL lets readers in every worker proceed while one process writes
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+# Global forecast store instance
+forecast_store = None
+
+def get_forecast_store() -> Optional[ForecastStore]:
+    """Get global forecast store from app.cache_store_path, or None when it is not configured"""
+    global forecast_store
+    if forecast_store is None:
+        app_config = get_config().get_app_config()
+        if not app_config.cache_store_path:
+            return None
+        forecast_store = ForecastStore(app_config.cache_store_path, ttl=app_config.cache_ttl)
+    return forecast_store
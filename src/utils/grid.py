@@ -0,0 +1,44 @@
+"""
+Grid cells shared by the forecast cache, forecast store and historical store
+"""
+
+from decimal import Decimal
+from typing import Tuple, Union
+
+import numpy as np
+
+Cell = Tuple[float, float]
+Coordinates = Union[float, np.ndarray]
+
+# Decimals cell centres are rounded to
+CENTRE_DECIMALS = 6
+
+def snap_to_grid(lat: Coordinates, lon: Coordinates, resolution: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Snap coordinates to the centres of their grid cells
+
+    Works on scalars and arrays alike. Centres are rounded again to
+    CENTRE_DECIMALS decimals so equal cells compare equal despite float noise, and -0.0 is
+    normalized to 0.0 so a cell has a single name either side of the equator.
+
+    Args:
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees
+        resolution: Grid cell size in degrees
+
+    Returns:
+        Tuple of (cell latitudes, cell longitudes) as float64 arrays
+    """
+    lat_cells = np.round(np.round(np.asarray(lat, dtype=float) / resolution) * resolution, CENTRE_DECIMALS) + 0.0
+    lon_cells = np.round(np.round(np.asarray(lon, dtype=float) / resolution) * resolution, CENTRE_DECIMALS) + 0.0
+    return lat_cells, lon_cells
+
+def grid_cell(lat: float, lon: float, resolution: float) -> Cell:
+    """Grid cell of one location as a hashable (lat, lon) tuple of Python floats"""
+    lat_cell, lon_cell = snap_to_grid(lat, lon, resolution)
+    return float(lat_cell), float(lon_cell)
+
+def grid_decimals(resolution: float) -> int:
+    """Decimals that write every cell centre of a resolution exactly (at most CENTRE_DECIMALS)"""
+    exponent = Decimal(repr(float(resolution))).normalize().as_tuple().exponent
+    return min(CENTRE_DECIMALS, max(0, -exponent))
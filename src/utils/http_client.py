@@ -0,0 +1,56 @@
+"""
+Shared HTTP client for upstream weather data sources
+"""
+
+import aiohttp
+import logging
+from typing import Optional
+
+from utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Global client session, created at app startup and closed at shutdown
+http_session: Optional[aiohttp.ClientSession] = None
+
+def _create_session() -> aiohttp.ClientSession:
+    """Create a pooled client session from the http_client configuration"""
+    config = get_config()
+
+    connector = aiohttp.TCPConnector(
+        limit=config.get('http_client.pool_size', 100),
+        limit_per_host=config.get('http_client.limit_per_host', 20),
+        ttl_dns_cache=config.get('http_client.dns_cache_ttl', 300),
+        keepalive_timeout=config.get('http_client.keepalive_timeout', 30)
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=config.get('http_client.total_timeout', 30),
+        connect=config.get('http_client.connect_timeout', 5)
+    )
+
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared client session
+
+    The session is normally created by the startup hook; it is created lazily
+    here so that fetchers also work outside the FastAPI app (scripts, notebooks).
+    """
+    global http_session
+    if http_session is None or http_session.closed:
+        http_session = _create_session()
+        logger.info("Shared HTTP client session created")
+    return http_session
+
+async def init_http_session() -> aiohttp.ClientSession:
+    """Create the shared client session (called from the app startup hook)"""
+    return get_http_session()
+
+async def close_http_session():
+    """Close the shared client session (called from the app shutdown hook)"""
+    global http_session
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+        logger.info("Shared HTTP client session closed")
+    http_session = None
@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the WeatherCrop AI test suite
+"""
+
+import os
+import sys
+
+import pytest
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from utils import config as config_module  # noqa: E402
+
+def _set_path(config: dict, dotted_key: str, value):
+    keys = dotted_key.split(".")
+    for key in keys[:-1]:
+        config = config.setdefault(key, {})
+    config[keys[-1]] = value
+
+@pytest.fixture
+def app_config(tmp_path, monkeypatch):
+    """
+    Install a configuration built from config.example.yaml
+
+    Returns a function taking dotted-key overrides, e.g.
+    app_config({'weather_sources.open_meteo.hedge': False}).
+    """
+    def install(overrides=None):
+        with open(os.path.join(ROOT, "config", "config.example.yaml")) as f:
+            config = yaml.safe_load(f)
+        _set_path(config, "app.log_file", str(tmp_path / "logs" / "test.log"))
+        _set_path(config, "app.cache_store_path", "")
+        for key, value in (overrides or {}).items():
+            _set_path(config, key, value)
+
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump(config))
+        manager = config_module.ConfigManager(str(path))
+        monkeypatch.setattr(config_module, "config_manager", manager)
+        return manager
+
+    return install
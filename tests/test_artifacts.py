@@ -0,0 +1,97 @@
+"""
+Versioned model artifact directories
+"""
+
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from models.artifacts import ArtifactError, is_artifact, load_artifact, save_artifact, verify_artifact
+
+def sample_arrays(seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "kernel": rng.standard_normal((8, 32)).astype(np.float32),
+        "bias": rng.standard_normal(32),
+        "index": np.arange(5, dtype=np.int64)
+    }
+
+def test_round_trip_is_memory_mapped_and_read_only(tmp_path):
+    directory = str(tmp_path / "model")
+    arrays = sample_arrays()
+    save_artifact(directory, arrays, {"sequence_length": 60})
+
+    assert is_artifact(directory)
+    loaded, manifest = load_artifact(directory)
+    assert manifest["sequence_length"] == 60
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(loaded[name], array)
+        assert loaded[name].dtype == array.dtype
+        assert isinstance(loaded[name], np.memmap)
+        assert not loaded[name].flags.writeable
+
+def test_replacing_keeps_artifact_loadable_throughout(tmp_path):
+    directory = str(tmp_path / "model")
+    save_artifact(directory, sample_arrays(0), {"generation": 0})
+
+    errors, stop = [], threading.Event()
+
+    def load_repeatedly():
+        while not stop.is_set():
+            try:
+                load_artifact(directory)
+            except Exception as e:  # noqa: BLE001 - any failure is a test failure
+                errors.append(e)
+
+    reader = threading.Thread(target=load_repeatedly)
+    reader.start()
+    for generation in range(1, 30):
+        save_artifact(directory, sample_arrays(generation), {"generation": generation})
+    stop.set()
+    reader.join()
+
+    assert errors == []
+    assert load_artifact(directory)[1]["generation"] == 29
+    # Only the current and the previous version are kept on disk
+    versions = [entry for entry in os.listdir(tmp_path) if entry.startswith("model.v-")]
+    assert len(versions) == 2
+
+def test_replacing_a_plain_directory(tmp_path):
+    directory = tmp_path / "model"
+    (directory / "arrays").mkdir(parents=True)
+    save_artifact(str(directory), sample_arrays(), {})
+    assert is_artifact(str(directory))
+
+def test_truncated_array_is_rejected_without_checksum(tmp_path):
+    directory = str(tmp_path / "model")
+    save_artifact(directory, sample_arrays(), {})
+    path = os.path.join(directory, "arrays", "kernel.npy")
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 4)
+    with pytest.raises(ArtifactError, match="Size mismatch"):
+        load_artifact(directory)
+
+def test_verify_detects_corrupted_bytes(tmp_path):
+    directory = str(tmp_path / "model")
+    save_artifact(directory, sample_arrays(), {})
+    path = os.path.join(directory, "arrays", "bias.npy")
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(b"\x00" if last != b"\x00" else b"\x01")
+
+    load_artifact(directory)  # same size: not detected without verification
+    with pytest.raises(ArtifactError, match="Checksum mismatch"):
+        verify_artifact(directory)
+    with pytest.raises(ArtifactError, match="Checksum mismatch"):
+        load_artifact(directory, verify=True)
+
+def test_unsupported_format_version(tmp_path):
+    directory = tmp_path / "model"
+    directory.mkdir()
+    (directory / "manifest.json").write_text('{"format_version": 99, "arrays": {}}')
+    with pytest.raises(ArtifactError, match="Unsupported artifact format"):
+        load_artifact(str(directory))
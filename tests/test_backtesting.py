@@ -0,0 +1,73 @@
+"""
+Walk-forward backtesting metrics and leakage checks
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import integrate
+from scipy.stats import norm
+
+from models.backtesting import forecast_metrics, gaussian_crps, walk_forward_backtest
+from models.rainfall_prediction import RainfallPredictor
+
+@pytest.mark.parametrize("mean,std,observed", [(0.0, 1.0, 0.0), (5.0, 2.0, 9.5), (3.0, 0.5, -1.0)])
+def test_gaussian_crps_matches_numerical_integral(mean, std, observed):
+    # CRPS = integral of (F(x) - 1{x >= observed})^2 dx
+    below, _ = integrate.quad(lambda x: norm.cdf(x, mean, std) ** 2, -np.inf, observed)
+    above, _ = integrate.quad(lambda x: (1 - norm.cdf(x, mean, std)) ** 2, observed, np.inf)
+    crps = gaussian_crps(np.array(mean), np.array(std), np.array(observed))
+    assert crps == pytest.approx(below + above, rel=1e-6)
+
+def test_gaussian_crps_tends_to_absolute_error_for_sharp_forecasts():
+    crps = gaussian_crps(np.array([2.0]), np.array([1e-9]), np.array([5.0]))
+    assert crps[0] == pytest.approx(3.0)
+
+def test_forecast_metrics_per_lead_time():
+    predictions = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]])
+    actuals = np.array([[1.0, 0.0, 3.0], [3.0, 2.0, 0.0]])
+    metrics = forecast_metrics(predictions, actuals, horizons=[1, 3], std=np.ones_like(predictions))
+
+    assert metrics["1d"]["mae"] == pytest.approx(1.0)
+    assert metrics["1d"]["rmse"] == pytest.approx(np.sqrt(2.0))
+    assert metrics["3d"]["mae"] == pytest.approx(1.5)
+    assert metrics["all"]["mae"] == pytest.approx(7 / 6)
+    assert set(metrics["all"]) == {"mae", "rmse", "crps"}
+
+def trained_predictor(trained_through=None, training_rows=None):
+    predictor = RainfallPredictor({'lstm_params': {'sequence_length': 10, 'forecast_horizon': 5}})
+    predictor.is_trained = True
+    predictor.trained_through = trained_through
+    predictor.training_rows = training_rows
+    return predictor
+
+def history(days=200):
+    return pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=days),
+        'rainfall': np.random.default_rng(0).gamma(0.5, 8.0, days)
+    })
+
+def test_pretrained_predictor_covering_backtest_period_is_rejected():
+    predictor = trained_predictor(trained_through='2020-07-18')
+    with pytest.raises(ValueError, match="trained through"):
+        walk_forward_backtest(predictor, history(), origins=[150, 170], horizons=[5], train=False)
+
+def test_pretrained_predictor_without_training_record_is_rejected():
+    with pytest.raises(ValueError, match="train=True"):
+        walk_forward_backtest(trained_predictor(), history(), origins=[150, 170], horizons=[5], train=False)
+
+def test_backtest_trains_before_first_origin_by_default():
+    pytest.importorskip("tensorflow")
+    pytest.importorskip("statsmodels")
+    predictor = RainfallPredictor({
+        'lstm_params': {'sequence_length': 10, 'forecast_horizon': 5, 'hidden_units': 8,
+                        'epochs': 1, 'verbose': 0, 'inference_backend': 'numpy'},
+        'arima_params': {'order': [1, 0, 0]}
+    })
+    data = history()
+    result = walk_forward_backtest(predictor, data, origins=[150, 160, 170], horizons=[1, 5])
+
+    assert predictor.trained_through == data['date'].iloc[149].date().isoformat()
+    assert result.predictions.shape == (3, 5)
+    np.testing.assert_array_equal(result.actuals[0], data['rainfall'].to_numpy()[150:155])
+    assert set(result.metrics) == {"ensemble", "lstm", "arima"}
@@ -0,0 +1,113 @@
+"""
+Forecast cache and fetch coalescing
+"""
+
+import asyncio
+import math
+import time
+
+import pytest
+
+from utils.cache import ForecastCache, SingleFlight
+
+def test_grid_key_snaps_nearby_points_to_one_cell():
+    cache = ForecastCache(grid_resolution=0.1)
+    assert cache.grid_key(28.6139, 77.2090) == (28.6, 77.2)
+    assert cache.grid_key(28.5501, 77.2499) == (28.6, 77.2)
+    lat_cell, lon_cell = cache.grid_key(-0.04, 0.3)
+    assert (lat_cell, lon_cell) == (0.0, 0.3)
+    # -0.0 == 0.0, so check the sign: the cell south of the equator is not a separate key
+    assert math.copysign(1.0, lat_cell) == 1.0
+
+def test_entries_expire_after_ttl():
+    cache = ForecastCache(ttl=0.05)
+    cache.set("cell", {"rain": 1})
+    assert cache.get("cell") == {"rain": 1}
+    time.sleep(0.06)
+    assert cache.get("cell") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_lru_eviction_keeps_cache_within_budget():
+    value = {"payload": "x" * 100}
+    size = ForecastCache._estimate_size(value)
+    cache = ForecastCache(max_bytes=3 * size)
+    for key in "abc":
+        cache.set(key, value)
+    cache.get("a")  # a becomes most recently used
+    cache.set("d", value)
+
+    assert cache.peek("b") is None
+    assert all(cache.peek(key) is not None for key in "acd")
+    assert cache.current_bytes <= cache.max_bytes
+    assert cache.stats()["evictions"] == 1
+
+def test_oversized_value_is_not_cached():
+    cache = ForecastCache(max_bytes=10)
+    cache.set("cell", {"payload": "x" * 100})
+    assert cache.peek("cell") is None
+    assert cache.current_bytes == 0
+
+def test_stale_entries_are_served_only_for_hot_cells():
+    cache = ForecastCache(ttl=0.05, stale_ttl=10, hot_threshold=2)
+    cache.set("hot", 1)
+    cache.set("cold", 2)
+    cache.get("hot")
+    cache.get("hot")
+    time.sleep(0.06)
+
+    assert cache.lookup("hot") == (1, True)
+    assert cache.lookup("cold") == (None, False)
+    assert cache.get("hot") is None  # get never serves stale values
+
+def test_lookup_accept_predicate_rejects_without_evicting():
+    cache = ForecastCache()
+    cache.set("cell", {"days": 7})
+    assert cache.lookup("cell", accept=lambda value: value["days"] >= 14) == (None, False)
+    assert cache.peek("cell") == {"days": 7}
+
+def test_single_flight_coalesces_concurrent_calls():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"rain": 3}
+
+        results = await asyncio.gather(*[flight.do("cell", fetch) for _ in range(5)])
+        assert results == [{"rain": 3}] * 5
+        assert len(calls) == 1
+        assert flight.stats() == {"calls": 5, "executions": 1, "coalesced": 4, "in_flight": 0}
+
+        # Once finished, the next call fetches again
+        await flight.do("cell", fetch)
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+def test_single_flight_shares_errors_and_survives_cancelled_caller():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(flight.do("a", failing), flight.do("a", failing),
+                                       return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return 42
+
+        first = asyncio.ensure_future(flight.do("b", slow))
+        second = asyncio.ensure_future(flight.do("b", slow))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(scenario())
@@ -0,0 +1,184 @@
+"""
+Circuit breaker and hedged requests against a local Open-Meteo stub server
+"""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from api.routes import weather
+from utils import circuit_breaker
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError, hedged_call
+from utils.http_client import close_http_session
+
+PAYLOAD = {
+    "daily": {
+        "time": ["2024-07-01"],
+        "precipitation_sum": [12.5],
+        "temperature_2m_max": [31.0],
+        "temperature_2m_min": [24.0]
+    }
+}
+
+class StubServer:
+    """Open-Meteo stand-in whose latency and status are set per request"""
+
+    def __init__(self):
+        self.status = 200
+        self.delays = []  # per-request delays, consumed in order
+        self.default_delay = 0.0
+        self.requests = 0
+
+    async def handle(self, request):
+        self.requests += 1
+        delay = self.delays.pop(0) if self.delays else self.default_delay
+        await asyncio.sleep(delay)
+        if self.status != 200:
+            return web.json_response({"error": True}, status=self.status)
+        return web.json_response(PAYLOAD)
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/v1/forecast", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        return f"http://127.0.0.1:{port}/v1/forecast"
+
+    async def stop(self):
+        await close_http_session()
+        await self.runner.cleanup()
+
+@pytest.fixture
+def stub_config(app_config, monkeypatch):
+    """Configure Open-Meteo against a stub URL with a fast-cycling breaker"""
+    monkeypatch.setattr(circuit_breaker, "circuit_breakers", {})
+
+    def install(url, **open_meteo):
+        return app_config({
+            "weather_sources.circuit_breaker": {
+                "window_size": 10,
+                "min_calls": 3,
+                "error_rate_threshold": 0.5,
+                "slow_call_seconds": 5,
+                "open_seconds": 0.2,
+                "half_open_probes": 1
+            },
+            "weather_sources.open_meteo.base_url": url,
+            "weather_sources.open_meteo.timeout": open_meteo.get("timeout", 2),
+            "weather_sources.open_meteo.hedge": open_meteo.get("hedge", False),
+            "weather_sources.open_meteo.hedge_min_samples": 5
+        })
+
+    return install
+
+def call_open_meteo(timeout: float = 2):
+    source = weather.WEATHER_SOURCES[weather.PRIMARY_SOURCE]
+    return weather._call_source(source, 28.6, 77.2, weather.FULL_PROJECTION, timeout)
+
+def test_breaker_opens_half_opens_and_closes(stub_config):
+    async def scenario():
+        stub = StubServer()
+        stub_config(await stub.start())
+        breaker = circuit_breaker.get_circuit_breaker(weather.PRIMARY_SOURCE)
+        try:
+            # Upstream errors open the circuit once min_calls have failed
+            stub.status = 500
+            for _ in range(3):
+                assert await call_open_meteo() is None
+            assert breaker.state == CircuitBreaker.OPEN
+
+            # Open: rejected without reaching the upstream
+            requests = stub.requests
+            with pytest.raises(CircuitOpenError):
+                await call_open_meteo()
+            assert stub.requests == requests
+
+            # After open_seconds a single probe is admitted
+            await asyncio.sleep(0.25)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            stub.status = 200
+            assert await call_open_meteo() == PAYLOAD
+            assert breaker.state == CircuitBreaker.CLOSED
+        finally:
+            await stub.stop()
+
+    asyncio.run(scenario())
+
+def test_failed_probe_reopens_circuit(stub_config):
+    async def scenario():
+        stub = StubServer()
+        stub_config(await stub.start())
+        breaker = circuit_breaker.get_circuit_breaker(weather.PRIMARY_SOURCE)
+        try:
+            # Latency beyond the source timeout counts as a failure
+            stub.default_delay = 0.3
+            for _ in range(3):
+                with pytest.raises(asyncio.TimeoutError):
+                    await call_open_meteo(timeout=0.05)
+            assert breaker.state == CircuitBreaker.OPEN
+
+            await asyncio.sleep(0.25)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            with pytest.raises(asyncio.TimeoutError):
+                await call_open_meteo(timeout=0.05)
+            assert breaker.state == CircuitBreaker.OPEN
+            assert breaker.times_opened == 2
+        finally:
+            await stub.stop()
+
+    asyncio.run(scenario())
+
+def test_hedge_fires_when_first_request_is_slow(stub_config):
+    async def scenario():
+        stub = StubServer()
+        stub_config(await stub.start(), hedge=True)
+        breaker = circuit_breaker.get_circuit_breaker(weather.PRIMARY_SOURCE)
+        try:
+            # Below hedge_min_samples no hedge is sent
+            for _ in range(5):
+                assert await call_open_meteo() == PAYLOAD
+            assert stub.requests == 5
+            assert breaker.latency_percentile(95, min_samples=5) is not None
+
+            # A slow first attempt is overtaken by the hedge
+            stub.delays = [1.5]
+            start = time.monotonic()
+            assert await call_open_meteo() == PAYLOAD
+            assert time.monotonic() - start < 1.0
+            assert stub.requests == 7
+        finally:
+            await stub.stop()
+
+    asyncio.run(scenario())
+
+def test_hedge_survives_failures_in_window():
+    breaker = CircuitBreaker("test", window_size=20, min_calls=50)
+    for _ in range(19):
+        breaker.record(True, 0.1)
+    breaker.record(False, 0.1)
+    assert breaker.latency_percentile(95, min_samples=5) == pytest.approx(0.1)
+
+def test_hedged_call_cancels_attempts_when_caller_is_cancelled():
+    async def scenario():
+        started = []
+
+        async def slow():
+            task = asyncio.current_task()
+            started.append(task)
+            await asyncio.sleep(10)
+
+        caller = asyncio.ensure_future(hedged_call(slow, hedge_after=5))
+        await asyncio.sleep(0.05)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        assert len(started) == 1
+        assert started[0].cancelled()
+
+    asyncio.run(scenario())
@@ -0,0 +1,41 @@
+"""
+Vectorized multi-source forecast fusion
+"""
+
+import numpy as np
+
+from data_processing.forecast_fusion import align_to_dates, fuse_daily_forecasts
+
+DATES = ["2024-07-01", "2024-07-02", "2024-07-03"]
+
+def test_align_to_dates_scatters_and_drops_unknown_dates():
+    axis = np.asarray(DATES, dtype="U10")
+    aligned = align_to_dates(axis, ["2024-07-03", "2024-06-30", "2024-07-01"], [3.0, 9.0, None])
+    np.testing.assert_array_equal(np.isnan(aligned), [True, True, False])
+    assert aligned[2] == 3.0
+
+def test_fusion_matches_weighted_average_with_missing_days():
+    sources = [
+        (0.5, {"date": DATES, "rainfall_mm": [10.0, 20.0, 30.0],
+               "temperature_max": [30.0, 31.0, 32.0]}),
+        (0.3, {"date": DATES[:2], "rainfall_mm": [0.0, None]}),
+        (0.2, {"date": [f"{d}T00:00" for d in DATES], "rainfall_mm": [5.0, 5.0, 5.0]})
+    ]
+    fused = fuse_daily_forecasts(DATES, sources)
+
+    expected = [
+        (0.5 * 10 + 0.3 * 0 + 0.2 * 5) / 1.0,
+        (0.5 * 20 + 0.2 * 5) / 0.7,
+        (0.5 * 30 + 0.2 * 5) / 0.7
+    ]
+    np.testing.assert_allclose(fused["rainfall_mm"], expected)
+    np.testing.assert_allclose(fused["total_weight"], [1.0, 0.7, 0.7])
+    # Only one source has temperatures: its values pass through unchanged
+    np.testing.assert_allclose(fused["temperature_max"], [30.0, 31.0, 32.0])
+    # No source has minimum temperatures
+    np.testing.assert_array_equal(fused["temperature_min"], [0.0, 0.0, 0.0])
+
+def test_fusion_without_sources_returns_zeros():
+    fused = fuse_daily_forecasts(DATES, [])
+    for values in fused.values():
+        np.testing.assert_array_equal(values, np.zeros(3))
@@ -0,0 +1,50 @@
+"""
+SQLite forecast store shared across workers
+"""
+
+import time
+
+from api.routes.weather import (
+    FULL_PROJECTION, _projection_dict_covers, precipitation_projection, rainfall_projection
+)
+from utils.forecast_store import ForecastStore
+
+CELL = (28.6, 77.2)
+
+def test_round_trip_and_expiry(tmp_path):
+    store = ForecastStore(str(tmp_path / "forecasts.db"), ttl=0.05)
+    assert store.set(CELL, {"forecast_days": 7}, {"rain": [1.0]})
+    projection, payload, ttl = store.get(CELL)
+    assert projection == {"forecast_days": 7}
+    assert payload == {"rain": [1.0]}
+    assert 0 < ttl <= 0.05
+
+    time.sleep(0.06)
+    assert store.get(CELL) is None
+
+def test_older_fetch_does_not_replace_newer(tmp_path):
+    store = ForecastStore(str(tmp_path / "forecasts.db"))
+    now = time.time()
+    store.set(CELL, {}, "new", fetched_at=now)
+    assert not store.set(CELL, {}, "old", fetched_at=now - 10)
+    assert store.get(CELL)[1] == "new"
+
+def test_narrow_projection_does_not_evict_wider_forecast(tmp_path):
+    store = ForecastStore(str(tmp_path / "forecasts.db"))
+    wide = rainfall_projection(16).to_dict()
+    narrow = precipitation_projection(7).to_dict()
+
+    assert store.set(CELL, wide, "wide", covers=_projection_dict_covers)
+    assert not store.set(CELL, narrow, "narrow", covers=_projection_dict_covers)
+    assert store.get(CELL)[1] == "wide"
+
+    # A projection covering the stored one replaces it
+    assert store.set(CELL, FULL_PROJECTION.to_dict(), "full", covers=_projection_dict_covers)
+    assert store.get(CELL)[1] == "full"
+
+def test_expired_forecast_is_replaced_by_any_projection(tmp_path):
+    store = ForecastStore(str(tmp_path / "forecasts.db"), ttl=0.05)
+    store.set(CELL, FULL_PROJECTION.to_dict(), "full", covers=_projection_dict_covers)
+    time.sleep(0.06)
+    assert store.set(CELL, precipitation_projection(7).to_dict(), "narrow", covers=_projection_dict_covers)
+    assert store.get(CELL)[1] == "narrow"
@@ -0,0 +1,109 @@
+"""
+Partitioned historical weather store and the routes reading it
+"""
+
+import asyncio
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+pytest.importorskip("pyarrow")
+
+from api.routes import weather  # noqa: E402
+from data_processing import historical_store  # noqa: E402
+from data_processing.historical_store import HistoricalWeatherStore  # noqa: E402
+from data_processing.weather_data import WeatherDataCollector, monsoon_dates  # noqa: E402
+from utils.cache import ForecastCache  # noqa: E402
+from utils.grid import grid_cell, snap_to_grid  # noqa: E402
+
+def observations(start, end, stations=((28.61, 77.21), (28.63, 77.18)), rainfall=1.0):
+    dates = pd.date_range(start, end)
+    return pd.DataFrame({
+        'station_id': np.repeat(np.arange(len(stations)), len(dates)),
+        'date': np.tile(dates, len(stations)),
+        'latitude': np.repeat([lat for lat, _ in stations], len(dates)),
+        'longitude': np.repeat([lon for _, lon in stations], len(dates)),
+        'rainfall_mm': rainfall,
+        'temperature_celsius': 25.0
+    })
+
+def test_grid_helper_agrees_for_scalars_arrays_cache_and_store(tmp_path):
+    lats = np.array([28.6139, -0.04, 0.03, 12.95])
+    lons = np.array([77.2090, 77.25, -0.04, 80.0])
+    lat_cells, lon_cells = snap_to_grid(lats, lons, 0.1)
+    cache = ForecastCache(grid_resolution=0.1)
+    store = HistoricalWeatherStore(str(tmp_path), grid_resolution=0.1)
+    for lat, lon, lat_cell, lon_cell in zip(lats, lons, lat_cells, lon_cells):
+        assert grid_cell(lat, lon, 0.1) == (lat_cell, lon_cell)
+        assert cache.grid_key(lat, lon) == store.grid_key(lat, lon) == (lat_cell, lon_cell)
+    # Both sides of the equator share one partition name
+    assert store.cell_name(store.grid_key(-0.04, 77.25)) == store.cell_name(store.grid_key(0.03, 77.25)) == "0_77.2"
+
+def test_fine_grid_cells_get_distinct_partition_names(tmp_path):
+    store = HistoricalWeatherStore(str(tmp_path), grid_resolution=0.0001)
+    names = {store.cell_name(store.grid_key(12.3456, lon)) for lon in (123.4567, 123.4568, 123.4569)}
+    assert names == {"12.3456_123.4567", "12.3456_123.4568", "12.3456_123.4569"}
+    # Whole-degree and coarser cells keep their short names
+    assert HistoricalWeatherStore(str(tmp_path), grid_resolution=0.1).cell_name((28.6, 77.0)) == "28.6_77"
+    assert HistoricalWeatherStore(str(tmp_path), grid_resolution=0.25).cell_name((-12.25, 80.5)) == "-12.25_80.5"
+    assert HistoricalWeatherStore(str(tmp_path), grid_resolution=1).cell_name((20.0, 70.0)) == "20_70"
+
+    store.write(observations('2020-01-01', '2020-01-03', stations=((12.3456, 123.4567), (12.3456, 123.4568))))
+    assert len(store.read_location(12.3456, 123.4567, date(2020, 1, 1), date(2020, 1, 3))) == 3
+
+def test_reingesting_overlapping_range_replaces_rows(tmp_path):
+    store = HistoricalWeatherStore(str(tmp_path))
+    store.write(observations('2020-12-20', '2021-01-10', rainfall=1.0))
+    store.write(observations('2021-01-01', '2021-01-31', rainfall=2.0))
+
+    history = store.read_location(28.6, 77.2, date(2020, 12, 1), date(2021, 1, 31), ['station_id', 'rainfall_mm'])
+    assert not history.duplicated(['date', 'station_id']).any()
+    daily = history.groupby('date')['rainfall_mm'].agg(['mean', 'count'])
+    assert len(daily) == 12 + 31
+    assert (daily['count'] == 2).all()
+    assert (daily.loc[:'2020-12-31', 'mean'] == 1.0).all()
+    assert (daily.loc['2021-01-01':, 'mean'] == 2.0).all()
+
+def test_read_filters_dates_and_projects_columns(tmp_path):
+    store = HistoricalWeatherStore(str(tmp_path), row_group_size=7)
+    store.write(observations('2019-01-01', '2021-12-31'))
+    history = store.read_location(28.6, 77.2, date(2020, 2, 27), date(2020, 3, 2), ['rainfall_mm'])
+    assert list(history.columns) == ['date', 'cell', 'rainfall_mm']
+    assert history['date'].min() == pd.Timestamp('2020-02-27')
+    assert history['date'].max() == pd.Timestamp('2020-03-02')
+    assert len(history) == 2 * 5
+
+def test_monsoon_dates_follow_the_wet_season():
+    dates = pd.date_range('2000-01-01', '2009-12-31')
+    wet = (dates.dayofyear >= 160) & (dates.dayofyear <= 280)
+    onset, withdrawal = monsoon_dates(pd.Series(np.where(wet, 12.0, 0.5), index=dates), 2024)
+    # 15-day smoothing shifts the edges by up to a week
+    assert date(2024, 6, 1) <= date.fromisoformat(onset) <= date(2024, 6, 10)
+    assert date(2024, 9, 30) <= date.fromisoformat(withdrawal) <= date(2024, 10, 15)
+
+def test_climate_normals_from_store_keep_response_shape(app_config, monkeypatch, tmp_path):
+    app_config()
+    store = HistoricalWeatherStore(str(tmp_path))
+    store.write(pd.concat(WeatherDataCollector({}).iter_synthetic_history(
+        '2015-01-01', '2019-12-31', [{'latitude': 28.61, 'longitude': 77.21}]
+    )))
+    monkeypatch.setattr(historical_store, "historical_store", store)
+
+    normals = WeatherDataCollector({}).get_climate_normals(28.61, 77.21)
+    assert normals['data_source'] == 'historical_store'
+    patterns = normals['seasonal_patterns']
+    assert set(patterns) == {'monsoon_onset_date', 'monsoon_withdrawal_date', 'peak_summer_month', 'peak_winter_month'}
+    assert patterns['monsoon_onset_date'] < patterns['monsoon_withdrawal_date']
+
+def test_historical_endpoint_rejects_unknown_parameters(app_config):
+    app_config()
+    request = weather.WeatherDataRequest(
+        location=weather.LocationRequest(latitude=28.6, longitude=77.2),
+        start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), parameters=['rain']
+    )
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(weather.get_historical_weather_data(request))
+    assert error.value.status_code == 422
@@ -0,0 +1,161 @@
+"""
+Rainfall predictor data preparation
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import rainfall_prediction
+from models.lstm_numpy import MinMaxScaling, NumpyLSTM
+from models.rainfall_prediction import RainfallPredictor
+
+def make_predictor(sequence_length=10, forecast_horizon=5):
+    return RainfallPredictor({
+        'lstm_params': {'sequence_length': sequence_length, 'forecast_horizon': forecast_horizon},
+        'arima_params': {'order': [1, 0, 0]}
+    })
+
+def daily_rainfall(days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=days),
+        'rainfall': rng.gamma(0.5, 8.0, days)
+    })
+
+def save_numpy_model(path, data, sequence_length=10, forecast_horizon=5, units=4):
+    """Save a small trained model built without TensorFlow (random LSTM weights, fitted ARIMA)"""
+    from statsmodels.tsa.arima.model import ARIMA
+
+    rng = np.random.default_rng(1)
+    predictor = make_predictor(sequence_length, forecast_horizon)
+    predictor.lstm_engine = NumpyLSTM(
+        [(rng.normal(0, 0.3, (1, 4 * units)), rng.normal(0, 0.3, (units, 4 * units)), np.zeros(4 * units))],
+        [(rng.normal(0, 0.3, (units, forecast_horizon)), np.zeros(forecast_horizon), 'linear')]
+    )
+    values = data['rainfall'].to_numpy()
+    predictor.scaler = MinMaxScaling([1 / np.ptp(values)], [-values.min() / np.ptp(values)])
+    predictor.arima_results = ARIMA(values, order=(1, 0, 0)).fit()
+    predictor.is_trained = True
+    predictor.save_model(str(path))
+    return predictor
+
+def serving_predictor(backend='numpy'):
+    return RainfallPredictor({
+        'lstm_params': {'sequence_length': 10, 'forecast_horizon': 5, 'inference_backend': backend},
+        'arima_params': {'order': [1, 0, 0]}
+    })
+
+def test_prepare_data_builds_direct_windows():
+    predictor = make_predictor()
+    X, y = predictor.prepare_data(daily_rainfall(40))
+    assert X.shape == (40 - 15 + 1, 10)
+    assert y.shape == (40 - 15 + 1, 5)
+    # Targets continue each input window
+    np.testing.assert_array_equal(X[1, -1], y[0, 0])
+
+def test_prepare_data_rejects_short_history():
+    predictor = make_predictor()
+    with pytest.raises(ValueError, match="at least 16 rows"):
+        predictor.prepare_data(daily_rainfall(15))
+
+def test_saved_model_predicts_like_the_trained_one(tmp_path):
+    pytest.importorskip("tensorflow")
+    pytest.importorskip("statsmodels")
+    config = {
+        'lstm_params': {'sequence_length': 10, 'forecast_horizon': 5, 'hidden_units': 8,
+                        'epochs': 1, 'batch_size': 16, 'verbose': 0, 'inference_backend': 'numpy'},
+        'arima_params': {'order': [1, 0, 0]}
+    }
+    data = daily_rainfall(120)
+    trained = RainfallPredictor(config)
+    trained.train(data)
+    trained.save_model(str(tmp_path / "model"))
+
+    loaded = RainfallPredictor(config)
+    loaded.load_model(str(tmp_path / "model"))
+
+    window = trained.scaler.transform(data['rainfall'].to_numpy()[-10:].reshape(-1, 1)).ravel()
+    np.testing.assert_allclose(loaded.predict_lstm(window, 5), trained.predict_lstm(window, 5),
+                               rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(loaded.predict_arima(5), trained.predict_arima(5))
+
+def test_saved_model_serves_without_tensorflow(tmp_path, monkeypatch):
+    pytest.importorskip("statsmodels")
+    data = daily_rainfall(120)
+    trained = save_numpy_model(tmp_path / "model", data)
+
+    def no_tensorflow():
+        raise ImportError("No module named 'tensorflow'")
+    monkeypatch.setattr(rainfall_prediction, "DEPENDENCIES_AVAILABLE", False)
+    monkeypatch.setattr(rainfall_prediction, "_import_training_dependencies", no_tensorflow)
+
+    loaded = serving_predictor()
+    loaded.load_model(str(tmp_path / "model"))
+    # Forecasts come from the saved ARIMA state, not mock noise
+    np.testing.assert_allclose(loaded.predict_arima(3), trained.predict_arima(3))
+    np.testing.assert_array_equal(loaded.predict_arima(3), loaded.predict_arima(3))
+    first = loaded.predict(data, steps=5)
+    assert first == loaded.predict(data, steps=5)
+    np.testing.assert_allclose(first['arima_predictions'], trained.predict(data, steps=5)['arima_predictions'])
+
+    with pytest.raises(ImportError, match="inference_backend"):
+        serving_predictor('keras').load_model(str(tmp_path / "model"))
+
+def test_trained_model_without_statsmodels_raises_instead_of_mocking(tmp_path, monkeypatch):
+    pytest.importorskip("statsmodels")
+    save_numpy_model(tmp_path / "model", daily_rainfall(120))
+    monkeypatch.setattr(rainfall_prediction, "STATSMODELS_AVAILABLE", False)
+
+    loaded = serving_predictor()
+    loaded.load_model(str(tmp_path / "model"))
+    with pytest.raises(ImportError, match="statsmodels"):
+        loaded.predict_arima(3)
+    with pytest.raises(ImportError, match="statsmodels"):
+        loaded.predict_arima_batch([np.ones(20)], 3)
+
+def test_untrained_model_still_mocks():
+    predictor = make_predictor()
+    assert predictor.predict_arima(3).shape == (3,)
+    assert predictor.predict_lstm(np.zeros(10), 3).shape == (3,)
+
+@pytest.fixture
+def numpy_model(tmp_path):
+    pytest.importorskip("statsmodels")
+    save_numpy_model(tmp_path / "model", daily_rainfall(120))
+    predictor = serving_predictor()
+    predictor.load_model(str(tmp_path / "model"))
+    return predictor
+
+def arima_reference(predictor, values, steps):
+    """Forecast of the fitted ARIMA parameters filtered over values"""
+    from statsmodels.tsa.arima.model import ARIMA
+    return ARIMA(values, order=(1, 0, 0)).filter(np.asarray(predictor.arima_results.params)).forecast(steps)
+
+def test_predict_and_predict_batch_agree(numpy_model):
+    rng = np.random.default_rng(5)
+    stations = {
+        "a": daily_rainfall(60),
+        "b": daily_rainfall(45).assign(rainfall=lambda df: rng.gamma(0.5, 8.0, len(df)))
+    }
+    batch = numpy_model.predict_batch(stations, steps=7)
+    for key, data in stations.items():
+        single = numpy_model.predict(data, steps=7)
+        assert single["prediction_dates"] == batch[key]["prediction_dates"]
+        np.testing.assert_allclose(single["predictions"], batch[key]["predictions"])
+        # Both forecast ARIMA from the station's own latest values
+        np.testing.assert_allclose(single["arima_predictions"],
+                                   arima_reference(numpy_model, data["rainfall"].to_numpy(), 7))
+
+def test_arima_batch_process_pool_matches_in_process(numpy_model):
+    rng = np.random.default_rng(6)
+    series = [rng.gamma(0.5, 8.0, n) for n in (30, 45, 60, 75, 90)]
+    in_process = numpy_model.predict_arima_batch(series, steps=4)
+    np.testing.assert_allclose(numpy_model.predict_arima_batch(series, steps=4, max_workers=2), in_process)
+    np.testing.assert_allclose(in_process[2], arima_reference(numpy_model, series[2], 4))
+
+def test_update_arima_forecasts_from_appended_values(numpy_model):
+    values = daily_rainfall(150)["rainfall"].to_numpy()
+    summary = numpy_model.update_arima(values[120:])
+    assert summary["nobs"] == 150
+    np.testing.assert_allclose(numpy_model.predict_arima(5), arima_reference(numpy_model, values, 5))
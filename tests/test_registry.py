@@ -0,0 +1,164 @@
+"""
+Model registry versioning and serving through the rainfall prediction routes
+"""
+
+import asyncio
+import os
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from api.routes import weather
+from data_processing import historical_store
+from data_processing.historical_store import HistoricalWeatherStore
+from models import registry
+from models.registry import LoadedModel, ModelRegistry
+from models.rainfall_prediction import RainfallPredictor
+from test_rainfall_prediction import daily_rainfall, save_numpy_model
+
+def test_latest_version_sorts_numerically(tmp_path):
+    for version in ["v1", "v2", "v9", "v10", "v11"]:
+        os.makedirs(tmp_path / "rainfall_prediction" / version)
+    models = ModelRegistry(str(tmp_path))
+    assert models.available_versions("rainfall_prediction") == ["v1", "v2", "v9", "v10", "v11"]
+    assert models._resolve_version("rainfall_prediction", "latest") == "v11"
+
+class ConstantPredictor:
+    """Stands in for a trained RainfallPredictor"""
+    is_trained = True
+    sequence_length = 5
+    forecast_horizon = 30
+
+    def __init__(self):
+        self.histories = None
+        self.error = None
+
+    def predict_batch(self, stations, steps=30):
+        self.histories = stations
+        if self.error is not None:
+            raise self.error
+        return {key: {"predictions": [4.0] * steps} for key in stations}
+
+@pytest.fixture
+def served_model(app_config, monkeypatch, tmp_path):
+    app_config()
+    store = HistoricalWeatherStore(str(tmp_path / "historical"))
+    today = datetime.now().date()
+    dates = pd.date_range(today - timedelta(days=20), today - timedelta(days=1))
+    store.write(pd.DataFrame({
+        "date": dates, "latitude": 28.61, "longitude": 77.21, "rainfall_mm": np.arange(len(dates), dtype=float)
+    }))
+    monkeypatch.setattr(historical_store, "historical_store", store)
+
+    models = ModelRegistry(str(tmp_path / "models"))
+    predictor = ConstantPredictor()
+    models._models["rainfall_prediction"] = LoadedModel(
+        name="rainfall_prediction", version="v3", path="", model=predictor
+    )
+    monkeypatch.setattr(registry, "model_registry", models)
+
+    async def no_upstream(*args, **kwargs):
+        return None
+    monkeypatch.setattr(weather, "get_enhanced_weather_data", no_upstream)
+    return predictor
+
+def test_predict_rainfall_uses_served_model(served_model):
+    request = weather.RainfallPredictionRequest(
+        location=weather.LocationRequest(latitude=28.6, longitude=77.2), prediction_days=7
+    )
+    response = asyncio.run(weather.predict_rainfall(request))
+
+    assert response.model_version == "v3"
+    # Without an upstream forecast the model's values are served as they are
+    assert [day["predicted_rainfall_mm"] for day in response.predictions] == [4.0] * 7
+    history = next(iter(served_model.histories.values()))
+    assert history["rainfall"].tolist() == list(range(20))
+
+def test_predict_rainfall_without_history_skips_model(served_model):
+    request = weather.RainfallPredictionRequest(
+        location=weather.LocationRequest(latitude=12.97, longitude=77.59), prediction_days=7
+    )
+    response = asyncio.run(weather.predict_rainfall(request))
+    assert response.model_version is None
+    assert all("model_rainfall_mm" not in day for day in response.predictions)
+
+def test_apply_model_forecasts_blends_upstream_predictions():
+    upstream = [[{"predicted_rainfall_mm": 10.0, "data_sources": ["Open-Meteo"]}] * 1]
+    used = weather._apply_model_forecasts(upstream, [np.array([20.0])], weight=0.25)
+    assert used == [True]
+    assert upstream[0][0]["predicted_rainfall_mm"] == 12.5
+    assert upstream[0][0]["model_rainfall_mm"] == 20.0
+
+def test_failed_inference_skips_model(served_model):
+    served_model.error = RuntimeError("inference failed")
+    request = weather.RainfallPredictionRequest(
+        location=weather.LocationRequest(latitude=28.6, longitude=77.2), prediction_days=7
+    )
+    response = asyncio.run(weather.predict_rainfall(request))
+    assert response.model_version is None
+    assert all("model_rainfall_mm" not in day for day in response.predictions)
+
+def test_history_with_missing_days_is_cut_after_the_gap(served_model, tmp_path, monkeypatch):
+    store = HistoricalWeatherStore(str(tmp_path / "gappy"))
+    today = datetime.now().date()
+    dates = pd.date_range(today - timedelta(days=20), today - timedelta(days=1)).delete(9)
+    store.write(pd.DataFrame({
+        "date": dates, "latitude": 28.61, "longitude": 77.21, "rainfall_mm": np.arange(len(dates), dtype=float)
+    }))
+    monkeypatch.setattr(historical_store, "historical_store", store)
+
+    histories = weather._station_rainfall_history([(28.61, 77.21)], 30)
+    history = next(iter(histories.values()))
+    assert len(history) == 10
+    assert (history["date"].diff().dropna() == pd.Timedelta(days=1)).all()
+    assert history["date"].iloc[-1].date() == today - timedelta(days=1)
+
+@pytest.fixture
+def saved_version(app_config, tmp_path):
+    pytest.importorskip("statsmodels")
+    app_config({
+        "models.rainfall_prediction.lstm_params.sequence_length": 10,
+        "models.rainfall_prediction.lstm_params.forecast_horizon": 5
+    })
+    save_numpy_model(tmp_path / "rainfall_prediction" / "v1" / "model", daily_rainfall(120))
+    return str(tmp_path / "rainfall_prediction" / "v1")
+
+def test_loader_rebuilds_arima_before_serving(saved_version):
+    predictor = registry.load_rainfall_predictor(saved_version)
+    assert predictor._arima_results is not None
+    assert predictor.predict_batch({"a": daily_rainfall(30)}, steps=3)["a"] is not None
+
+def test_concurrent_arima_rebuild_happens_once(saved_version):
+    predictor = RainfallPredictor({'lstm_params': {'inference_backend': 'numpy'}})
+    predictor.load_model(os.path.join(saved_version, "model"))
+    results, errors = [], []
+    barrier = threading.Barrier(4)
+
+    def forecast():
+        barrier.wait()
+        try:
+            results.append(predictor.arima_results)
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=forecast) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len({id(result) for result in results}) == 1
+
+def test_trained_predict_batch_skips_short_stations_and_raises_on_errors(saved_version, monkeypatch):
+    predictor = registry.load_rainfall_predictor(saved_version)
+    forecasts = predictor.predict_batch({"short": daily_rainfall(5), "ok": daily_rainfall(30)}, steps=3)
+    assert forecasts["short"] is None
+    assert len(forecasts["ok"]["predictions"]) == 3
+
+    def broken(*args, **kwargs):
+        raise ValueError("bad weights")
+    monkeypatch.setattr(predictor, "predict_lstm_batch", broken)
+    with pytest.raises(ValueError, match="bad weights"):
+        predictor.predict_batch({"ok": daily_rainfall(30)}, steps=3)
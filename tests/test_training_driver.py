@@ -0,0 +1,56 @@
+"""
+Parallel per-district training driver
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("tensorflow")
+pytest.importorskip("statsmodels")
+
+from models.rainfall_prediction import RainfallPredictor  # noqa: E402
+from models.training_driver import COMPLETION_MARKER, THREAD_ENV_VARS, train_districts  # noqa: E402
+
+def district_history(days: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'date': pd.date_range('2020-01-01', periods=days), 'rainfall': rng.gamma(0.5, 8.0, days)})
+
+def test_districts_train_in_spawned_workers_and_resume(app_config, tmp_path):
+    app_config({
+        'models.rainfall_prediction.lstm_params': {
+            'sequence_length': 5, 'forecast_horizon': 2, 'hidden_units': 4, 'epochs': 1,
+            'batch_size': 16, 'inference_backend': 'numpy'
+        },
+        'models.rainfall_prediction.arima_params': {'order': [1, 0, 0], 'seasonal_order': [0, 0, 0, 0]}
+    })
+    csv_path = tmp_path / "south.csv"
+    district_history(60, 2).to_csv(csv_path, index=False)
+    districts = {"north": district_history(60, 1), "south": str(csv_path), "tiny": district_history(6, 3)}
+    output_dir = str(tmp_path / "run")
+    environment = {name: os.environ.get(name) for name in THREAD_ENV_VARS}
+
+    first = train_districts(districts, output_dir, max_workers=2, threads_per_worker=1)
+    assert {name: result["status"] for name, result in first.items()} == {
+        "north": "trained", "south": "trained", "tiny": "failed"
+    }
+    assert "not enough history" in first["tiny"]["error"]
+    assert first["north"]["intra_op_threads"] == 1
+    assert {name: os.environ.get(name) for name in THREAD_ENV_VARS} == environment
+    assert not os.path.exists(os.path.join(output_dir, "tiny"))
+
+    marker = os.path.join(output_dir, "north", COMPLETION_MARKER)
+    written = os.stat(marker).st_mtime_ns
+    second = train_districts(districts, output_dir, max_workers=2, threads_per_worker=1)
+    assert {name: result["status"] for name, result in second.items()} == {
+        "north": "skipped", "south": "skipped", "tiny": "failed"
+    }
+    assert second["north"]["trained_at"] == first["north"]["trained_at"]
+    assert os.stat(marker).st_mtime_ns == written
+
+    predictor = RainfallPredictor({'lstm_params': {'inference_backend': 'numpy'}})
+    predictor.load_model(os.path.join(output_dir, "south", "model"))
+    assert predictor.trained_through == "2020-02-29"
+    assert len(predictor.predict(district_history(20, 4), steps=2)["predictions"]) == 2
@@ -0,0 +1,149 @@
+"""
+Weather data generation and processing
+"""
+
+import numpy as np
+import pandas as pd
+
+from data_processing.weather_data import (
+    RunningMedian, StationIndexCalculators, ValueCounts, WeatherDataCollector, rolling_mean
+)
+
+LOCATIONS = [
+    {'latitude': 28.6139, 'longitude': 77.2090},
+    {'latitude': 12.9716, 'longitude': 77.5946},
+    {'latitude': 19.0760, 'longitude': 72.8777}
+]
+
+def synthetic(stations_per_chunk):
+    collector = WeatherDataCollector({})
+    return pd.concat(collector.iter_synthetic_history(
+        '2020-01-01', '2020-12-31', LOCATIONS, seed=7, stations_per_chunk=stations_per_chunk
+    ), ignore_index=True)
+
+def test_synthetic_history_keeps_exact_coordinates():
+    history = synthetic(2)
+    assert history['latitude'].dtype == np.float64
+    first = history.groupby('station_id', sort=False)[['latitude', 'longitude']].first()
+    assert first.loc[0].tolist() == [28.6139, 77.2090]
+    assert first.loc[1].tolist() == [12.9716, 77.5946]
+    assert history['rainfall_mm'].dtype == np.float32
+
+def test_synthetic_history_does_not_depend_on_chunk_size():
+    pd.testing.assert_frame_equal(synthetic(1), synthetic(100))
+
+def random_series(rng, n, nan_share=0.2):
+    values = rng.gamma(0.7, 10.0, n).round(1)
+    values[rng.random(n) < nan_share] = np.nan
+    return values
+
+def test_value_counts_median_and_quantiles_match_pandas_across_chunks():
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        values = random_series(rng, int(rng.integers(1, 400)))
+        counts = ValueCounts(np.float64)
+        for chunk in np.array_split(values, int(rng.integers(1, 6))):
+            counts.add(chunk)
+        series = pd.Series(values)
+        if series.notna().any():
+            assert counts.median() == series.median()
+            for q in (0.25, 0.75):
+                assert counts.quantile(q) == series.quantile(q)
+
+def test_running_median_matches_pandas_after_every_chunk():
+    rng = np.random.default_rng(4)
+    median = RunningMedian()
+    seen = []
+    for size in rng.integers(1, 50, 30):
+        chunk = random_series(rng, int(size))
+        median.add(chunk)
+        seen.extend(chunk)
+        assert median.median() == pd.Series(seen).median() or (
+            np.isnan(median.median()) and pd.Series(seen).isna().all()
+        )
+
+def test_rolling_mean_with_history_matches_whole_series():
+    rng = np.random.default_rng(5)
+    values = random_series(rng, 200)
+    whole = rolling_mean(values, 7)
+    np.testing.assert_array_equal(rolling_mean(values[120:], 7, history=values[:120]), whole[120:])
+    expected = pd.Series(values).rolling(7, min_periods=1).mean().to_numpy()
+    np.testing.assert_allclose(whole, expected, rtol=1e-12)
+
+def test_streaming_processing_matches_full_frame():
+    rng = np.random.default_rng(6)
+    n = 500
+    raw = pd.DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n),
+        'temperature_celsius': rng.normal(28, 4, n),
+        'rainfall_mm': random_series(rng, n),
+        'humidity_percent': rng.normal(70, 10, n)
+    })
+    raw.loc[rng.random(n) < 0.1, 'temperature_celsius'] = np.nan
+    raw.loc[:4, 'humidity_percent'] = np.nan  # leading gap
+    raw.loc[n - 3:, 'rainfall_mm'] = np.nan  # trailing gap
+    raw.loc[[10, 11], 'temperature_celsius'] = [80.0, -30.0]  # outliers
+
+    collector = WeatherDataCollector({})
+    expected = collector.process_weather_data(raw)
+    bounds = [0, 37, 120, 121, 300, n]
+    chunks = lambda: (raw.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:]))
+    streamed = pd.concat(collector.process_weather_data_stream(chunks))
+    pd.testing.assert_frame_equal(streamed, expected)
+
+def test_value_counts_with_decimals_stay_bounded_on_continuous_values():
+    rng = np.random.default_rng(8)
+    exact, rounded = ValueCounts(np.float64), ValueCounts(np.float64, decimals=1)
+    chunks = [rng.uniform(0, 50, 10_000) for _ in range(10)]
+    for chunk in chunks:
+        exact.add(chunk)
+        rounded.add(chunk)
+    values = pd.Series(np.concatenate(chunks))
+    assert len(exact.values) == len(values)
+    assert len(rounded.values) <= 501
+    assert rounded.n == len(values)
+    assert abs(rounded.median() - values.median()) <= 0.05
+    assert abs(rounded.quantile(0.75) - values.quantile(0.75)) <= 0.05
+
+def test_streaming_processing_with_decimals_stays_close_to_full_frame():
+    rng = np.random.default_rng(9)
+    n = 400
+    raw = pd.DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n),
+        'temperature_celsius': rng.normal(28, 4, n),
+        'rainfall_mm': rng.gamma(0.7, 10.0, n)
+    })
+    raw.loc[rng.random(n) < 0.1, ['temperature_celsius', 'rainfall_mm']] = np.nan
+
+    collector = WeatherDataCollector({})
+    expected = collector.process_weather_data(raw)
+    chunks = lambda: (raw.iloc[start:start + 90] for start in range(0, n, 90))
+    streamed = pd.concat(collector.process_weather_data_stream(chunks, decimals=2))
+    numeric = expected.select_dtypes(include=[np.number]).columns
+    # Medians move by at most half a unit of the last decimal; IQR clip bounds
+    # (q1 - 1.5 * IQR, q3 + 1.5 * IQR) by at most four times that
+    np.testing.assert_allclose(streamed[numeric], expected[numeric], atol=0.02)
+
+INDEX_COLUMNS = ['rainfall_30d', 'drought_index', 'drought_category', 'heat_stress_index',
+                 'heat_stress_category', 'growing_degree_days', 'gdd_cumulative', 'rainfall_intensity']
+
+def test_appending_days_per_station_matches_full_recompute():
+    collector = WeatherDataCollector({})
+    history = synthetic(3).sort_values(['date', 'station_id'], kind='stable', ignore_index=True)
+    history.loc[history.sample(frac=0.1, random_state=0).index, 'rainfall_mm'] = np.nan
+    dates = history['date'].drop_duplicates().to_numpy()
+
+    calculators = StationIndexCalculators()
+    collector.calculate_weather_indices(history[history['date'] < dates[300]], 'station_id', calculators=calculators)
+    assert len(calculators) == 3
+
+    # Daily ingest (one day of every station per call), then a multi-day catch-up
+    chunks = [(day, day) for day in dates[300:330]] + [(dates[330], dates[-1])]
+    for first, last in chunks:
+        new_days = history[(history['date'] >= first) & (history['date'] <= last)]
+        appended = collector.calculate_weather_indices(new_days, 'station_id', calculators=calculators)
+
+        # Equal to the new rows of a full recompute over the history so far
+        full = collector.calculate_weather_indices(history[history['date'] <= last], 'station_id', max_workers=1)
+        pd.testing.assert_frame_equal(appended[INDEX_COLUMNS], full.loc[new_days.index, INDEX_COLUMNS])
+    assert calculators[0].days == len(dates)
@@ -0,0 +1,144 @@
+"""
+Upstream weather sources against a local stub server
+"""
+
+import asyncio
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+from aiohttp import web
+
+from api.routes import weather
+from utils import cache, circuit_breaker
+from utils.http_client import close_http_session
+
+def open_meteo_payload(days: int = 3):
+    start = date.today()
+    return {
+        "daily": {
+            "time": [(start + timedelta(days=i)).isoformat() for i in range(days)],
+            "precipitation_sum": [5.0] * days,
+            "temperature_2m_max": [31.0] * days,
+            "temperature_2m_min": [24.0] * days
+        }
+    }
+
+NASA_PAYLOAD = {
+    "properties": {
+        "parameter": {
+            "PRECTOTCORR": {"20240701": 3.5, "20240702": -999.0, "20240703": 0.0},
+            "T2M_MAX": {"20240701": -999.0, "20240702": 30.0, "20240703": 32.0},
+            "T2M_MIN": {"20240701": 22.0, "20240702": 21.0, "20240703": -999.0},
+            "RH2M": {"20240701": 80.0, "20240702": 81.0, "20240703": -999.0}
+        }
+    }
+}
+
+class UpstreamStub:
+    """Open-Meteo (single and multi-coordinate) and NASA POWER stand-ins that count requests"""
+
+    def __init__(self):
+        self.requests = Counter()
+
+    async def open_meteo(self, request):
+        self.requests["open_meteo"] += 1
+        locations = len(request.query["latitude"].split(","))
+        if locations == 1:
+            return web.json_response(open_meteo_payload())
+        return web.json_response([open_meteo_payload() for _ in range(locations)])
+
+    async def nasa_power(self, request):
+        self.requests["nasa_power"] += 1
+        return web.json_response(NASA_PAYLOAD)
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/v1/forecast", self.open_meteo)
+        app.router.add_get("/power", self.nasa_power)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{self.runner.addresses[0][1]}"
+
+    async def stop(self):
+        await close_http_session()
+        await self.runner.cleanup()
+
+@pytest.fixture
+def upstream(app_config, monkeypatch):
+    """Run a scenario against the stub: upstream(scenario, overrides) with scenario(stub)"""
+    for name in ("forecast_cache", "forecast_flight", "forecast_refresher"):
+        monkeypatch.setattr(cache, name, None)
+    monkeypatch.setattr(circuit_breaker, "circuit_breakers", {})
+
+    def run(scenario, overrides=None):
+        async def main():
+            stub = UpstreamStub()
+            url = await stub.start()
+            app_config({
+                "weather_sources.open_meteo.base_url": f"{url}/v1/forecast",
+                "weather_sources.open_meteo.hedge": False,
+                "weather_sources.nasa_power.base_url": f"{url}/power",
+                **(overrides or {})
+            })
+            try:
+                return await scenario(stub)
+            finally:
+                await stub.stop()
+        return asyncio.run(main())
+
+    return run
+
+def test_nasa_power_drops_missing_values_of_every_parameter(upstream):
+    async def scenario(stub):
+        return await weather.get_nasa_power_data(28.6, 77.2)
+
+    trend = upstream(scenario)["historical_trend"]
+    assert [day["date"] for day in trend] == ["2024-07-01", "2024-07-03"]
+    assert trend[0]["temperature_max"] is None and trend[0]["temperature_min"] == 22.0
+    assert trend[1]["temperature_min"] is None and trend[1]["humidity"] is None
+    readings = [day[key] for day in trend for key in ("rainfall_mm", "temperature_max", "temperature_min", "humidity")]
+    assert all(value is None or value > -999 for value in readings)
+
+def test_nasa_power_is_not_fetched_or_fused_by_default(upstream):
+    async def scenario(stub):
+        data = await weather.fetch_enhanced_weather_data(28.6, 77.2)
+        return stub.requests, data
+
+    requests, data = upstream(scenario)
+    assert requests["nasa_power"] == 0
+    assert "NASA_POWER" not in data["data_sources"]
+    assert "NASA_POWER" not in data["missing_sources"]
+    # Open-Meteo and the IMD simulation
+    assert data["accuracy_score"] == pytest.approx(0.7 + 2 * 0.08)
+
+@pytest.mark.parametrize("nasa_enabled", [False, True])
+def test_batch_makes_one_upstream_request_per_chunk(upstream, nasa_enabled):
+    locations = [(20.0 + i, 75.0 + i) for i in range(40)] + [(20.01, 75.01)]
+
+    async def scenario(stub):
+        data = await weather.get_enhanced_weather_data_batch(locations)
+        requests = dict(stub.requests)
+        # Served from the cache on the second pass
+        await weather.get_enhanced_weather_data_batch(locations)
+        return requests, dict(stub.requests), data
+
+    first, second, data = upstream(scenario, {
+        "weather_sources.open_meteo.batch_size": 25,
+        "weather_sources.nasa_power.enabled": nasa_enabled
+    })
+    # 40 distinct cells in chunks of 25, and no per-cell secondary requests
+    assert first == {"open_meteo": 2}
+    assert second == first
+    assert len(data) == len(locations)
+    assert all(forecast["data_sources"] == ["Open-Meteo", "IMD"] for forecast in data)
+    assert all(not forecast["partial"] for forecast in data)
+
+def test_single_location_fetches_enabled_remote_sources(upstream):
+    async def scenario(stub):
+        await weather.fetch_enhanced_weather_data(28.6, 77.2)
+        return dict(stub.requests)
+
+    assert upstream(scenario, {"weather_sources.nasa_power.enabled": True}) == {"open_meteo": 1, "nasa_power": 1}